@@ -1,6 +1,7 @@
 import click
 import sys
 import os
+from itertools import product
 
 # Determine the absolute path of the parent directory
 current_dir = os.path.dirname(__file__)
@@ -9,8 +10,8 @@ parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
 # Add the parent directory to PYTHONPATH
 sys.path.insert(0, parent_dir)
 
-from controllers.epic_controller import EpicBase
-from controllers.epic_dashboard import EpicDashboard
+# Les contrôleurs (SQLAlchemy, Sentry, terminaux) sont importés dans le corps des commandes :
+# l'aide et la déconnexion restent ainsi rapides.
 
 
 @click.group()
@@ -20,9 +21,13 @@ def epic_cli():
 
 
 @click.command()
-def start(**kwargs):
+@click.option('--timings', is_flag=True, help="Affiche le détail du temps de démarrage.")
+def start(timings=False, **kwargs):
     """ Login to the database and start the dashboard """
-    app = EpicBase()
+    from controllers.epic_controller import EpicBase
+    from controllers.epic_dashboard import EpicDashboard
+
+    app = EpicBase(timings=timings)
     app.login(**kwargs)
     controller = EpicDashboard(epic_base=app)
     controller.run()
@@ -31,12 +36,131 @@ def start(**kwargs):
 @click.command()
 def logout():
     """ Logout from database """
-    app = EpicBase()
-    app.check_logout()
-    app.epic.database_disconnect()
+    from controllers.session_store import get_session_store
+    from views.authentication_view import AuthenticationView
+
+    # La déconnexion supprime seulement la session : aucune connexion à la base n'est ouverte
+    try:
+        get_session_store().clear()
+    except OSError:
+        pass
+    AuthenticationView.display_logout()
 
 
 @click.command()
 def initbase():
     """ Initialize the database """
+    from controllers.epic_controller import EpicBase
+
     EpicBase.initbase()
+
+
+@click.command()
+@click.option('--time-cost', 'time_costs', type=int, multiple=True, help="Nombre d'itérations (répétable).")
+@click.option('--memory-cost', 'memory_costs', type=int, multiple=True, help="Mémoire en KiB (répétable).")
+@click.option('--parallelism', 'parallelisms', type=int, multiple=True, help="Nombre de fils (répétable).")
+@click.option('--rounds', type=int, default=5, show_default=True, help="Mesures par jeu de paramètres.")
+def benchhash(time_costs, memory_costs, parallelisms, rounds):
+    """ Benchmark Argon2 parameters on this machine """
+    from controllers.config import PasswordPolicy
+    from controllers.security import benchmark_password_hashing
+    from views.authentication_view import AuthenticationView
+
+    policy = PasswordPolicy()
+    candidates = [
+        dict(policy.to_dict(), time_cost=t, memory_cost=m, parallelism=p)
+        for t, m, p in product(time_costs or [policy.time_cost],
+                               memory_costs or [policy.memory_cost],
+                               parallelisms or [policy.parallelism])
+    ]
+    AuthenticationView.display_hash_benchmark(benchmark_password_hashing(candidates, rounds))
+
+
+@click.command()
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--workers', type=int, default=None, help="Nombre de processus de hachage (par défaut : nombre de cœurs).")
+def provision(path, workers):
+    """ Create users in bulk from a CSV or JSONL file """
+    from controllers.epic_controller import EpicBase
+    from controllers.provisioning_controller import ProvisioningBase
+    from views.user_view import UserView
+
+    app = EpicBase()
+    report = ProvisioningBase(app.session).provision_users(app.session, path, workers)
+    UserView.display_provisioning_report(report)
+    app.epic.database_disconnect()
+
+
+@click.command()
+@click.argument('entity', type=click.Choice(['customers', 'contracts', 'events']))
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--errors', 'errors_path', type=click.Path(dir_okay=False),
+              help="Fichier des lignes rejetées (par défaut : <fichier>.errors.csv).")
+@click.option('--chunk-size', type=int, default=5000, show_default=True, help="Lignes par transaction.")
+def bulkimport(entity, path, errors_path, chunk_size):
+    """ Import customers, contracts or events in bulk from a CSV file """
+    from controllers.epic_controller import EpicBase
+    from controllers.import_controller import ImportBase
+    from views.data_view import DataView
+
+    app = EpicBase()
+    importer = ImportBase(app.session)
+    operation = getattr(importer, f'import_{entity}')
+    report = operation(app.session(), path, errors_path, chunk_size)
+    DataView.display_import_report(entity, report)
+    app.epic.database_disconnect()
+
+
+@click.command(context_settings={'ignore_unknown_options': True})
+@click.argument('command_args', nargs=-1, type=click.UNPROCESSED)
+@click.option('--top', type=int, default=20, show_default=True, help="Nombre de modules affichés.")
+def importtime(command_args, top):
+    """ Report the cold-start import time of a command (default: --help) """
+    from controllers.timing import measure_import_time
+    from views.authentication_view import AuthenticationView
+
+    command_args = list(command_args) or ['--help']
+    wall, modules = measure_import_time(os.path.join(parent_dir, 'main.py'), command_args)
+    AuthenticationView.display_import_report(' '.join(command_args), wall, modules[:top])
+
+
+@click.command()
+@click.argument('text')
+@click.option('--limit', type=int, default=20, show_default=True, help="Nombre maximal de résultats.")
+@click.option('--mine', is_flag=True, help="Seulement mes clients, contrats ou évènements.")
+def search(text, limit, mine):
+    """ Search customers, contracts and events """
+    from controllers.epic_controller import EpicBase
+
+    app = EpicBase()
+    app.epic.search.search(app.session, text, limit, mine)
+    app.epic.database_disconnect()
+
+
+@click.command()
+@click.argument('name', type=click.Choice(['commercial', 'customer', 'month']))
+@click.option('--mine', is_flag=True, help="Seulement mes contrats.")
+@click.option('--format', 'output_format', type=click.Choice(['table', 'csv', 'jsonl']),
+              default='table', show_default=True, help="Format de sortie.")
+def report(name, mine, output_format):
+    """ Revenue, collected and outstanding amounts per commercial, customer or month """
+    from views.console_view import console
+
+    if output_format != 'table':
+        # La sortie standard est réservée aux données
+        console.stderr = True
+
+    from controllers.epic_controller import EpicBase
+    from controllers.reporting import ReportBase
+    from models.read_models import ReportRow
+    from views.report_view import ReportView
+    from views.script_view import ScriptView
+
+    app = EpicBase()
+    rows = ReportBase(app.session).report(app.session(), name, mine)
+    if rows is not None:
+        if output_format == 'table':
+            ReportView.display_report(name, rows)
+        else:
+            ScriptView.write_rows(rows, ReportRow._fields, output_format)
+    app.epic.database_disconnect()
@@ -0,0 +1,350 @@
+import click
+import sys
+import os
+
+# Determine the absolute path of the parent directory
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
+
+# Add the parent directory to PYTHONPATH
+sys.path.insert(0, parent_dir)
+
+# Commandes non interactives (scripts, tâches planifiées) : les données sont écrites sur stdout
+# en JSON Lines ou en CSV, les messages sur stderr. Comme dans epic_cli, les contrôleurs sont
+# importés dans le corps des commandes.
+
+DATE = click.DateTime(formats=['%Y-%m-%d', '%Y-%m-%d %H:%M'])
+
+format_option = click.option('--format', 'output_format', type=click.Choice(['jsonl', 'csv']),
+                             default='jsonl', show_default=True, help="Format de sortie.")
+mine_option = click.option('--mine', is_flag=True, help="Seulement mes éléments.")
+unassigned_option = click.option('--unassigned', is_flag=True,
+                                 help="Seulement les éléments sans commercial, gestionnaire ou support.")
+
+
+def run_script(name, operation, output_format='jsonl', fields=None):
+    """
+    Exécute une opération de ScriptBase et écrit ses lignes sur la sortie standard.
+
+    Paramètres :
+    ------------
+    name : str
+        L'entité : 'customers', 'contracts', 'events' ou 'users'.
+    operation : callable
+        Appelée avec (ScriptBase, session) ; retourne une ligne ou un itérable de lignes.
+    output_format : str
+        'jsonl' ou 'csv'.
+    fields : tuple
+        Les noms des colonnes, si les lignes ne sont pas celles de l'entité.
+    """
+    from views.console_view import console
+
+    # La sortie standard est réservée aux données
+    console.stderr = True
+
+    from controllers.epic_controller import EpicBase
+    from controllers.script_controller import ScriptBase, record_fields
+    from controllers.unit_of_work import UnitOfWorkFailed, unit_of_work
+    from views.script_view import ScriptView
+
+    app = EpicBase()
+    session = app.session()
+    try:
+        # Une commande = une transaction, validée une seule fois
+        with unit_of_work(session):
+            result = operation(ScriptBase(session), session)
+        rows = [result] if isinstance(result, tuple) else result
+        ScriptView.write_rows(rows, fields or record_fields(name), output_format)
+    except (PermissionError, ValueError, UnitOfWorkFailed) as e:
+        raise click.ClickException(str(e))
+    finally:
+        app.epic.database_disconnect()
+
+
+def values(**options):
+    """
+    Retourne les options renseignées (valeurs différentes de None).
+    """
+    return {key: value for key, value in options.items() if value is not None}
+
+
+@click.group()
+def customer():
+    """ Scripting commands on customers (JSON Lines or CSV output) """
+    pass
+
+
+@customer.command('list')
+@click.option('--commercial', help="Nom d'utilisateur du commercial.")
+@click.option('--company', help="Texte contenu dans le nom de l'entreprise.")
+@mine_option
+@unassigned_option
+@format_option
+def customer_list(commercial, company, mine, unassigned, output_format):
+    """ List customers """
+    filters = {'commercial': commercial, 'company': company}
+    run_script('customers', lambda script, session:
+               script.list_records(session, 'customers', filters, mine, unassigned),
+               output_format)
+
+
+@customer.command('show')
+@click.argument('customer_id', type=int)
+@format_option
+def customer_show(customer_id, output_format):
+    """ Show a customer """
+    run_script('customers', lambda script, session:
+               script.show(session, 'customers', customer_id),
+               output_format)
+
+
+@customer.command('create')
+@click.option('--first-name', required=True)
+@click.option('--last-name', required=True)
+@click.option('--email', required=True)
+@click.option('--phone', required=True)
+@click.option('--company-name', required=True)
+@click.option('--commercial', help="Nom d'utilisateur du commercial (par défaut : moi si je suis commercial).")
+@format_option
+def customer_create(output_format, **options):
+    """ Create a customer """
+    run_script('customers', lambda script, session:
+               script.create_customer(session, values(**options)),
+               output_format)
+
+
+@customer.command('update')
+@click.argument('customer_id', type=int)
+@click.option('--first-name')
+@click.option('--last-name')
+@click.option('--email')
+@click.option('--phone')
+@click.option('--company-name')
+@format_option
+def customer_update(customer_id, output_format, **options):
+    """ Update a customer """
+    run_script('customers', lambda script, session:
+               script.update_customer(session, customer_id, values(**options)),
+               output_format)
+
+
+@click.group()
+def contract():
+    """ Scripting commands on contracts (JSON Lines or CSV output) """
+    pass
+
+
+@contract.command('list')
+@click.option('--state', type=click.Choice(['C', 'S']), help="Etat : C (créé) ou S (signé).")
+@click.option('--paiement', type=click.Choice(['P', 'N']), help="Paiement : P (soldé) ou N (non soldé).")
+@click.option('--customer', type=int, help="Identifiant du client.")
+@click.option('--gestion', help="Nom d'utilisateur du gestionnaire.")
+@mine_option
+@unassigned_option
+@format_option
+def contract_list(state, paiement, customer, gestion, mine, unassigned, output_format):
+    """ List contracts """
+    filters = {'state': state, 'paiement': paiement, 'customer': customer, 'gestion': gestion}
+    run_script('contracts', lambda script, session:
+               script.list_records(session, 'contracts', filters, mine, unassigned),
+               output_format)
+
+
+@contract.command('show')
+@click.argument('contract_id', type=int)
+@format_option
+def contract_show(contract_id, output_format):
+    """ Show a contract """
+    run_script('contracts', lambda script, session:
+               script.show(session, 'contracts', contract_id),
+               output_format)
+
+
+@contract.command('create')
+@click.option('--customer-id', type=int, required=True)
+@click.option('--description', required=True)
+@click.option('--total-amount', type=float, required=True)
+@format_option
+def contract_create(output_format, **options):
+    """ Create a contract """
+    run_script('contracts', lambda script, session:
+               script.create_contract(session, values(**options)),
+               output_format)
+
+
+@contract.command('update')
+@click.argument('contract_id', type=int)
+@click.option('--description')
+@click.option('--total-amount', type=float)
+@click.option('--state', type=click.Choice(['C', 'S']))
+@format_option
+def contract_update(contract_id, output_format, **options):
+    """ Update a contract """
+    run_script('contracts', lambda script, session:
+               script.update_contract(session, contract_id, values(**options)),
+               output_format)
+
+
+@click.group()
+def event():
+    """ Scripting commands on events (JSON Lines or CSV output) """
+    pass
+
+
+@event.command('list')
+@click.option('--customer', type=int, help="Identifiant du client.")
+@click.option('--contract', type=int, help="Identifiant du contrat.")
+@click.option('--support', help="Nom d'utilisateur du support.")
+@click.option('--after', type=DATE, help="Débutant à partir de cette date.")
+@click.option('--before', type=DATE, help="Débutant avant cette date.")
+@mine_option
+@unassigned_option
+@format_option
+def event_list(customer, contract, support, after, before, mine, unassigned, output_format):
+    """ List events """
+    filters = {'customer': customer, 'contract': contract, 'support': support, 'after': after, 'before': before}
+    run_script('events', lambda script, session:
+               script.list_records(session, 'events', filters, mine, unassigned),
+               output_format)
+
+
+@event.command('show')
+@click.argument('event_id', type=int)
+@format_option
+def event_show(event_id, output_format):
+    """ Show an event """
+    run_script('events', lambda script, session:
+               script.show(session, 'events', event_id),
+               output_format)
+
+
+@event.command('create')
+@click.option('--contract-id', type=int, required=True)
+@click.option('--title', required=True)
+@click.option('--description')
+@click.option('--location')
+@click.option('--attendees', type=int, default=0, show_default=True)
+@click.option('--date-started', type=DATE, required=True)
+@click.option('--date-ended', type=DATE, required=True)
+@format_option
+def event_create(output_format, **options):
+    """ Create an event """
+    run_script('events', lambda script, session:
+               script.create_event(session, values(**options)),
+               output_format)
+
+
+@event.command('update')
+@click.argument('event_id', type=int)
+@click.option('--title')
+@click.option('--description')
+@click.option('--location')
+@click.option('--attendees', type=int)
+@click.option('--date-started', type=DATE)
+@click.option('--date-ended', type=DATE)
+@click.option('--report')
+@format_option
+def event_update(event_id, output_format, **options):
+    """ Update an event """
+    run_script('events', lambda script, session:
+               script.update_event(session, event_id, values(**options)),
+               output_format)
+
+
+@click.group()
+def user():
+    """ Scripting commands on users (JSON Lines or CSV output) """
+    pass
+
+
+@user.command('list')
+@click.option('--role', type=click.Choice(['COM', 'GES', 'SUP', 'ADM']))
+@click.option('--state', type=click.Choice(['A', 'I']), help="Etat : A (actif) ou I (inactif).")
+@format_option
+def user_list(role, state, output_format):
+    """ List users """
+    run_script('users', lambda script, session:
+               script.list_records(session, 'users', {'role': role, 'state': state}),
+               output_format)
+
+
+@user.command('show')
+@click.argument('epicuser_id', type=int)
+@format_option
+def user_show(epicuser_id, output_format):
+    """ Show a user """
+    run_script('users', lambda script, session:
+               script.show(session, 'users', epicuser_id),
+               output_format)
+
+
+@user.command('create')
+@click.option('--first-name', required=True)
+@click.option('--last-name', required=True)
+@click.option('--role', type=click.Choice(['COM', 'GES', 'SUP', 'ADM']), required=True)
+@click.option('--password', prompt=True, hide_input=True, help="Demandé s'il n'est pas fourni.")
+@format_option
+def user_create(output_format, **options):
+    """ Create a user """
+    run_script('users', lambda script, session:
+               script.create_user(session, values(**options)),
+               output_format)
+
+
+@user.command('update')
+@click.argument('username')
+@click.option('--first-name')
+@click.option('--last-name')
+@click.option('--password')
+@format_option
+def user_update(username, output_format, **options):
+    """ Update a user's name or password """
+    run_script('users', lambda script, session:
+               script.update_user(session, username, values(**options)),
+               output_format)
+
+
+@user.command('reassign')
+@click.argument('username')
+@click.option('--to', 'target', help="Collègue qui reçoit tout le portefeuille (par défaut : répartition selon la charge).")
+@click.option('--dry-run', is_flag=True, help="Afficher la répartition sans l'appliquer.")
+@format_option
+def user_reassign(username, target, dry_run, output_format):
+    """ Reassign a user's customers, contracts or events to active colleagues """
+    from models.read_models import PortfolioShare
+
+    run_script('users', lambda script, session:
+               script.reassign_user(session, username, target, dry_run),
+               output_format, PortfolioShare._fields)
+
+
+@click.command()
+@click.argument('name', type=click.Choice(['customers', 'contracts', 'events', 'users',
+                                           'paiements', 'contract_paiements']))
+@click.option('--output', '-o', 'path', type=click.Path(dir_okay=False),
+              help="Fichier de sortie (par défaut : la sortie standard ; gzip si le nom se termine par .gz).")
+@click.option('--format', 'output_format', type=click.Choice(['csv', 'jsonl']),
+              default='csv', show_default=True, help="Format de sortie.")
+@click.option('--gzip', 'compress', is_flag=True, help="Compresser la sortie en gzip.")
+@mine_option
+def export(name, path, output_format, compress, mine):
+    """ Stream an entity or a join (contract_paiements) to CSV or JSON Lines """
+    from views.console_view import console
+
+    # La sortie standard est réservée aux données
+    console.stderr = True
+
+    from controllers.epic_controller import EpicBase
+    from controllers.export_controller import ExportBase
+    from views.script_view import ScriptView
+
+    app = EpicBase()
+    try:
+        with ScriptView.export_progress(name) as progress:
+            report = ExportBase(app.session).export(app.session(), name, path, output_format, compress, mine,
+                                                    progress)
+        ScriptView.display_export_report(name, report)
+    except (PermissionError, ValueError) as e:
+        raise click.ClickException(str(e))
+    finally:
+        app.epic.database_disconnect()
@@ -1,4 +1,3 @@
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 import os
@@ -20,7 +19,29 @@ SECRET_KEY = os.getenv('SECRET_KEY', 'default_secret_key')
 TOKEN_DELTA = os.getenv('TOKEN_DELTA', '3600')
 ALGORITHM = "HS256"
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
 Base = declarative_base()
+
+# Fabrique de sessions créée à la première utilisation, et non à l'import
+_session_local = None
+
+
+def get_engine():
+    # Moteur partagé du registre (controllers.engine), configuré par database.ini
+    from controllers.engine import get_engine as get_shared_engine
+    return get_shared_engine()
+
+
+def get_session_local():
+    global _session_local
+    if _session_local is None:
+        _session_local = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+    return _session_local
+
+
+def __getattr__(name):
+    # Compatibilité : config_init.engine et config_init.SessionLocal restent disponibles
+    if name == 'engine':
+        return get_engine()
+    if name == 'SessionLocal':
+        return get_session_local()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
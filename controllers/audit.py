@@ -0,0 +1,345 @@
+# Import généraux
+import atexit
+import os
+import queue
+import sys
+import threading
+from datetime import datetime
+from functools import wraps
+from itertools import chain
+from sentry_sdk import capture_exception
+from sqlalchemy import event, insert, inspect, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, scoped_session
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
+
+# Déterminez le chemin absolu du répertoire parent
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
+
+# Ajoutez le répertoire parent au PYTHONPATH
+sys.path.insert(0, parent_dir)
+
+# Import des Controllers
+from controllers.unit_of_work import current_session
+
+# Import des Modèles
+from models.entities import AuditLog, Contract, Customer, EpicUser, Event, Paiement
+
+# Nombre maximal d'entrées écrites par INSERT
+AUDIT_BATCH_SIZE = 500
+# Attente maximale (secondes) de l'écriture des entrées restantes à l'arrêt du processus
+AUDIT_DRAIN_TIMEOUT = 5
+
+# Clés de `Session.info` : employé authentifié, action en cours (action, id et nom de l'employé)
+# et entrées en attente
+AUDIT_ACTOR = 'audit_actor'
+AUDIT_ACTION = 'audit_action'
+AUDIT_PENDING = 'audit_pending'
+
+# Entités auditées, et colonnes dont la valeur n'est jamais journalisée
+AUDITED = (Contract, Customer, EpicUser, Event, Paiement)
+MASKED = {'password'}
+
+
+def audit_value(value):
+    """
+    Convertit une valeur de colonne en valeur JSON (choix, dates et décimaux en texte).
+    """
+    value = getattr(value, 'code', value)
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+
+def changes_of(instance, created=False, deleted=False) -> dict:
+    """
+    Retourne les modifications d'une entité écrite par un flush : {colonne: [avant, après]}.
+
+    Seules les valeurs déjà chargées sont lues : le calcul ne fait aucune requête.
+    """
+    state = inspect(instance)
+    changes = {}
+    for attr in state.mapper.column_attrs:
+        key = attr.key
+        if created or deleted:
+            value = state.dict.get(key)
+            if value is None:
+                continue
+            before, after = (None, value) if created else (value, None)
+        else:
+            history = state.attrs[key].history
+            if not history.has_changes():
+                continue
+            before = history.deleted[0] if history.deleted else None
+            after = history.added[0] if history.added else None
+        changes[key] = ['***', '***'] if key in MASKED else [audit_value(before), audit_value(after)]
+    return changes
+
+
+class AuditWriter:
+    """
+    Écrivain du journal d'audit en arrière-plan.
+
+    Les entrées des transactions validées sont mises en file d'attente ; un fil d'exécution
+    dédié les insère par lots (un INSERT multi-lignes par lot et par base), sur sa propre
+    connexion. L'action de l'utilisateur n'attend donc jamais l'écriture du journal. Une
+    erreur d'écriture est signalée à Sentry sans interrompre l'application.
+
+    Une base SQLite en mémoire n'a qu'une connexion (StaticPool ou SingletonThreadPool) : le fil
+    d'écriture la partagerait avec la transaction en cours de l'application, ou verrait une autre
+    base vide. Ses entrées sont donc écrites immédiatement, dans le fil de l'application.
+    """
+
+    def __init__(self, batch_size=AUDIT_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.thread = None
+        self.written = 0
+        self.failed = 0
+
+    def submit(self, engine, records):
+        """
+        Met en file d'attente les entrées d'une transaction validée (sans attendre leur écriture).
+
+        Paramètres :
+        ------------
+        engine : Engine
+            Le moteur de la base où les entrées sont écrites.
+        records : list
+            Les entrées (dictionnaires des colonnes de AuditLog).
+        """
+        if isinstance(engine.pool, (StaticPool, SingletonThreadPool)):
+            self.write([(engine, record) for record in records])
+            return
+        for record in records:
+            self.queue.put((engine, record))
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name='audit-writer', daemon=True)
+                self.thread.start()
+
+    def drain(self, timeout=None) -> bool:
+        """
+        Attend l'écriture des entrées en file d'attente.
+
+        Paramètres :
+        ------------
+        timeout : float
+            L'attente maximale en secondes, ou None pour attendre sans limite.
+
+        Retourne :
+        ----------
+        bool : True si toutes les entrées ont été traitées.
+        """
+        with self.queue.all_tasks_done:
+            return self.queue.all_tasks_done.wait_for(lambda: not self.queue.unfinished_tasks, timeout)
+
+    def run(self):
+        """
+        Boucle du fil d'écriture : attend une entrée, puis écrit tout ce qui est en attente.
+        """
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self.write(batch)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    def write(self, batch):
+        """
+        Insère un lot d'entrées, une transaction par base.
+        """
+        by_engine = {}
+        for engine, record in batch:
+            by_engine.setdefault(engine, []).append(record)
+        for engine, records in by_engine.items():
+            try:
+                with engine.begin() as connection:
+                    connection.execute(insert(AuditLog.__table__), records)
+                self.written += len(records)
+            except SQLAlchemyError as e:
+                self.failed += len(records)
+                capture_exception(e)
+
+
+# Écrivain partagé par les sessions du processus
+writer = AuditWriter()
+# Les entrées en attente sont écrites avant la fin d'une commande
+atexit.register(writer.drain, AUDIT_DRAIN_TIMEOUT)
+
+
+def set_actor(session, user):
+    """
+    Mémorise l'employé authentifié sur la session (voir le décorateur `is_authenticated`).
+    """
+    if isinstance(session, (Session, scoped_session)) and isinstance(user, EpicUser):
+        current_session(session).info[AUDIT_ACTOR] = (user.epicuser_id, user.username)
+
+
+def actor_of(session, args, previous):
+    """
+    Retourne l'employé à l'origine d'une action : (identifiant, nom d'utilisateur).
+
+    L'employé est l'utilisateur authentifié du contrôleur, sinon celui de l'action englobante,
+    sinon le dernier employé authentifié sur la session ; (None, None) si aucun n'est connu.
+    """
+    user = getattr(args[0], 'current_user', None) if args else None
+    if isinstance(user, EpicUser):
+        return user.epicuser_id, user.username
+    if previous is not None:
+        return previous[1:]
+    return session.info.get(AUDIT_ACTOR, (None, None))
+
+
+def audited(action):
+    """
+    Décorateur journalisant les écritures d'une méthode de contrôleur.
+
+    Pendant l'appel, chaque entité créée, modifiée ou supprimée par un flush de la session
+    (et chaque UPDATE ou DELETE ensembliste) produit une entrée du journal : employé, action,
+    entité, modifications et date. Les entrées sont transmises à l'écrivain en arrière-plan
+    à la validation de la transaction, et abandonnées si elle est annulée.
+
+    Paramètres :
+    ------------
+    action : str
+        Le nom de l'action métier (par exemple 'contract.sign').
+
+    Retourne :
+    ----------
+    fonction
+        Le décorateur.
+    """
+    def decorator(f):
+        @wraps(f)
+        def wrapped(*args, **kwargs):
+            session = next((current_session(arg) for arg in chain(args, kwargs.values())
+                            if isinstance(arg, (Session, scoped_session))), None)
+            if session is None:
+                return f(*args, **kwargs)
+            previous = session.info.get(AUDIT_ACTION)
+            session.info[AUDIT_ACTION] = (action, *actor_of(session, args, previous))
+            try:
+                return f(*args, **kwargs)
+            finally:
+                if previous is None:
+                    session.info.pop(AUDIT_ACTION, None)
+                else:
+                    session.info[AUDIT_ACTION] = previous
+        return wrapped
+    return decorator
+
+
+def record(session, entity, entity_id, changes):
+    """
+    Ajoute une entrée aux entrées en attente de la transaction de la session.
+    """
+    action, actor_id, actor = session.info[AUDIT_ACTION]
+    session.info.setdefault(AUDIT_PENDING, []).append({
+        'created_at': datetime.utcnow(), 'actor_id': actor_id, 'actor': actor, 'action': action,
+        'entity': entity, 'entity_id': entity_id, 'changes': changes,
+    })
+
+
+def record_rows(session, table, rows, keys=None):
+    """
+    Journalise des lignes insérées sans passer par l'ORM (import en masse) pendant une action auditée.
+
+    Paramètres :
+    ------------
+    session : Session
+        La session de la transaction d'insertion.
+    table : Table
+        La table des lignes.
+    rows : list
+        Les valeurs insérées (dictionnaires colonne -> valeur).
+    keys : list, optionnel
+        Les clés primaires des lignes, dans le même ordre, si elles sont connues.
+    """
+    if AUDIT_ACTION not in session.info:
+        return
+    for key, row in zip(keys or [None] * len(rows), rows):
+        changes = {column: ['***', '***'] if column in MASKED else [None, audit_value(value)]
+                   for column, value in row.items() if value is not None}
+        record(session, table.name, None if key is None else str(key), changes)
+
+
+@event.listens_for(Session, 'after_flush')
+def _record_flush(session, flush_context):
+    """
+    Journalise les entités auditées écrites par un flush pendant une action auditée.
+    """
+    if AUDIT_ACTION not in session.info:
+        return
+    for instances, created, deleted in ((session.new, True, False), (session.dirty, False, False),
+                                        (session.deleted, False, True)):
+        for instance in instances:
+            if not isinstance(instance, AUDITED):
+                continue
+            changes = changes_of(instance, created, deleted)
+            if changes:
+                mapper = inspect(instance).mapper
+                entity_id = ','.join(str(key) for key in mapper.primary_key_from_instance(instance))
+                record(session, mapper.persist_selectable.name, entity_id, changes)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _record_bulk_write(orm_execute_state):
+    """
+    Journalise un UPDATE ou un DELETE ensembliste (réaffectations) pendant une action auditée.
+    """
+    session = orm_execute_state.session
+    if AUDIT_ACTION not in session.info or not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    statement = orm_execute_state.statement
+    params = {key: audit_value(value) for key, value in statement.compile().params.items()}
+    record(session, statement.table.name, None, {'statement': str(statement), 'params': params})
+
+
+@event.listens_for(Session, 'after_commit')
+def _submit_on_commit(session):
+    """
+    Transmet à l'écrivain les entrées de la transaction validée.
+    """
+    records = session.info.pop(AUDIT_PENDING, None)
+    if records:
+        bind = session.get_bind()
+        writer.submit(getattr(bind, 'engine', bind), records)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_on_rollback(session):
+    """
+    Abandonne les entrées d'une transaction annulée.
+    """
+    session.info.pop(AUDIT_PENDING, None)
+
+
+def history(session, entity, entity_id):
+    """
+    Retourne l'historique d'une entité, du plus ancien au plus récent (index ix_audit_log_entity).
+
+    Paramètres :
+    ------------
+    session : Session
+        La session SQLAlchemy.
+    entity : str
+        La table de l'entité (par exemple 'contracts').
+    entity_id : int ou str
+        La clé primaire de l'entité.
+
+    Retourne :
+    ----------
+    list : Les entrées (AuditLog).
+    """
+    return session.scalars(select(AuditLog)
+                           .where(AuditLog.entity == entity, AuditLog.entity_id == str(entity_id))
+                           .order_by(AuditLog.created_at, AuditLog.audit_id)).all()
@@ -1,6 +1,7 @@
 import os
 import sys
 from configparser import ConfigParser
+import argon2
 
 
 class Config:
@@ -22,7 +23,8 @@ class Config:
         FileNotExists :
             Levée si le fichier de configuration n'existe pas.
         NoSectionPostgresql :
-            Levée si la section 'postgresql' est absente du fichier.
+            Levée si la section 'postgresql' est absente du fichier alors que le moteur
+            choisi dans la section 'database' est PostgreSQL.
         """
         self.filename = filename
         section = 'postgresql'
@@ -34,7 +36,15 @@ class Config:
 
         parser.read(self.filename)
 
-        if parser.has_section(section):
+        # Moteur de base de données : 'postgresql' (par défaut) ou 'sqlite'
+        self.backend = parser.get('database', 'BACKEND', fallback='postgresql').strip().lower()
+        if self.backend == 'sqlite':
+            # Fichier de la base SQLite (relatif au fichier de configuration), ou ':memory:'
+            self.database = parser.get('sqlite', 'PATH', fallback='epic.db')
+            if self.database != ':memory:':
+                self.database = os.path.join(os.path.dirname(os.path.abspath(self.filename)), self.database)
+            self.host = self.user = self.password = self.port = None
+        elif parser.has_section(section):
             self.database = parser.get(section, 'DATABASE')
             self.host = parser.get(section, 'HOST')
             self.user = parser.get(section, 'USER')
@@ -45,15 +55,105 @@ class Config:
 
     def create_config(self, name_db, username, password, port):
         """
-        Crée un fichier de configuration avec des valeurs spécifiées.
+        Crée ou met à jour la section 'postgresql' du fichier de configuration.
+
+        Les autres sections du fichier (argon2, pool...) sont conservées.
         """
+        parser = ConfigParser()
+        parser.optionxform = str
+        parser.read(self.filename)
+        parser['postgresql'] = {
+            'DATABASE': name_db,
+            'HOST': 'localhost',
+            'USER': username,
+            'PASSWORD': password,
+            'PORT': port,
+        }
         with open(self.filename, 'w') as configfile:
-            configfile.write('[postgresql]\n')
-            configfile.write(f'DATABASE = {name_db}\n')
-            configfile.write('HOST = localhost\n')
-            configfile.write(f'USER = {username}\n')
-            configfile.write(f'PASSWORD = {password}\n')
-            configfile.write(f'PORT = {port}\n')
+            parser.write(configfile)
+
+
+class PasswordPolicy:
+    """
+    Classe permettant de charger les paramètres de hachage Argon2 à partir d'un fichier INI.
+
+    Les valeurs sont lues dans la section 'argon2' ; les paramètres absents prennent
+    les valeurs par défaut d'argon2-cffi.
+    """
+
+    def __init__(self, filename='database.ini') -> None:
+        """
+        Initialise l'objet PasswordPolicy en chargeant la section 'argon2' du fichier spécifié.
+
+        Paramètres :
+        ------------
+        filename : str
+            Le nom du fichier de configuration à charger (par défaut 'database.ini').
+        """
+        self.filename = filename
+        section = 'argon2'
+        parser = ConfigParser()
+        parser.read(self.filename)
+
+        self.time_cost = parser.getint(section, 'TIME_COST', fallback=argon2.DEFAULT_TIME_COST)
+        self.memory_cost = parser.getint(section, 'MEMORY_COST', fallback=argon2.DEFAULT_MEMORY_COST)
+        self.parallelism = parser.getint(section, 'PARALLELISM', fallback=argon2.DEFAULT_PARALLELISM)
+        self.hash_len = parser.getint(section, 'HASH_LEN', fallback=argon2.DEFAULT_HASH_LENGTH)
+        self.salt_len = parser.getint(section, 'SALT_LEN', fallback=argon2.DEFAULT_RANDOM_SALT_LENGTH)
+
+    def to_dict(self):
+        """
+        Retourne les paramètres sous forme de dictionnaire utilisable par `PasswordHasher`.
+        """
+        return {
+            'time_cost': self.time_cost,
+            'memory_cost': self.memory_cost,
+            'parallelism': self.parallelism,
+            'hash_len': self.hash_len,
+            'salt_len': self.salt_len,
+        }
+
+
+class PoolPolicy:
+    """
+    Classe permettant de charger les paramètres du pool de connexions à partir d'un fichier INI.
+
+    Les valeurs sont lues dans la section 'pool' ; les paramètres absents prennent
+    les valeurs par défaut ci-dessous.
+    """
+
+    def __init__(self, filename='database.ini') -> None:
+        """
+        Initialise l'objet PoolPolicy en chargeant la section 'pool' du fichier spécifié.
+
+        Paramètres :
+        ------------
+        filename : str
+            Le nom du fichier de configuration à charger (par défaut 'database.ini').
+        """
+        self.filename = filename
+        section = 'pool'
+        parser = ConfigParser()
+        parser.read(self.filename)
+
+        self.pool_size = parser.getint(section, 'POOL_SIZE', fallback=5)
+        self.max_overflow = parser.getint(section, 'MAX_OVERFLOW', fallback=10)
+        self.pool_pre_ping = parser.getboolean(section, 'POOL_PRE_PING', fallback=True)
+        # Durée de vie maximale d'une connexion, en secondes (-1 : illimitée)
+        self.pool_recycle = parser.getint(section, 'POOL_RECYCLE', fallback=1800)
+        # Durée maximale d'une requête, en millisecondes (0 : illimitée)
+        self.statement_timeout = parser.getint(section, 'STATEMENT_TIMEOUT', fallback=0)
+
+    def to_dict(self):
+        """
+        Retourne les paramètres du pool sous forme de dictionnaire utilisable par `create_engine`.
+        """
+        return {
+            'pool_size': self.pool_size,
+            'max_overflow': self.max_overflow,
+            'pool_pre_ping': self.pool_pre_ping,
+            'pool_recycle': self.pool_recycle,
+        }
 
 
 class FileNotExists(Exception):
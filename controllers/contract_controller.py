@@ -14,9 +14,11 @@ sys.path.insert(0, parent_dir)
 from views.data_view import DataView
 from views.console_view import console
 # Import des Modèles
-from models.entities import Contract, Paiement
+from models.entities import Contract, Paiement, money
 # Import des Controllers
+from controllers.audit import audited
 from controllers.decorator import is_authenticated, requires_roles, sentry_activate
+from controllers.unit_of_work import commit, rollback
 
 
 class ContractBase:
@@ -40,6 +42,7 @@ class ContractBase:
         self.current_user = current_user
 
     @staticmethod
+    @audited('contract.create')
     def create_contract(session, data):
         """
         Crée un nouveau contrat avec les données fournies.
@@ -55,20 +58,21 @@ class ContractBase:
         """
         contract = Contract(
             description=data['description'],
-            total_amount=data['total_amount'],
-            remaining_amount=data['total_amount'],
+            total_amount=money(data['total_amount']),
+            remaining_amount=money(data['total_amount']),
             state="C",
             customer_id=data['customer_id'],
             paiement_state="N",
             commercial_id=data['commercial_id']
         )
         session.add(contract)
-        session.commit()
+        commit(session)
         console.print(f"Le contrat {contract.contract_id} a été créé avec succès.")
         return contract
 
     @sentry_activate
     @requires_roles('ADM', 'COM', 'Admin', 'Commercial')
+    @audited('contract.update')
     def update_contract(contract_id, data, session):
         """
         Met à jour un contrat existant avec les nouvelles données.
@@ -90,20 +94,23 @@ class ContractBase:
 
             # Mise à jour des données du contrat
             for key, value in data.items():
+                if key in ('total_amount', 'remaining_amount') and value is not None:
+                    value = money(value)
                 if hasattr(contract, key):
                     setattr(contract, key, value)
 
             # Sauvegarder les modifications
-            session.commit()
+            commit(session)
 
             console.print(f"Le contrat {contract_id} a été mis à jour avec succès.", style="bold green")
         except Exception as e:
             console.print(f"Erreur inattendue : {str(e)}", style="bold red")
-            session.rollback()
+            rollback(session)
 
     @sentry_activate
     @is_authenticated
     @requires_roles('ADM', 'GES', 'Admin', 'Gestion')
+    @audited('contract.add_paiement')
     def add_paiement(self, session, contract_id, data) -> None:
         """
         Ajoute un nouveau paiement à un contrat dans la base de données.
@@ -123,7 +130,7 @@ class ContractBase:
             Levée si le paiement existe déjà pour le contrat ou si le montant du paiement dépasse le montant restant dû.
         """
         try:
-            amount = Decimal(data['amount'])
+            amount = money(data['amount'])
             paiement_id = data['paiement_id']
 
             # Vérifier si le paiement existe déjà pour le contrat donné
@@ -151,10 +158,9 @@ class ContractBase:
             session.add(paiement)
 
             # Mettre à jour le montant restant dû du contrat
+            # Montants décimaux exacts : pas d'erreur d'arrondi sur le restant dû
             if contract.remaining_amount is not None:
-                contract.remaining_amount -= float(amount)
-                if contract.remaining_amount < 0:
-                    contract.remaining_amount = 0
+                contract.remaining_amount = max(contract.remaining_amount - amount, Decimal(0))
 
             # Mettre à jour l'état du paiement du contrat
             if contract.remaining_amount == 0:
@@ -165,7 +171,7 @@ class ContractBase:
             # Ajouter la mise à jour du contrat à la session
             session.add(contract)
 
-            session.commit()
+            commit(session)
             text = f"Paiement enregistré avec succès : {paiement.paiement_id}"
             console.print(text, style="bold green")
             text = f"Contrat mis à jour: ID={contract.contract_id}, Montant restant={contract.remaining_amount}"
@@ -173,12 +179,13 @@ class ContractBase:
             return paiement
 
         except Exception as e:
-            session.rollback()
+            rollback(session)
             text = f"Erreur lors de l'enregistrement du paiement : {e}"
             raise
 
     @sentry_activate
     @requires_roles('ADM', 'GES', 'Admin', 'Gestion')
+    @audited('contract.sign')
     def signed(contract_id, session):
         """
         Met à jour l'état d'un contrat pour le marquer comme signé.
@@ -205,13 +212,14 @@ class ContractBase:
             raise ValueError(f"Aucun contrat trouvé avec l'ID {contract_id}")
         contract.state = 'S'
         session.add(contract)
-        session.commit()
+        commit(session)
         DataView.display_data_update()
 
     @classmethod
     @sentry_activate
     @is_authenticated
     @requires_roles('ADM', 'GES', 'Admin', 'Gestion')
+    @audited('contract.assign_gestion')
     def update_gestion_contract(self, session, contract_id, gestion_id):
         """
         Met à jour le commercial attribué à un contrat.
@@ -240,4 +248,4 @@ class ContractBase:
 
         # Mise à jour du gestionnaire
         contract.gestion_id = gestion_id
-        session.commit()
+        commit(session)
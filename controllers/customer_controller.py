@@ -6,7 +6,9 @@ from views.console_view import console
 # Import des Modèles
 from models.entities import Customer
 # Import des Controllers
+from controllers.audit import audited
 from controllers.decorator import is_authenticated, requires_roles, sentry_activate
+from controllers.unit_of_work import commit
 
 
 class CustomerBase:
@@ -26,6 +28,7 @@ class CustomerBase:
         """
         self.session = session
 
+    @audited('customer.create')
     def create_customer(session, customer_data):
         """
         Crée un nouveau client avec les informations fournies.
@@ -55,13 +58,14 @@ class CustomerBase:
             commercial_id=customer_data.get('commercial_id')
         )
         session.add(customer)
-        session.commit()
+        commit(session)
         console.print(f"Client {customer.first_name} {customer.last_name} ajouté avec succès", style="bold green")
         return customer
 
     @sentry_activate
     @is_authenticated
     @requires_roles('ADM', 'COM', 'Admin', 'Commercial')
+    @audited('customer.update')
     def update_customer(self, session, customer_id):
         """
         Met à jour le profil d'un client existant en utilisant son ID.
@@ -87,12 +91,13 @@ class CustomerBase:
             setattr(customer, key, value)
         console.print(f"Client {customer.first_name} {customer.last_name} mis à jour avec succès", style="bold green")
 
-        session.commit()
+        commit(session)
 
     @classmethod
     @sentry_activate
     @is_authenticated
     @requires_roles('ADM', 'COM', 'Admin', 'Commercial')
+    @audited('customer.assign_commercial')
     def update_commercial_customer(self, session, customer_id, commercial_id):
         """
         Met à jour le commercial attribué à un client.
@@ -122,6 +127,6 @@ class CustomerBase:
 
         # Mise à jour du commercial
         customer.commercial_id = commercial_id
-        session.commit()
+        commit(session)
         text = f"Commercial ID {commercial_id} attribué au client ID {customer_id}."
         console.print(text, style="bold green")
@@ -2,7 +2,7 @@
 import os
 import sys
 from argon2.exceptions import VerifyMismatchError
-from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
 from sqlalchemy_utils.functions import (
     database_exists,
     create_database
@@ -30,20 +30,23 @@ from terminal.terminal_contract import EpicTerminalContract
 from terminal.terminal_customer import EpicTerminalCustomer
 from terminal.terminal_user import EpicTerminalUser
 from terminal.terminal_event import EpicTerminalEvent
+from terminal.terminal_search import EpicTerminalSearch
 
 # Import Controllers
+from controllers.engine import database_url, dispose_engines, get_engine
 from controllers.user_controller import EpicUserBase
 
 
 class EpicDatabase:
-    def __init__(self, database, host, user, password, port=5432) -> None:
+    def __init__(self, database, host=None, user=None, password=None, port=5432, backend='postgresql') -> None:
         """
-        Initialise une connexion à une base de données PostgreSQL.
+        Initialise une connexion à une base de données PostgreSQL ou SQLite.
 
         Paramètres :
         ------------
         database : str
-            Le nom de la base de données à utiliser.
+            Le nom de la base de données à utiliser, ou le fichier de la base SQLite
+            (':memory:' pour une base en mémoire).
         host : str
             L'hôte du serveur de base de données.
         user : str
@@ -52,16 +55,25 @@ class EpicDatabase:
             Le mot de passe pour l'utilisateur.
         port : int, optionnel
             Le port du serveur de base de données (par défaut : 5432).
+        backend : str, optionnel
+            Le moteur de base de données : 'postgresql' (par défaut) ou 'sqlite'.
+            Avec SQLite, host, user, password et port sont ignorés.
+
+        Le moteur provient du registre partagé par le processus (voir `controllers.engine`).
         """
-        self.url = f'postgresql+psycopg2://{user}:{password}@{host}:{port}/{database}'
-        self.engine = create_engine(self.url)
+        self.backend = backend
+        self.url = database_url(database, host, user, password, port, backend)
+        self.engine = get_engine(self.url)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
         self.session = scoped_session(self.SessionLocal)  # Utilise scoped_session ici
 
-        if database_exists(self.url):
+        # La connexion de test est rendue au pool et réutilisée par la première requête
+        try:
+            with self.engine.connect():
+                pass
             text = f"Connexion à la base de données {database} réussie."
             console.print(text, style="green")
-        else:
+        except OperationalError:
             text = 'Erreur de connexion à la base de données'
             console.print(text, style="bold red")
         self.name = database
@@ -70,6 +82,7 @@ class EpicDatabase:
         self.customers = EpicTerminalCustomer(self.engine, self.session, self.current_user)
         self.contracts = EpicTerminalContract(self.engine, self.session)
         self.events = EpicTerminalEvent(self.engine, self.session)
+        self.search = EpicTerminalSearch(self.engine, self.session)
 
     def __str__(self) -> str:
         """
@@ -87,13 +100,13 @@ class EpicDatabase:
 
     def database_disconnect(self):
         """
-        Déconnecte la session de la base de données et ferme le moteur.
+        Déconnecte la session de la base de données et ferme les moteurs partagés.
 
         Cette méthode est utilisée pour libérer les ressources liées à la connexion
         à la base de données lorsque l'application n'en a plus besoin.
         """
         self.session.close()
-        self.engine.dispose()
+        dispose_engines()
 
     def database_creation(self, username, password):
         """
@@ -106,13 +119,13 @@ class EpicDatabase:
         password : str
             Le mot de passe pour l'utilisateur.
         """
-        if not database_exists(self.url):
+        # Une base SQLite en mémoire existe dès la première connexion
+        if self.url != 'sqlite:///:memory:' and not database_exists(self.url):
             create_database(self.url)
 
         # Initialisation de la structure de la base de données
-        engine = create_engine(self.url)
-        Base.metadata.create_all(engine)
-        self.session = scoped_session(sessionmaker(bind=engine))
+        Base.metadata.create_all(self.engine)
+        self.session = scoped_session(sessionmaker(bind=self.engine))
         self.db_users = EpicUserBase(self.session)
 
     def check_connection(self, username, password) -> EpicUser:
@@ -135,6 +148,9 @@ class EpicDatabase:
         if user:
             try:
                 if user.check_password(password):
+                    # Migration vers les paramètres Argon2 courants
+                    if user.rehash_password_if_needed(password):
+                        self.session.commit()
                     AuthenticationView.display_database_connection(self.name)
                     return user
                 else:
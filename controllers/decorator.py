@@ -1,7 +1,7 @@
 # Import généraux
 import jwt
 from functools import wraps
-from controllers.session import load_session, decode_token
+from controllers.session import load_session, decode_token, load_principal, resolve_principal_user
 from jwt.exceptions import DecodeError
 import sys
 import os
@@ -17,11 +17,9 @@ sys.path.insert(0, parent_dir)
 
 
 # Import des Controllers
+from controllers.audit import set_actor
 from controllers.session import ALGORITHM, SECRET_KEY
 
-# Import des Modèles
-from models.entities import EpicUser
-
 
 def sentry_activate(f):
     """
@@ -74,7 +72,7 @@ def is_commercial(f):
     @wraps(f)
     def decorator(*args, **kwargs):
         try:
-            role_code = decode_token(load_session(), SECRET_KEY, ALGORITHM).get('role')
+            role_code = load_principal()['claims'].get('role')
             print(f"Rôle de l'utilisateur : {role_code}")  # Débogage
             if role_code in {'COM', 'ADM', 'Commercial', 'Admin'}:
                 return f(*args, **kwargs)
@@ -108,7 +106,7 @@ def is_support(f):
     @wraps(f)
     def decorator(*args, **kwargs):
         try:
-            role_code = decode_token(load_session(), SECRET_KEY, ALGORITHM).get('role')
+            role_code = load_principal()['claims'].get('role')
             if role_code in {'SUP', 'ADM', 'Support', 'Admin'}:
                 return f(*args, **kwargs)
             else:
@@ -126,7 +124,8 @@ def is_authenticated(f):
 
     Ce décorateur vérifie si l'utilisateur est authentifié en vérifiant la présence
     et la validité d'un jeton dans la session. Il valide également que l'utilisateur
-    est actif et définit `self.current_user`.
+    est actif et définit `self.current_user`. Le jeton décodé et l'utilisateur résolu
+    proviennent du cache du principal (voir `controllers.session.load_principal`).
 
     Paramètres :
     ------------
@@ -140,28 +139,18 @@ def is_authenticated(f):
     """
     @wraps(f)
     def decorator(cls, session, *args, **kwargs):
-        token = load_session()
-        if not token:
-            print("Erreur : Aucun jeton trouvé dans la session.")
-            raise PermissionError("Token not found")
-
         try:
-            decoded = decode_token(token, SECRET_KEY, ALGORITHM)
-            if not decoded or 'username' not in decoded:
-                print("Erreur : Le jeton est invalide ou incomplet.")
-                raise PermissionError("Token invalid")
-
-            # Cherchez l'utilisateur dans la base de données
-            user = session.query(EpicUser).filter_by(username=decoded['username']).one_or_none()
-            if user is None:
-                print(f"Erreur : Utilisateur {decoded['username']} non trouvé.")
-                raise PermissionError("User not found")
+            # Le principal (jeton décodé et utilisateur résolu) est partagé entre les décorateurs
+            principal = load_principal()
+            user = resolve_principal_user(session, principal)
 
-            if user.state != 'A':
+            if principal['state'] != 'A':
                 print("Erreur : Utilisateur inactif.")
                 raise PermissionError("User inactive")
             # Assurez-vous de définir self.current_user
             cls.current_user = user
+            # L'employé authentifié signe les entrées du journal d'audit
+            set_actor(session, user)
             return f(cls, session, *args, **kwargs)
         except jwt.ExpiredSignatureError:
             print("Erreur : Le jeton a expiré.")
@@ -197,11 +186,8 @@ def is_admin(f):
     """
     @wraps(f)
     def decorator(cls, session, *args, **kwargs):
-        token = load_session()
-        if token is None:
-            raise PermissionError("Token not found")
         try:
-            decoded = decode_token(token, SECRET_KEY, ALGORITHM)
+            decoded = load_principal()['claims']
             if decoded.get('role') in {'ADM', 'Admin'}:
                 print("Inside is_authenticated decorator")
                 print(f"Arguments passed: {args}, {kwargs}")
@@ -235,11 +221,8 @@ def is_gestion(f):
     """
     @wraps(f)
     def decorator(cls, session, *args, **kwargs):
-        token = load_session()
-        if token is None:
-            raise PermissionError("Token not found")
         try:
-            decoded = decode_token(token, SECRET_KEY, ALGORITHM)
+            decoded = load_principal()['claims']
             if decoded.get('role') in {'GES', 'ADM', 'Gestion', 'Admin'}:
                 return f(cls, session, *args, **kwargs)
             else:
@@ -270,13 +253,8 @@ def requires_roles(*roles):
     def decorator(f):
         @wraps(f)
         def wrapped(cls, session, *args, **kwargs):
-            token = load_session()
-            if not token:
-                raise PermissionError("Token not found")
-
             try:
-                decoded = decode_token(token, SECRET_KEY, ALGORITHM)
-                user_role = decoded.get('role')
+                user_role = load_principal()['claims'].get('role')
                 if user_role not in roles:
                     raise PermissionError(f"PermissionError: User role is {user_role}, required one of {roles}")
                 return f(cls, session, *args, **kwargs)
@@ -0,0 +1,111 @@
+# Import généraux
+import os
+import sys
+import threading
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
+
+# Déterminez le chemin absolu du répertoire parent
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
+
+# Ajoutez le répertoire parent au PYTHONPATH
+sys.path.insert(0, parent_dir)
+
+# Import des Controllers
+from controllers.config import Config, PoolPolicy
+
+# Moteurs partagés par le processus, indexés par URL de connexion
+_engines = {}
+_lock = threading.Lock()
+
+
+def database_url(database, host=None, user=None, password=None, port=5432, backend='postgresql'):
+    """
+    Construit l'URL de connexion.
+
+    Paramètres :
+    ------------
+    database : str
+        Le nom de la base PostgreSQL, ou le fichier de la base SQLite (':memory:' pour une base en mémoire).
+    backend : str
+        Le moteur de base de données : 'postgresql' (par défaut) ou 'sqlite'.
+
+    Retourne :
+    ----------
+    str : L'URL de connexion.
+    """
+    if backend == 'sqlite':
+        return f'sqlite:///{database}'
+    return f'postgresql+psycopg2://{user}:{password}@{host}:{port}/{database}'
+
+
+def config_url(filename='database.ini'):
+    """
+    Construit l'URL de connexion à partir du fichier de configuration.
+    """
+    config = Config(filename)
+    return database_url(config.database, config.host, config.user, config.password, config.port, config.backend)
+
+
+def _create_sqlite_engine(url):
+    """
+    Crée un moteur SQLite : une connexion unique pour une base en mémoire,
+    et les clés étrangères activées sur chaque connexion.
+    """
+    if url == 'sqlite:///:memory:':
+        engine = create_engine(url, poolclass=StaticPool, connect_args={'check_same_thread': False})
+    else:
+        engine = create_engine(url, connect_args={'timeout': 30})
+
+    @event.listens_for(engine, 'connect')
+    def _enable_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    return engine
+
+
+def get_engine(url=None, filename='database.ini'):
+    """
+    Retourne le moteur partagé pour une URL, en le créant au premier appel.
+
+    Le pool de connexions PostgreSQL est configuré par la section 'pool' du fichier de configuration
+    (pool_size, max_overflow, pool_pre_ping, pool_recycle et statement_timeout). Les bases SQLite
+    n'utilisent pas ces paramètres.
+
+    Paramètres :
+    ------------
+    url : str, optionnel
+        L'URL de connexion (par défaut, celle du fichier de configuration).
+    filename : str
+        Le fichier de configuration (par défaut 'database.ini').
+
+    Retourne :
+    ----------
+    Engine : Le moteur SQLAlchemy partagé.
+    """
+    if url is None:
+        url = config_url(filename)
+    with _lock:
+        engine = _engines.get(url)
+        if engine is None and url.startswith('sqlite'):
+            engine = _engines[url] = _create_sqlite_engine(url)
+        elif engine is None:
+            policy = PoolPolicy(filename)
+            connect_args = {}
+            if policy.statement_timeout:
+                connect_args['options'] = f'-c statement_timeout={policy.statement_timeout}'
+            engine = _engines[url] = create_engine(url, connect_args=connect_args, **policy.to_dict())
+        return engine
+
+
+def dispose_engines():
+    """
+    Ferme les connexions de tous les moteurs partagés et vide le registre.
+    """
+    with _lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
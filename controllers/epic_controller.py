@@ -1,5 +1,4 @@
 # Import généraux
-import jwt
 import os
 import sys
 
@@ -17,8 +16,9 @@ from views.console_view import console
 # Import des Controllers
 from controllers.config import Config, Environ
 from controllers.database_controller import EpicDatabase
-from controllers.session import load_session, clear_session, create_session, save_session, get_current_user
+from controllers.session import clear_session, create_session, save_session, validate_session, force_refresh_token
 from controllers.session import create_token
+from controllers.timing import StepTimer
 
 # Import des Terminaux
 from terminal.terminal_user import EpicTerminalUser, EpicUser
@@ -32,32 +32,41 @@ class EpicBase:
     Elle fournit également des méthodes pour la connexion, la vérification et le rafraîchissement de la session utilisateur.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, timings=False) -> None:
         """
         Initialise une instance de EpicBase.
 
         Configure l'environnement, la base de données, et la session utilisateur.
         Affiche les informations de débogage sur l'utilisateur actuel.
+
+        Paramètres :
+        ------------
+        timings : bool, optionnel
+            Affiche le détail du temps de démarrage par étape (par défaut : False).
         """
         text = "Initialisation de EpicBase..."
         console.print(text, style="bold green")
-        self.env = Environ()
-        db_config = self.get_config()
-        self.epic = EpicDatabase(**db_config)
+        self.timer = StepTimer()
+        with self.timer.step("Variables d'environnement"):
+            self.env = Environ()
+        with self.timer.step("Configuration"):
+            db_config = self.get_config()
+        with self.timer.step("Connexion à la base de données"):
+            self.epic = EpicDatabase(**db_config)
         self.session = self.epic.session
 
         self.current_user = None
-        self.epic.users = EpicTerminalUser(self.epic, self.epic.session, self.current_user)
+        with self.timer.step("Validation du jeton"):
+            self.check_session()
 
-        # Obtenez et affichez l'utilisateur actuel pour débogage
-        self.current_user = get_current_user()
+        # Affichez l'utilisateur actuel pour débogage
         if self.current_user:
             text = f"Utilisateur actuel dans EpicBase : {self.current_user}"
             console.print(text, style="green")
 
         self.epic.users = EpicTerminalUser(self.epic, self.session, self.current_user)
-
-        self.check_session()
+        if timings:
+            AuthenticationView.display_timings(self.timer.steps, self.timer.total)
 
     def get_config(self):
         """
@@ -73,7 +82,8 @@ class EpicBase:
             'host': config.host,
             'user': config.user,
             'password': config.password,
-            'port': config.port
+            'port': config.port,
+            'backend': config.backend
         }
 
     def login(self, **kwargs) -> bool:
@@ -123,42 +133,37 @@ class EpicBase:
         """
         Vérifie la session en cours.
 
-        Cette méthode décode le jeton JWT pour valider la session en cours,
-        et authentifie l'utilisateur si le jeton est valide. Affiche des messages
-        d'erreur si le jeton est invalide ou expiré.
+        Cette méthode valide le jeton JWT de la session en cours (signature, expiration),
+        puis l'état et le rôle de l'utilisateur en une seule requête, sans recalculer le
+        hachage du mot de passe. Un jeton expiré est renouvelé. Affiche des messages
+        d'erreur si le jeton est invalide.
 
         Retourne :
         ----------
         EpicUser : L'utilisateur actuellement authentifié, ou None si la session est invalide.
         """
-        token = load_session()
-        if token:
-            try:
-                # Décoder le jeton JWT
-                decoded_token = jwt.decode(token, self.env.SECRET_KEY, algorithms=['HS256'])
-                username = decoded_token.get('username')
-                if username:
-                    user = self.epic.check_user(username)
-                    if user:
-                        self.user = user
-                        # Authentifier de nouveau l'utilisateur pour assurer qu'il est toujours valide
-                        if self.authenticate_user(self.epic.session, username, user.password):
-                            self.current_user = self.user
-                            return user
-                        else:
-                            text = "Erreur : Utilisateur non authentifié."
-                            console.print(text, style="bold red")
-                else:
-                    text = "Le jeton ne contient pas de nom d'utilisateur valide."
-                    console.print(text, style="bold red")
-            except jwt.ExpiredSignatureError:
-                text = "Le jeton a expiré."
-                console.print(text, style="bold red")
-                self.refresh_session()
-            except jwt.InvalidTokenError:
-                text = "Jeton invalide."
+        try:
+            user = validate_session(self.epic.session)
+        except PermissionError as e:
+            if str(e) == "Token not found":
+                return None
+            if str(e) != "Token expired":
+                text = f"Erreur : Utilisateur non authentifié ({e})."
                 console.print(text, style="bold red")
-        return None
+                return None
+
+            text = "Le jeton a expiré."
+            console.print(text, style="bold red")
+            if not force_refresh_token():
+                return None
+            try:
+                user = validate_session(self.epic.session)
+            except PermissionError:
+                return None
+
+        self.user = user
+        self.current_user = user
+        return user
 
     def refresh_session(self):
         """
@@ -208,8 +213,17 @@ class EpicBase:
         Initialise la base de données et crée un fichier de configuration.
         Demande à l'utilisateur de saisir les informations nécessaires pour la configuration,
         puis crée la base de données, la configure, et crée les tables.
+
+        Avec le moteur SQLite (section 'database' de database.ini), la base est créée
+        directement dans le fichier configuré, sans saisie.
         """
         clear_session()
+        config = Config()
+        if config.backend == 'sqlite':
+            db = EpicDatabase(database=config.database, backend='sqlite')
+            db.database_creation(username=None, password=None)
+            AuthenticationView.display_database_connection(config.database)
+            return
         values = AuthenticationView.prompt_baseinit()
         print(f"Valeurs retournées: {values}")
         Config().create_config(*values)
@@ -12,9 +12,8 @@ sys.path.insert(0, parent_dir)
 
 
 # Import Controllers
-from controllers.epic_controller import EpicDatabase
-from controllers.config import Config
 from controllers.session import clear_session
+from controllers.unit_of_work import UnitOfWorkFailed, unit_of_work
 
 # Import Views
 from views.authentication_view import AuthenticationView
@@ -32,19 +31,15 @@ class EpicDashboard:
         text = (f"Utilisateur connecté : {self.gestion.current_user.username}")
         console.print(text, style="bold")
 
-        config = Config()
-        self.database = EpicDatabase(
-            database=config.database,
-            host=config.host,
-            user=config.user,
-            password=config.password,
-            port=config.port
-        )
+        # Le tableau de bord réutilise la base (moteur et session) ouverte par EpicBase
+        self.database = self.gestion.epic
         self.session = self.gestion.epic.session
 
     def call_function(self, choice) -> bool:
 
         match choice:
+            case '00':
+                self.database.search.search(self.session)
             case '01':
                 self.database.users.show_profil(self.session)
             case '02':
@@ -129,6 +124,11 @@ class EpicDashboard:
             try:
                 while running:
                     result = MenuView.menu_choice(self.gestion.current_user.role.code)
-                    running = self.call_function(result)
+                    # Une action du menu = une transaction, validée une seule fois
+                    try:
+                        with unit_of_work(self.session):
+                            running = self.call_function(result)
+                    except UnitOfWorkFailed as e:
+                        console.print(str(e), style="bold red")
             except KeyboardInterrupt:
                 pass
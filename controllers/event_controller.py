@@ -2,7 +2,9 @@
 from models.entities import Event
 
 # Import Controllers
+from controllers.audit import audited
 from controllers.decorator import is_authenticated, requires_roles, sentry_activate
+from controllers.unit_of_work import commit, rollback
 
 # Import Views
 from views.console_view import console
@@ -28,6 +30,7 @@ class EventBase:
 
     @sentry_activate
     @requires_roles('ADM', 'COM', 'Admin', 'Commercial')
+    @audited('event.create')
     def create_event(data, session):
         """
         Crée un nouvel événement avec les données fournies.
@@ -62,11 +65,12 @@ class EventBase:
             support_id=data.get('support_id')
         )
         session.add(event)
-        session.commit()
+        commit(session)
         return event
 
     @staticmethod
     @sentry_activate
+    @audited('event.update')
     def update_event(event_id, data, session):
         """
         Met à jour un événement existant avec les nouvelles données.
@@ -91,16 +95,17 @@ class EventBase:
                     console.print(f"L'événement n'a pas d'attribut '{key}'.", style="bold red")
 
             # Sauvegarder les modifications
-            session.commit()
+            commit(session)
 
         except Exception as e:
             console.print(f"Erreur inattendue : {str(e)}", style="bold red")
-            session.rollback()
+            rollback(session)
 
     @classmethod
     @sentry_activate
     @is_authenticated
     @requires_roles('ADM', 'GES', 'Admin', 'Gestion')
+    @audited('event.assign_support')
     def update_support_event(self, session, event_id, support_id):
         """
         Met à jour le commercial attribué à un client.
@@ -129,4 +134,4 @@ class EventBase:
 
         # Mise à jour du support
         event.support_id = support_id
-        session.commit()
+        commit(session)
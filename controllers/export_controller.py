@@ -0,0 +1,118 @@
+# Import généraux
+import os
+import sys
+import time
+
+# Déterminez le chemin absolu du répertoire parent
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
+
+# Ajoutez le répertoire parent au PYTHONPATH
+sys.path.insert(0, parent_dir)
+
+# Import des Controllers
+from controllers.decorator import is_authenticated, sentry_activate
+from controllers.scope import READ, scope
+
+# Import des Modèles
+from models.entities import Contract, Customer, EpicUser, Event, Paiement
+from models.read_models import ContractPaiementRow, ContractRow, CustomerRow, EventRow, PaiementRow, UserRow
+
+# Import des Views
+from views.script_view import ScriptView, open_output
+
+# Nombre de lignes lues par aller-retour avec le curseur côté serveur
+EXPORT_BATCH_SIZE = 2000
+
+# Exports : nom -> (modèle de lecture, entité restreinte par `scope` ou None, tri)
+EXPORTS = {
+    'customers': (CustomerRow, Customer, (Customer.customer_id,)),
+    'contracts': (ContractRow, Contract, (Contract.contract_id,)),
+    'events': (EventRow, Event, (Event.event_id,)),
+    'users': (UserRow, None, (EpicUser.epicuser_id,)),
+    'paiements': (PaiementRow, Contract, (Paiement.paiement_id,)),
+    'contract_paiements': (ContractPaiementRow, Contract, (Contract.contract_id,)),
+}
+
+
+class ExportBase:
+    """
+    Export d'une entité (ou d'une jointure) en CSV ou en JSON Lines, compressé ou non.
+
+    Les lignes sont lues par lots avec un curseur côté serveur (curseur nommé sur PostgreSQL)
+    et écrites au fur et à mesure : la mémoire utilisée ne dépend pas du nombre de lignes.
+    """
+
+    def __init__(self, session):
+        """
+        Initialise la classe ExportBase avec une session SQLAlchemy.
+
+        Paramètres :
+        ------------
+        session : Session
+            La session SQLAlchemy pour interagir avec la base de données.
+        """
+        self.session = session
+        self.current_user = None
+
+    def rows(self, session, name, mine=False, batch_size=EXPORT_BATCH_SIZE):
+        """
+        Retourne les lignes d'un export visibles par l'utilisateur, lues par lots.
+
+        Paramètres :
+        ------------
+        session : Session
+            La session SQLAlchemy.
+        name : str
+            L'export (voir EXPORTS).
+        mine : bool
+            Si True, seuls les éléments de l'utilisateur sont exportés.
+        batch_size : int
+            Le nombre de lignes lues par aller-retour.
+
+        Retourne :
+        ----------
+        iterator : Les lignes (modèles de lecture), dans l'ordre de la clé primaire.
+        """
+        row_type, entity, order_by = EXPORTS[name]
+        query = row_type.query(session)
+        if entity is not None:
+            query = scope(query, entity, self.current_user, READ, mine=mine)
+        # yield_per active stream_results : les lignes ne sont pas chargées en une fois
+        rows = query.order_by(*order_by).yield_per(batch_size)
+        return (row_type._make(row) for row in rows)
+
+    @sentry_activate
+    @is_authenticated
+    def export(self, session, name, path=None, output_format='csv', compress=False, mine=False,
+               progress=None):
+        """
+        Exporte les lignes visibles par l'utilisateur authentifié dans un fichier ou sur la sortie standard.
+
+        Paramètres :
+        ------------
+        session : Session
+            La session SQLAlchemy.
+        name : str
+            L'export (voir EXPORTS).
+        path : str
+            Le fichier de sortie (None : la sortie standard).
+        output_format : str
+            'csv' ou 'jsonl'.
+        compress : bool
+            Si True, la sortie est compressée en gzip.
+        mine : bool
+            Si True, seuls les éléments de l'utilisateur sont exportés.
+        progress : callable
+            Appelée avec le nombre de lignes écrites, régulièrement pendant l'export.
+
+        Retourne :
+        ----------
+        dict : Le compte rendu de l'export (rows, seconds, path).
+        """
+        started = time.perf_counter()
+        row_type = EXPORTS[name][0]
+        with open_output(path, compress) as stream:
+            count = ScriptView.write_rows(self.rows(session, name, mine), row_type._fields, output_format,
+                                          stream, progress)
+        return {'rows': count, 'seconds': time.perf_counter() - started, 'path': path}
@@ -0,0 +1,408 @@
+# Import généraux
+import csv
+import io
+import re
+import time
+from datetime import datetime
+from decimal import Decimal
+from itertools import islice
+from operator import itemgetter
+from sqlalchemy import Sequence, func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+
+# Import Modèles
+from models.entities import Contract, Customer, Event, money
+
+# Import Controllers
+from controllers.audit import audited, record_rows
+from controllers.decorator import is_authenticated, requires_roles, sentry_activate
+from controllers.reference import directory
+from controllers.reporting import invalidate_reports
+from controllers.scope import READ, WRITE, scope
+
+# Import Views
+from views.regexformat import patterns, regexformat
+
+# Nombre de lignes validées et chargées par transaction
+IMPORT_CHUNK_SIZE = 5000
+# Montant maximal (exclu) d'un contrat, comme dans la règle 'numposmax'
+MAX_AMOUNT = Decimal('100000')
+
+
+def checked(rule, required=True, convert=None):
+    """
+    Retourne le contrôle d'un champ selon une règle de views/regexformat.py (motif précompilé).
+
+    Le contrôle retourne la valeur nettoyée et convertie, None pour un champ facultatif vide,
+    et lève ValueError avec le message de la règle si la valeur est invalide (y compris si la
+    conversion échoue : decimal.InvalidOperation est une ArithmeticError).
+    """
+    pattern = patterns[rule]
+    message = regexformat[rule][1]
+
+    def check(field, value):
+        value = (value or '').strip()
+        if not value:
+            if required:
+                raise ValueError(f"{field} : champ obligatoire")
+            return None
+        if not pattern.match(value):
+            raise ValueError(f"{field} : {message}")
+        try:
+            return convert(value) if convert else value
+        except (ValueError, ArithmeticError):
+            raise ValueError(f"{field} : {message}")
+    return check
+
+
+def amount(value):
+    """
+    Convertit un montant en décimal exact au centime, positif et inférieur à MAX_AMOUNT.
+
+    Le motif de la règle ne contrôle que le début du texte : la plage est vérifiée sur la valeur
+    convertie (399999 ou 100000.999 sont refusés).
+    """
+    value = money(value)
+    if not 0 <= value < MAX_AMOUNT:
+        raise ValueError(value)
+    return value
+
+
+def parse_date(value):
+    """
+    Convertit une date jj/mm/aaaa (séparateurs '/', '.' ou '-') en datetime.
+    """
+    return datetime.strptime(re.sub(r'[.-]', '/', value), '%d/%m/%Y')
+
+
+class ImportSpec:
+    """
+    Description de l'import d'une entité : contrôles des colonnes, employés et élément parent référencés.
+    """
+
+    def __init__(self, entity, fields, users=None, parent=None, defaults=None):
+        """
+        Paramètres :
+        ------------
+        entity : class
+            L'entité importée.
+        fields : dict
+            Les colonnes du fichier et leur contrôle (voir `checked`).
+        users : dict
+            Les colonnes contenant un nom d'utilisateur : colonne -> (colonne de la table, rôle).
+        parent : tuple
+            (colonne du fichier, entité parente, clé du parent, {colonne de la table: colonne du parent},
+            critère supplémentaire ou None, action) : le parent doit exister et être visible par
+            l'utilisateur pour l'action (voir `scope`).
+        defaults : callable
+            Complète les valeurs d'une ligne valide (colonnes calculées).
+        """
+        self.entity = entity
+        self.table = entity.__table__
+        self.fields = fields
+        self.users = users or {}
+        self.parent = parent
+        self.defaults = defaults
+
+
+def customer_defaults(values, now):
+    values['creation_time'] = now
+    values['update_time'] = now
+
+
+def contract_defaults(values, now):
+    values['remaining_amount'] = values['total_amount']
+    values['state'] = 'C'
+    values['paiement_state'] = 'N'
+
+
+def event_defaults(values, now):
+    if values['attendees'] is None:
+        values['attendees'] = 0
+    if values['date_ended'] < values['date_started']:
+        raise ValueError("date_ended : doit être postérieure ou égale à date_started")
+
+
+IMPORTS = {
+    'customers': ImportSpec(
+        Customer,
+        {
+            'first_name': checked('all_nospace'),
+            'last_name': checked('all_letters'),
+            'email': checked('email'),
+            'phone': checked('phone'),
+            'company_name': checked('all_space_union'),
+        },
+        users={'commercial': ('commercial_id', 'COM')},
+        defaults=customer_defaults),
+    'contracts': ImportSpec(
+        Contract,
+        {
+            'description': checked('all_letters'),
+            'total_amount': checked('numposmax', convert=amount),
+            'customer_id': checked('num', convert=int),
+        },
+        users={'gestion': ('gestion_id', 'GES')},
+        parent=('customer_id', Customer, Customer.customer_id, {'commercial_id': Customer.commercial_id},
+                None, READ),
+        defaults=contract_defaults),
+    'events': ImportSpec(
+        Event,
+        {
+            'title': checked('alpha'),
+            'description': checked('all_letters', required=False),
+            'location': checked('all_letters', required=False),
+            'attendees': checked('num', required=False, convert=int),
+            'date_started': checked('date', convert=parse_date),
+            'date_ended': checked('date', convert=parse_date),
+            'contract_id': checked('num', convert=int),
+        },
+        users={'support': ('support_id', 'SUP')},
+        parent=('contract_id', Contract, Contract.contract_id, {'customer_id': Contract.customer_id},
+                Contract.state == 'S', WRITE),
+        defaults=event_defaults),
+}
+
+
+class ImportBase:
+    """
+    Classe pour l'import en masse de clients, de contrats et d'évènements à partir d'un fichier CSV.
+
+    Le fichier est lu en flux, par lots de IMPORT_CHUNK_SIZE lignes : la mémoire utilisée ne dépend
+    pas de la taille du fichier. Chaque ligne est contrôlée avec les règles de views/regexformat.py,
+    les noms d'utilisateur sont résolus par un cache chargé une fois par rôle, et les éléments
+    parents (client, contrat) d'un lot sont vérifiés en une requête. Les lignes valides d'un lot
+    sont chargées dans une transaction, par COPY sur PostgreSQL et par un INSERT multi-lignes
+    (executemany) sur les autres moteurs. Les lignes rejetées sont écrites dans un fichier d'erreurs.
+    """
+
+    def __init__(self, session):
+        """
+        Initialise la classe ImportBase avec une session SQLAlchemy.
+
+        Paramètres :
+        ------------
+        session : Session
+            La session SQLAlchemy pour interagir avec la base de données.
+        """
+        self.session = session
+        self.current_user = None
+        self.usernames = {}
+
+    def user_ids(self, session, role):
+        """
+        Retourne les identifiants des employés actifs d'un rôle, indexés par nom d'utilisateur.
+
+        Les employés sont servis par le cache de référence (aucune requête s'il est chargé).
+        """
+        if role not in self.usernames:
+            self.usernames[role] = {user.username: user.epicuser_id for user in directory.users(session, role)}
+        return self.usernames[role]
+
+    def validate(self, session, spec, row, now):
+        """
+        Contrôle une ligne du fichier et retourne les valeurs à insérer.
+
+        Exceptions :
+        ------------
+        ValueError : Si une colonne est invalide ou si un employé référencé est introuvable.
+        """
+        values = {field: check(field, row.get(field)) for field, check in spec.fields.items()}
+        for field, (column, role) in spec.users.items():
+            username = (row.get(field) or '').strip()
+            if username:
+                user_id = self.user_ids(session, role).get(username)
+                if user_id is None:
+                    raise ValueError(f"{field} : employé {username} introuvable ou inactif")
+                values[column] = user_id
+            elif role == 'COM' and self.current_user.role == 'COM':
+                # Un commercial importe ses propres clients
+                values[column] = self.current_user.epicuser_id
+            else:
+                values[column] = None
+        if spec.defaults:
+            spec.defaults(values, now)
+        return values
+
+    def resolve_parents(self, session, spec, valid):
+        """
+        Complète les lignes valides d'un lot avec les colonnes de leur parent, lu en une requête.
+
+        Retourne :
+        ----------
+        tuple : (lignes dont le parent est trouvé, lignes rejetées avec leur message).
+        """
+        if spec.parent is None:
+            return valid, []
+        field, entity, key, columns, criterion, action = spec.parent
+        query = session.query(key, *columns.values()).filter(key.in_({values[field] for _, _, values in valid}))
+        if criterion is not None:
+            query = query.filter(criterion)
+        parents = {row[0]: row[1:] for row in scope(query, entity, self.current_user, action)}
+        found, rejected = [], []
+        for line, row, values in valid:
+            parent = parents.get(values[field])
+            if parent is None:
+                rejected.append((line, row, f"{field} : {values[field]} introuvable ou non autorisé"))
+                continue
+            values.update(zip(columns, parent))
+            found.append((line, row, values))
+        return found, rejected
+
+    @staticmethod
+    def load(session, table, rows):
+        """
+        Insère des lignes dans une table : COPY sur PostgreSQL, INSERT multi-lignes sinon.
+
+        Sur SQLite, les valeurs sont passées telles quelles au pilote (dates et montants convertis en texte),
+        sans le traitement ligne par ligne des types SQLAlchemy. La transaction est laissée
+        ouverte ; l'appelant la valide ou l'annule.
+
+        Retourne :
+        ----------
+        list : Les clés primaires des lignes insérées, dans l'ordre, ou None si elles ne sont pas connues.
+        """
+        columns = list(rows[0])
+        key = table.primary_key.columns[0]
+        dialect = session.get_bind().dialect.name
+        if dialect == 'sqlite':
+            texts = [column for column in columns if isinstance(rows[0][column], (datetime, Decimal))]
+            for row in rows:
+                for column in texts:
+                    if row[column] is not None:
+                        row[column] = str(row[column])
+            values = itemgetter(*columns)
+            connection = session.connection()
+            connection.exec_driver_sql(
+                f"INSERT INTO {table.name} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                [values(row) for row in rows])
+            # Un seul écrivain à la fois sur SQLite : les clés attribuées sont consécutives
+            last = connection.exec_driver_sql("SELECT last_insert_rowid()").scalar()
+            return list(range(last - len(rows) + 1, last + 1))
+        if dialect != 'postgresql':
+            session.execute(insert(table), rows)
+            return None
+
+        # Identifiants réservés en une requête : séquence explicite (contrats) ou séquence de la colonne SERIAL
+        sequence = key.default.name if isinstance(key.default, Sequence) else \
+            func.pg_get_serial_sequence(table.name, key.name)
+        ids = session.scalars(select(func.nextval(sequence))
+                              .select_from(func.generate_series(1, len(rows)))).all()
+        columns.append(key.name)
+        rows = [dict(row, **{key.name: value}) for row, value in zip(rows, ids)]
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([row[column] for column in columns])
+        buffer.seek(0)
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+        finally:
+            cursor.close()
+        return ids
+
+    def import_rows(self, session, name, path, errors_path=None, chunk_size=IMPORT_CHUNK_SIZE):
+        """
+        Importe les lignes d'un fichier CSV (avec en-tête), lot par lot.
+
+        Paramètres :
+        ------------
+        session : Session
+            La session SQLAlchemy.
+        name : str
+            L'entité importée : 'customers', 'contracts' ou 'events'.
+        path : str
+            Le chemin du fichier CSV.
+        errors_path : str, optionnel
+            Le fichier des lignes rejetées (par défaut : <fichier>.errors.csv), avec le numéro de
+            ligne et le motif du rejet.
+        chunk_size : int
+            Le nombre de lignes par lot (et par transaction).
+
+        Retourne :
+        ----------
+        dict : Le rapport, avec les clés 'read', 'imported', 'rejected', 'errors_path' et 'seconds'.
+        """
+        spec = IMPORTS[name]
+        errors_path = errors_path or f"{path}.errors.csv"
+        report = {'read': 0, 'imported': 0, 'rejected': 0, 'errors_path': errors_path, 'seconds': 0.0}
+        start = time.perf_counter()
+
+        with open(path, newline='', encoding='utf-8') as source, \
+                open(errors_path, 'w', newline='', encoding='utf-8') as errors:
+            reader = csv.DictReader(source)
+            rejects = csv.writer(errors)
+            rejects.writerow(['line', 'error'] + list(reader.fieldnames or []))
+
+            def reject(entries):
+                for line, row, message in entries:
+                    rejects.writerow([line, message] + [row.get(field) for field in reader.fieldnames])
+                report['rejected'] += len(entries)
+
+            rows = enumerate(reader, start=2)
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                report['read'] += len(chunk)
+                now = datetime.utcnow()
+                valid, rejected = [], []
+                for line, row in chunk:
+                    try:
+                        valid.append((line, row, self.validate(session, spec, row, now)))
+                    except ValueError as e:
+                        rejected.append((line, row, str(e)))
+                if valid:
+                    valid, missing = self.resolve_parents(session, spec, valid)
+                    rejected.extend(missing)
+                if valid:
+                    try:
+                        loaded = [values for _, _, values in valid]
+                        keys = self.load(session, spec.table, loaded)
+                        # COPY et INSERT du pilote ne passent pas par l'ORM : les lignes sont journalisées ici
+                        record_rows(session, spec.table, loaded, keys)
+                        session.commit()
+                        # COPY et INSERT du pilote ne passent pas par l'ORM : le cache est vidé ici
+                        invalidate_reports()
+                        report['imported'] += len(valid)
+                    except SQLAlchemyError as e:
+                        session.rollback()
+                        message = str(getattr(e, 'orig', None) or e).splitlines()[0]
+                        rejected.extend((line, row, message) for line, row, _ in valid)
+                reject(sorted(rejected, key=lambda entry: entry[0]))
+
+        report['seconds'] = time.perf_counter() - start
+        return report
+
+    @sentry_activate
+    @is_authenticated
+    @requires_roles('ADM', 'COM', 'Admin', 'Commercial')
+    @audited('customer.import')
+    def import_customers(self, session, path, errors_path=None, chunk_size=IMPORT_CHUNK_SIZE):
+        """
+        Importe des clients (colonnes first_name, last_name, email, phone, company_name et commercial).
+        """
+        return self.import_rows(session, 'customers', path, errors_path, chunk_size)
+
+    @sentry_activate
+    @is_authenticated
+    @requires_roles('ADM', 'GES', 'Admin', 'Gestion')
+    @audited('contract.import')
+    def import_contracts(self, session, path, errors_path=None, chunk_size=IMPORT_CHUNK_SIZE):
+        """
+        Importe des contrats (colonnes description, total_amount, customer_id et gestion).
+        """
+        return self.import_rows(session, 'contracts', path, errors_path, chunk_size)
+
+    @sentry_activate
+    @is_authenticated
+    @requires_roles('ADM', 'COM', 'Admin', 'Commercial')
+    @audited('event.import')
+    def import_events(self, session, path, errors_path=None, chunk_size=IMPORT_CHUNK_SIZE):
+        """
+        Importe des évènements (colonnes title, description, location, attendees, date_started,
+        date_ended, contract_id et support) pour des contrats signés.
+        """
+        return self.import_rows(session, 'events', path, errors_path, chunk_size)
@@ -0,0 +1,80 @@
+# Import généraux
+import os
+import sys
+from sqlalchemy.orm import joinedload, lazyload, raiseload, selectinload
+
+# Déterminez le chemin absolu du répertoire parent
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
+
+# Ajoutez le répertoire parent au PYTHONPATH
+sys.path.insert(0, parent_dir)
+
+# Import des Modèles
+from models.entities import Contract, Customer, Event
+
+# Stratégies de chargement utilisables dans les plans
+STRATEGIES = {
+    'joined': joinedload,
+    'selectin': selectinload,
+}
+
+# Plans de chargement par vue : chemins de relations et stratégie associée.
+# Les relations absentes d'un plan ne sont pas chargées par la requête.
+LOADING_PLANS = {
+    # Listes de sélection : identifiant et libellé uniquement
+    'contract_picker': (),
+    'event_picker': (),
+    # Tableaux de liste
+    'contract_list': (
+        ((Contract.customer, Customer.commercial), 'joined'),
+    ),
+    'event_list': (),
+    'customer_list': (
+        ((Customer.commercial,), 'joined'),
+    ),
+    # Panneaux de détail
+    'contract_detail': (
+        ((Contract.customer, Customer.commercial), 'joined'),
+        ((Contract.events,), 'selectin'),
+        ((Contract.paiements,), 'selectin'),
+    ),
+    'event_detail': (
+        ((Event.customer,), 'joined'),
+        ((Event.support,), 'joined'),
+    ),
+}
+
+
+def loading_plan(name, strict=False):
+    """
+    Retourne les options de chargement d'un plan nommé.
+
+    Les relations du plan sont chargées avec leur stratégie (jointure ou SELECT ... IN) ;
+    les autres relations de l'entité principale restent en chargement différé.
+
+    Paramètres :
+    ------------
+    name : str
+        Le nom du plan (voir LOADING_PLANS).
+    strict : bool
+        Si True, l'accès à une relation absente du plan lève une exception au lieu
+        d'émettre une requête (utile pour vérifier une vue).
+
+    Retourne :
+    ----------
+    list : Les options à passer à `Query.options`.
+
+    Exceptions :
+    ------------
+    KeyError :
+        Levée si le plan n'existe pas.
+    """
+    options = []
+    for path, strategy in LOADING_PLANS[name]:
+        loader = STRATEGIES[strategy](path[0])
+        for attribute in path[1:]:
+            loader = getattr(loader, strategy + 'load')(attribute)
+        options.append(loader)
+    options.append(raiseload('*') if strict else lazyload('*'))
+    return options
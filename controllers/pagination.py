@@ -0,0 +1,142 @@
+# Import généraux
+import os
+import sys
+from sqlalchemy import tuple_
+
+# Déterminez le chemin absolu du répertoire parent
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
+
+# Ajoutez le répertoire parent au PYTHONPATH
+sys.path.insert(0, parent_dir)
+
+# Import des Modèles
+from models.read_models import fetch
+
+# Import des Vues
+from views.data_view import DataView
+
+# Nombre de lignes par page des listes
+PAGE_SIZE = 25
+
+
+class KeysetPager:
+    """
+    Pagination par clé d'une requête de lignes (modèles de lecture).
+
+    Chaque page est lue par une requête `WHERE (tri, id) > (dernière clé) ORDER BY tri, id LIMIT n` :
+    avec un index sur les colonnes de tri, le coût d'une page ne dépend pas de sa position
+    dans la table, contrairement à OFFSET.
+    """
+
+    def __init__(self, query, row_type, order_by, key_fields, page_size=PAGE_SIZE):
+        """
+        Initialise le pager.
+
+        Paramètres :
+        ------------
+        query : Query
+            La requête des colonnes de la liste, sans tri.
+        row_type : NamedTuple
+            Le type des lignes retournées.
+        order_by : list
+            Les colonnes de tri ; la dernière doit être unique (identifiant).
+        key_fields : list
+            Les champs de `row_type` contenant les valeurs des colonnes de tri.
+        page_size : int
+            Le nombre de lignes par page.
+        """
+        self.query = query
+        self.row_type = row_type
+        self.order_by = list(order_by)
+        self.key_fields = list(key_fields)
+        self.page_size = page_size
+        self.page_number = 0
+        self.rows = []
+        self.has_next = False
+        self.has_previous = False
+
+    def _key(self, row):
+        """
+        Retourne la clé de tri d'une ligne.
+        """
+        return tuple(getattr(row, field) for field in self.key_fields)
+
+    def _fetch(self, after=None, before=None):
+        """
+        Lit une page après (ou avant) une clé, et une ligne de plus pour savoir s'il reste des lignes.
+        """
+        query = self.query
+        columns = tuple_(*self.order_by)
+        if after is not None:
+            query = query.filter(columns > tuple_(*after))
+            order = self.order_by
+        elif before is not None:
+            query = query.filter(columns < tuple_(*before))
+            order = [column.desc() for column in self.order_by]
+        else:
+            order = self.order_by
+        rows = fetch(self.row_type, query.order_by(*order).limit(self.page_size + 1))
+        more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if before is not None:
+            rows.reverse()
+        return rows, more
+
+    def first(self):
+        """
+        Retourne la première page.
+        """
+        self.rows, self.has_next = self._fetch()
+        self.has_previous = False
+        self.page_number = 1
+        return self.rows
+
+    def next(self):
+        """
+        Retourne la page suivante (la page courante s'il n'y en a pas).
+        """
+        if not self.has_next:
+            return self.rows
+        self.rows, self.has_next = self._fetch(after=self._key(self.rows[-1]))
+        self.has_previous = True
+        self.page_number += 1
+        return self.rows
+
+    def previous(self):
+        """
+        Retourne la page précédente (la page courante s'il n'y en a pas).
+        """
+        if not self.has_previous:
+            return self.rows
+        self.rows, self.has_previous = self._fetch(before=self._key(self.rows[0]))
+        self.has_next = True
+        self.page_number -= 1
+        return self.rows
+
+
+def browse(pager, display):
+    """
+    Affiche une liste page par page, avec navigation vers la page suivante ou précédente.
+
+    Seule la page courante est lue et affichée : le temps d'affichage de la première page
+    ne dépend pas de la taille de la table. Si la première page a déjà été lue, elle n'est
+    pas relue.
+
+    Paramètres :
+    ------------
+    pager : KeysetPager
+        Le pager de la liste.
+    display : callable
+        La méthode d'affichage d'une page, appelée avec les lignes et le numéro de page.
+    """
+    rows = pager.rows if pager.page_number else pager.first()
+    while True:
+        display(rows, page=pager.page_number)
+        choice = DataView.prompt_page_navigation(pager.has_previous, pager.has_next)
+        if choice == 'next':
+            rows = pager.next()
+        elif choice == 'previous':
+            rows = pager.previous()
+        else:
+            return
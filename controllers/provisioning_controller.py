@@ -0,0 +1,216 @@
+# Import généraux
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+
+# Import Modèles
+from models.entities import EpicUser
+
+# Import Controllers
+from controllers.decorator import is_authenticated, requires_roles, sentry_activate
+from controllers.security import get_password_hasher, hash_password
+from controllers.user_controller import EpicUserBase
+
+# Nombre maximal de tentatives d'insertion du lot en cas de conflit de noms
+INSERT_ATTEMPTS = 3
+
+
+class ProvisioningBase:
+    """
+    Classe pour la création en masse d'utilisateurs à partir d'un fichier CSV ou JSONL.
+
+    Les mots de passe sont hachés en parallèle sur un pool de processus, les noms d'utilisateur
+    et les emails sont attribués pour tout le lot en quelques requêtes (voir
+    `EpicUser.allocate_identities`), et les utilisateurs sont insérés dans une seule transaction.
+    """
+
+    REQUIRED_FIELDS = ('first_name', 'last_name', 'password', 'role')
+
+    def __init__(self, session):
+        """
+        Initialise la classe ProvisioningBase avec une session SQLAlchemy.
+
+        Paramètres :
+        ------------
+        session : Session
+            La session SQLAlchemy pour interagir avec la base de données.
+        """
+        self.session = session
+        self.current_user = None
+
+    @staticmethod
+    def read_employees(path):
+        """
+        Lit les employés d'un fichier CSV (avec en-tête) ou JSONL.
+
+        Paramètres :
+        ------------
+        path : str
+            Le chemin du fichier. L'extension '.jsonl' sélectionne le format JSON Lines,
+            toute autre extension le format CSV.
+
+        Retourne :
+        ----------
+        list : Liste de tuples (numéro de ligne, dictionnaire des données de l'employé).
+        """
+        with open(path, newline='', encoding='utf-8') as f:
+            if path.endswith('.jsonl'):
+                return [(number, json.loads(line)) for number, line in enumerate(f, start=1) if line.strip()]
+            return [(number, row) for number, row in enumerate(csv.DictReader(f), start=2)]
+
+    @staticmethod
+    def hash_passwords(passwords, workers=None):
+        """
+        Hache une liste de mots de passe, en parallèle sur un pool de processus.
+
+        Paramètres :
+        ------------
+        passwords : list
+            Les mots de passe en clair.
+        workers : int, optionnel
+            Nombre de processus (par défaut : nombre de cœurs). Avec 1, le hachage
+            est effectué dans le processus courant.
+
+        Retourne :
+        ----------
+        list : Les hachages, dans l'ordre des mots de passe.
+        """
+        hasher = get_password_hasher()
+        params = {
+            'time_cost': hasher.time_cost,
+            'memory_cost': hasher.memory_cost,
+            'parallelism': hasher.parallelism,
+            'hash_len': hasher.hash_len,
+            'salt_len': hasher.salt_len,
+        }
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(passwords) < 2:
+            return [hasher.hash(password) for password in passwords]
+
+        chunksize = max(1, len(passwords) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(hash_password, passwords, [params] * len(passwords), chunksize=chunksize))
+
+    @classmethod
+    def validate(cls, data):
+        """
+        Vérifie les données d'un employé et retourne ses champs obligatoires et son code de rôle.
+
+        Les valeurs sont converties en texte (une ligne JSONL peut contenir des nombres).
+
+        Retourne :
+        ----------
+        tuple : (champs obligatoires en texte, code du rôle).
+
+        Exceptions :
+        ------------
+        ValueError : Si la ligne n'est pas un objet, si un champ obligatoire est absent ou si le rôle est invalide.
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Ligne invalide : un objet est attendu")
+        values = {field: '' if data.get(field) is None else str(data[field]) for field in cls.REQUIRED_FIELDS}
+        missing = [field for field, value in values.items() if not value.strip()]
+        if missing:
+            raise ValueError(f"Champs manquants : {', '.join(missing)}")
+        role = values['role'].strip()
+        role_code = EpicUserBase.get_rolecode(role) or role.upper()
+        if role_code not in dict(EpicUser.EPIC_ROLES):
+            raise ValueError(f"Rôle invalide : {role}")
+        return values, role_code
+
+    @classmethod
+    def insert_users(cls, session, rows, workers=None):
+        """
+        Crée les utilisateurs valides du lot dans une seule transaction.
+
+        Paramètres :
+        ------------
+        session : Session
+            La session SQLAlchemy.
+        rows : list
+            Liste de tuples (numéro de ligne, données de l'employé).
+        workers : int, optionnel
+            Nombre de processus utilisés pour le hachage.
+
+        Retourne :
+        ----------
+        list : Le rapport, une entrée par ligne avec les clés 'line', 'username', 'status' et 'message'.
+        """
+        report = []
+        valid = []
+        for line, data in rows:
+            try:
+                valid.append((line, *cls.validate(data)))
+            except ValueError as e:
+                report.append({'line': line, 'username': '', 'status': 'error', 'message': str(e)})
+
+        if not valid:
+            return report
+
+        people = [(data['first_name'].strip(), data['last_name'].strip()) for _, data, _ in valid]
+        hashes = cls.hash_passwords([data['password'] for _, data, _ in valid], workers)
+
+        error = None
+        for _ in range(INSERT_ATTEMPTS):
+            # Les noms sont recalculés à chaque tentative si un autre processus en a pris entre-temps
+            identities = EpicUser.allocate_identities(session, people)
+            values = [
+                {
+                    'first_name': first_name,
+                    'last_name': last_name,
+                    'username': username,
+                    'email': email,
+                    'password': password_hash,
+                    'role': role_code,
+                    'state': 'A',
+                }
+                for (_, _, role_code), (first_name, last_name), (username, email), password_hash
+                in zip(valid, people, identities, hashes)
+            ]
+            try:
+                session.execute(insert(EpicUser), values)
+                session.commit()
+                error = None
+                break
+            except IntegrityError as e:
+                session.rollback()
+                error = e
+            except Exception as e:
+                session.rollback()
+                error = e
+                break
+
+        if error is not None:
+            report.extend({'line': line, 'username': username, 'status': 'error',
+                           'message': str(error.__cause__ or error)}
+                          for (line, _, _), (username, _) in zip(valid, identities))
+        else:
+            report.extend({'line': line, 'username': username, 'status': 'created', 'message': ''}
+                          for (line, _, _), (username, _) in zip(valid, identities))
+        return sorted(report, key=lambda entry: entry['line'])
+
+    @sentry_activate
+    @is_authenticated
+    @requires_roles('ADM', 'GES', 'Admin', 'Gestion')
+    def provision_users(self, session, path, workers=None):
+        """
+        Crée en masse les utilisateurs décrits dans un fichier CSV ou JSONL.
+
+        Paramètres :
+        ------------
+        session : Session
+            La session SQLAlchemy.
+        path : str
+            Le chemin du fichier des employés (colonnes first_name, last_name, password, role).
+        workers : int, optionnel
+            Nombre de processus utilisés pour le hachage.
+
+        Retourne :
+        ----------
+        list : Le rapport ligne par ligne.
+        """
+        return self.insert_users(session, self.read_employees(path), workers)
+
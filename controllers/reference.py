@@ -0,0 +1,132 @@
+# Import généraux
+import os
+import sys
+import time
+from itertools import chain
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Déterminez le chemin absolu du répertoire parent
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
+
+# Ajoutez le répertoire parent au PYTHONPATH
+sys.path.insert(0, parent_dir)
+
+# Import des Modèles
+from models.entities import EpicUser
+from models.read_models import UserRef, fetch
+
+# Durée de validité du cache (écritures faites par d'autres processus)
+REFERENCE_CACHE_TTL = 300
+
+
+class UserDirectory:
+    """
+    Cache en mémoire des employés, indexé par identifiant, par nom d'utilisateur et par rôle.
+
+    Les employés sont peu nombreux et changent rarement : ils sont lus en une seule requête,
+    puis servis sans aller-retour avec la base (listes de sélection, affectations). Le cache
+    est vidé dès qu'un employé est créé, modifié ou supprimé dans le processus (voir les
+    écouteurs `after_flush` et `do_orm_execute` ci-dessous), et au plus tard après
+    REFERENCE_CACHE_TTL secondes.
+    """
+
+    def __init__(self):
+        self.bind = None
+        self.expires = 0
+        self.by_id = {}
+        self.by_username = {}
+        self.by_role = {}
+
+    @property
+    def loaded(self) -> bool:
+        """
+        Indique si le cache est chargé et encore valide.
+        """
+        return self.expires > time.monotonic()
+
+    def invalidate(self):
+        """
+        Vide le cache : il sera relu à la prochaine consultation.
+        """
+        self.expires = 0
+
+    def load(self, session):
+        """
+        Charge le cache s'il est vide, expiré ou lu dans une autre base (une requête).
+        """
+        bind = session.get_bind()
+        if self.loaded and self.bind is bind:
+            return
+        self.bind = bind
+        users = sorted(fetch(UserRef, UserRef.query(session)), key=lambda user: user.username)
+        self.by_id = {user.epicuser_id: user for user in users}
+        self.by_username = {user.username: user for user in users}
+        self.by_role = {}
+        for user in users:
+            self.by_role.setdefault((user.role, user.state), []).append(user)
+        self.expires = time.monotonic() + REFERENCE_CACHE_TTL
+
+    def users(self, session, role, state='A'):
+        """
+        Retourne les employés d'un rôle et d'un état, par nom d'utilisateur.
+
+        Paramètres :
+        ------------
+        session : Session
+            La session SQLAlchemy (utilisée seulement pour charger le cache).
+        role : str
+            Le code du rôle : 'COM', 'GES', 'SUP' ou 'ADM'.
+        state : str
+            Le code de l'état : 'A' (actif) ou 'I' (inactif).
+
+        Retourne :
+        ----------
+        list : Les employés (UserRef).
+        """
+        self.load(session)
+        return self.by_role.get((role, state), [])
+
+    def get(self, session, epicuser_id):
+        """
+        Retourne l'employé d'un identifiant, ou None.
+        """
+        self.load(session)
+        return self.by_id.get(epicuser_id)
+
+    def find(self, session, username, role=None, state='A'):
+        """
+        Retourne l'employé d'un nom d'utilisateur (du rôle et de l'état demandés), ou None.
+        """
+        self.load(session)
+        user = self.by_username.get(username)
+        if user is None or (role is not None and user.role != role) or (state is not None and user.state != state):
+            return None
+        return user
+
+
+# Cache partagé par les contrôleurs et les terminaux du processus
+directory = UserDirectory()
+
+
+@event.listens_for(Session, 'after_flush')
+def _invalidate_on_flush(session, flush_context):
+    """
+    Vide le cache quand un employé est créé, modifié ou supprimé par l'ORM.
+    """
+    if directory.loaded and any(isinstance(instance, EpicUser)
+                                for instance in chain(session.new, session.dirty, session.deleted)):
+        directory.invalidate()
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _invalidate_on_bulk_write(orm_execute_state):
+    """
+    Vide le cache après un INSERT, UPDATE ou DELETE ensembliste sur les employés (création en masse).
+    """
+    if directory.loaded and (orm_execute_state.is_insert or orm_execute_state.is_update
+                             or orm_execute_state.is_delete):
+        mapper = orm_execute_state.bind_mapper
+        if mapper is None or issubclass(mapper.class_, EpicUser):
+            directory.invalidate()
@@ -0,0 +1,198 @@
+# Import généraux
+import os
+import sys
+import time
+from decimal import Decimal
+from itertools import chain
+from sqlalchemy import String, case, cast, event, func, literal, tuple_
+from sqlalchemy.orm import Session, aliased
+
+# Déterminez le chemin absolu du répertoire parent
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
+
+# Ajoutez le répertoire parent au PYTHONPATH
+sys.path.insert(0, parent_dir)
+
+# Import des Controllers
+from controllers.decorator import is_authenticated, requires_roles, sentry_activate
+from controllers.scope import READ, scope
+
+# Import des Modèles
+from models.entities import Contract, Customer, EpicUser, Paiement
+from models.read_models import ReportRow
+
+# Durée de validité d'un rapport en cache (écritures faites par d'autres processus)
+REPORT_CACHE_TTL = 300
+
+# Rapports disponibles
+REPORTS = ('commercial', 'customer', 'month')
+
+# Entités dont l'écriture modifie les rapports
+REPORTED = (Contract, Customer, Paiement)
+
+# Rapports calculés : (rapport, identifiant de l'utilisateur pour --mine ou None) -> (expiration, lignes)
+_cache = {}
+
+
+def invalidate_reports():
+    """
+    Vide le cache des rapports (après une écriture de contrat, de client ou de paiement).
+    """
+    _cache.clear()
+
+
+@event.listens_for(Session, 'after_flush')
+def _invalidate_on_flush(session, flush_context):
+    """
+    Vide le cache des rapports quand un contrat, un client ou un paiement est écrit par l'ORM.
+    """
+    if _cache and any(isinstance(instance, REPORTED)
+                      for instance in chain(session.new, session.dirty, session.deleted)):
+        invalidate_reports()
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _invalidate_on_bulk_write(orm_execute_state):
+    """
+    Vide le cache des rapports après un INSERT, UPDATE ou DELETE ensembliste (réaffectations, imports).
+    """
+    if _cache and (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        invalidate_reports()
+
+
+def month_of(session, column):
+    """
+    Retourne l'expression SQL du mois (AAAA-MM) d'une date.
+    """
+    if session.get_bind().dialect.name == 'postgresql':
+        return func.to_char(column, 'YYYY-MM')
+    return func.strftime('%Y-%m', column)
+
+
+def contract_totals():
+    """
+    Retourne les agrégats des contrats : nombre, chiffre d'affaires signé, encaissé et restant dû.
+
+    L'encaissé est la part payée du montant total (total - restant dû) ; le restant dû ne
+    concerne que les contrats signés.
+    """
+    signed = Contract.state == 'S'
+    remaining = func.coalesce(Contract.remaining_amount, 0)
+    return (func.count(Contract.contract_id),
+            func.coalesce(func.sum(case((signed, Contract.total_amount), else_=0)), 0),
+            func.coalesce(func.sum(Contract.total_amount - remaining), 0),
+            func.coalesce(func.sum(case((signed, remaining), else_=0)), 0))
+
+
+def report_query(session, name):
+    """
+    Retourne la requête d'un rapport, avant regroupement : (colonnes du groupe, agrégats, requête).
+
+    Paramètres :
+    ------------
+    session : Session
+        La session SQLAlchemy.
+    name : str
+        Le rapport : 'commercial', 'customer' ou 'month'.
+    """
+    if name == 'month':
+        month = month_of(session, Paiement.date_amount)
+        totals = (func.count(Paiement.paiement_id), literal(None), func.coalesce(func.sum(Paiement.amount), 0),
+                  literal(None))
+        query = session.query(month, month, *totals).join(Contract, Paiement.contract_id == Contract.contract_id)
+        return (month, month), query
+
+    if name == 'commercial':
+        commercial = aliased(EpicUser, name='commercial')
+        key, label = cast(Customer.commercial_id, String), commercial.username
+        query = (session.query(key, label, *contract_totals())
+                 .join(Customer, Contract.customer_id == Customer.customer_id)
+                 .outerjoin(commercial, Customer.commercial_id == commercial.epicuser_id))
+        return (key, label), query
+
+    key, label = cast(Customer.customer_id, String), Customer.company_name
+    query = (session.query(key, label, *contract_totals())
+             .join(Customer, Contract.customer_id == Customer.customer_id))
+    return (key, label), query
+
+
+def total_row(rows):
+    """
+    Retourne la ligne de total de lignes de rapport (moteurs sans ROLLUP).
+    """
+    def total(field):
+        values = [getattr(row, field) for row in rows]
+        return None if rows and values[0] is None else sum(values, Decimal(0))
+
+    return ReportRow(None, None, sum(row.count for row in rows), total('signed'), total('collected'),
+                     total('outstanding'), True)
+
+
+class ReportBase:
+    """
+    Rapports financiers calculés par la base de données : chiffre d'affaires signé, montants
+    encaissés et restant dû, par commercial, par client ou par mois.
+
+    Chaque rapport est une seule requête GROUP BY (avec ROLLUP pour la ligne de total sur
+    PostgreSQL) ; les montants sont des décimaux exacts. Les rapports sont conservés en cache
+    jusqu'à la prochaine écriture d'un contrat, d'un client ou d'un paiement.
+    """
+
+    def __init__(self, session):
+        """
+        Initialise la classe ReportBase avec une session SQLAlchemy.
+
+        Paramètres :
+        ------------
+        session : Session
+            La session SQLAlchemy pour interagir avec la base de données.
+        """
+        self.session = session
+        self.current_user = None
+
+    def rows(self, session, name, mine=False):
+        """
+        Retourne les lignes d'un rapport, suivies de la ligne de total (depuis le cache si possible).
+
+        Paramètres :
+        ------------
+        session : Session
+            La session SQLAlchemy.
+        name : str
+            Le rapport : 'commercial', 'customer' ou 'month'.
+        mine : bool
+            Si True, seuls les contrats de l'utilisateur sont pris en compte.
+
+        Retourne :
+        ----------
+        list : Les lignes (ReportRow), par libellé, la dernière étant le total.
+        """
+        key = (name, self.current_user.epicuser_id if mine else None)
+        cached = _cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        (group_key, group_label), query = report_query(session, name)
+        query = scope(query, Contract, self.current_user, READ, mine=mine)
+        if session.get_bind().dialect.name == 'postgresql':
+            # Une seule requête : les groupes et la ligne de total (grouping = 1)
+            query = (query.add_columns(func.grouping(group_key))
+                     .group_by(func.rollup(tuple_(group_key, group_label)))
+                     .order_by(func.grouping(group_key), group_label))
+            rows = [ReportRow(*row[:6], bool(row[6])) for row in query]
+        else:
+            rows = [ReportRow(*row, False) for row in query.group_by(group_key, group_label).order_by(group_label)]
+            rows.append(total_row(rows))
+
+        _cache[key] = (time.monotonic() + REPORT_CACHE_TTL, rows)
+        return rows
+
+    @sentry_activate
+    @is_authenticated
+    @requires_roles('ADM', 'GES', 'COM', 'Admin', 'Gestion', 'Commercial')
+    def report(self, session, name, mine=False):
+        """
+        Retourne un rapport financier pour l'utilisateur authentifié (voir `rows`).
+        """
+        return self.rows(session, name, mine)
@@ -0,0 +1,103 @@
+# Import généraux
+import os
+import sys
+from sqlalchemy import false, select
+
+# Déterminez le chemin absolu du répertoire parent
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
+
+# Ajoutez le répertoire parent au PYTHONPATH
+sys.path.insert(0, parent_dir)
+
+# Import des Modèles
+from models.entities import Contract, Customer, Event
+
+# Actions : lecture (listes) ou modification (sélection d'un élément à modifier)
+READ = 'read'
+WRITE = 'write'
+
+
+def own_customers(user_id):
+    """
+    Retourne la sous-requête des identifiants des clients d'un commercial.
+    """
+    return select(Customer.customer_id).where(Customer.commercial_id == user_id)
+
+
+def ownership(entity, role, user_id):
+    """
+    Retourne le critère "éléments de l'utilisateur" d'une entité pour un rôle.
+
+    - Commercial : ses clients, les contrats et les évènements de ses clients.
+    - Gestion : les contrats dont il est le gestionnaire.
+    - Support : les évènements dont il est le support.
+
+    Retourne :
+    ----------
+    ColumnElement ou None : Le critère, ou None si le rôle ne possède pas d'éléments de cette entité.
+    """
+    if role == 'COM':
+        if entity is Customer:
+            return Customer.commercial_id == user_id
+        if entity is Contract:
+            return Contract.customer_id.in_(own_customers(user_id))
+        if entity is Event:
+            return Event.customer_id.in_(own_customers(user_id))
+    elif role == 'GES' and entity is Contract:
+        return Contract.gestion_id == user_id
+    elif role == 'SUP' and entity is Event:
+        return Event.support_id == user_id
+    return None
+
+
+# Critère "éléments non attribués" de chaque entité
+UNASSIGNED = {
+    Customer: lambda: Customer.commercial_id.is_(None),
+    Contract: lambda: Contract.gestion_id.is_(None),
+    Event: lambda: Event.support_id.is_(None),
+}
+
+# Rôles pouvant modifier tous les éléments d'une entité ; les autres rôles ne modifient que les leurs
+WRITE_ALL = {
+    Customer: ('ADM',),
+    Contract: ('ADM', 'GES'),
+    Event: ('ADM', 'GES'),
+}
+
+
+def scope(query, entity, user, action=READ, mine=False, unassigned=False):
+    """
+    Restreint une requête aux éléments visibles par l'utilisateur authentifié.
+
+    Les critères sont ajoutés à la clause WHERE : seules les lignes visibles sont lues.
+    La requête peut porter sur l'entité ou sur ses colonnes (modèles de lecture).
+
+    Paramètres :
+    ------------
+    query : Query
+        La requête à restreindre.
+    entity : class
+        L'entité interrogée (Customer, Contract ou Event).
+    user : EpicUser
+        L'utilisateur authentifié.
+    action : str
+        READ : tous les éléments sont visibles.
+        WRITE : seuls les éléments modifiables par l'utilisateur sont visibles.
+    mine : bool
+        Si True, seuls les éléments de l'utilisateur sont visibles (aucun s'il n'en possède pas).
+    unassigned : bool
+        Si True, seuls les éléments sans commercial, gestionnaire ou support sont visibles.
+
+    Retourne :
+    ----------
+    Query : La requête restreinte.
+    """
+    role = user.role
+    criteria = []
+    if mine or (action == WRITE and role not in WRITE_ALL[entity]):
+        criterion = ownership(entity, role, user.epicuser_id)
+        criteria.append(criterion if criterion is not None else false())
+    if unassigned:
+        criteria.append(UNASSIGNED[entity]())
+    return query.filter(*criteria) if criteria else query
@@ -0,0 +1,365 @@
+# Import généraux
+import os
+import sys
+from sqlalchemy import select
+
+# Déterminez le chemin absolu du répertoire parent
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
+
+# Ajoutez le répertoire parent au PYTHONPATH
+sys.path.insert(0, parent_dir)
+
+# Import des Controllers
+from controllers.audit import audited
+from controllers.contract_controller import ContractBase
+from controllers.customer_controller import CustomerBase
+from controllers.decorator import is_authenticated, requires_roles, sentry_activate
+from controllers.event_controller import EventBase
+from controllers.import_controller import IMPORTS
+from controllers.reference import directory
+from controllers.scope import READ, WRITE, scope
+from controllers.unit_of_work import commit
+from controllers.user_controller import EpicUserBase
+
+# Import des Modèles
+from models.entities import Contract, Customer, EpicUser, Event, escape_like
+from models.read_models import ContractRow, CustomerRow, EventRow, UserRow, fetch
+
+# Nombre de lignes lues par aller-retour lors de l'écriture d'une liste
+STREAM_BATCH_SIZE = 500
+
+
+def user_id_of(username):
+    """
+    Retourne la sous-requête de l'identifiant d'un employé à partir de son nom d'utilisateur.
+    """
+    return select(EpicUser.epicuser_id).where(EpicUser.username == username).scalar_subquery()
+
+
+def checked_values(name, data):
+    """
+    Contrôle les champs renseignés d'une entité avec les règles de l'import (views/regexformat.py).
+
+    Retourne :
+    ----------
+    dict : Les valeurs nettoyées et converties ; les champs sans règle sont inchangés.
+
+    Exceptions :
+    ------------
+    ValueError : Avec le message de la règle, si une valeur est invalide ou vide.
+    """
+    fields = IMPORTS[name].fields
+    return {key: fields[key](key, value) if key in fields else value for key, value in data.items()}
+
+
+def contains(column, value):
+    """
+    Retourne le critère "la colonne contient la valeur" (sans tenir compte de la casse).
+    """
+    return column.ilike(f'%{escape_like(value)}%', escape='\\')
+
+
+# Entités des commandes non interactives : (entité, modèle de lecture, clé primaire, tri)
+RECORDS = {
+    'customers': (Customer, CustomerRow, Customer.customer_id, (Customer.last_name, Customer.customer_id)),
+    'contracts': (Contract, ContractRow, Contract.contract_id, (Contract.contract_id,)),
+    'events': (Event, EventRow, Event.event_id, (Event.date_started, Event.event_id)),
+    'users': (EpicUser, UserRow, EpicUser.epicuser_id, (EpicUser.username,)),
+}
+
+# Filtres des listes, par entité : nom de l'option -> critère construit à partir de sa valeur
+FILTERS = {
+    'customers': {
+        'commercial': lambda value: Customer.commercial_id == user_id_of(value),
+        'company': lambda value: contains(Customer.company_name, value),
+    },
+    'contracts': {
+        'state': lambda value: Contract.state == value,
+        'paiement': lambda value: Contract.paiement_state == value,
+        'customer': lambda value: Contract.customer_id == value,
+        'gestion': lambda value: Contract.gestion_id == user_id_of(value),
+    },
+    'events': {
+        'customer': lambda value: Event.customer_id == value,
+        'contract': lambda value: Event.contract_id == value,
+        'support': lambda value: Event.support_id == user_id_of(value),
+        'after': lambda value: Event.date_started >= value,
+        'before': lambda value: Event.date_started < value,
+    },
+    'users': {
+        'role': lambda value: EpicUser.role == value,
+        'state': lambda value: EpicUser.state == value,
+    },
+}
+
+
+def record_fields(name):
+    """
+    Retourne les noms des colonnes des lignes d'une entité (en-tête CSV).
+    """
+    return RECORDS[name][1]._fields
+
+
+class ScriptBase:
+    """
+    Opérations non interactives (listes, détail, création, modification) des commandes de script.
+
+    Les opérations réutilisent les contrôleurs *Base et leurs décorateurs de rôle ; aucune
+    saisie n'est demandée. Les listes sont lues par lots et retournées sous forme de modèles
+    de lecture, prêtes à être écrites en JSON Lines ou en CSV.
+    """
+
+    def __init__(self, session):
+        """
+        Initialise la classe ScriptBase avec une session SQLAlchemy.
+
+        Paramètres :
+        ------------
+        session : Session
+            La session SQLAlchemy pour interagir avec la base de données.
+        """
+        self.session = session
+        self.current_user = None
+
+    def visible(self, session, name, action=READ, **kwargs):
+        """
+        Retourne la requête des lignes d'une entité visibles par l'utilisateur (voir `scope`).
+        """
+        entity, row_type, _, _ = RECORDS[name]
+        query = row_type.query(session)
+        return query if entity is EpicUser else scope(query, entity, self.current_user, action, **kwargs)
+
+    def row(self, session, name, key, action=READ):
+        """
+        Retourne la ligne d'un élément visible par l'utilisateur.
+
+        Exceptions :
+        ------------
+        ValueError
+            Levée si l'élément n'existe pas ou n'est pas visible par l'utilisateur.
+        """
+        _, row_type, primary_key, _ = RECORDS[name]
+        rows = fetch(row_type, self.visible(session, name, action).filter(primary_key == key))
+        if not rows:
+            raise ValueError(f"Elément {key} introuvable ou non autorisé.")
+        return rows[0]
+
+    def records(self, session, name, filters=None, mine=False, unassigned=False):
+        """
+        Retourne les lignes d'une entité visibles par l'utilisateur, lues par lots.
+
+        Paramètres :
+        ------------
+        session : Session
+            La session SQLAlchemy.
+        name : str
+            L'entité : 'customers', 'contracts', 'events' ou 'users'.
+        filters : dict
+            Les filtres (voir FILTERS) ; les valeurs None sont ignorées.
+        mine : bool
+            Si True, seuls les éléments de l'utilisateur sont retournés.
+        unassigned : bool
+            Si True, seuls les éléments sans commercial, gestionnaire ou support sont retournés.
+
+        Retourne :
+        ----------
+        iterator : Les lignes (modèles de lecture), dans l'ordre de la liste.
+        """
+        _, row_type, _, order_by = RECORDS[name]
+        kwargs = {} if name == 'users' else {'mine': mine, 'unassigned': unassigned}
+        query = self.visible(session, name, **kwargs)
+        for option, value in (filters or {}).items():
+            if value is not None:
+                query = query.filter(FILTERS[name][option](value))
+        rows = query.order_by(*order_by).yield_per(STREAM_BATCH_SIZE)
+        return (row_type(*row) for row in rows)
+
+    @sentry_activate
+    @is_authenticated
+    def list_records(self, session, name, filters=None, mine=False, unassigned=False):
+        """
+        Retourne les lignes d'une entité visibles par l'utilisateur authentifié (voir `records`).
+        """
+        return self.records(session, name, filters, mine, unassigned)
+
+    @sentry_activate
+    @is_authenticated
+    def show(self, session, name, key):
+        """
+        Retourne la ligne d'un élément visible par l'utilisateur.
+        """
+        return self.row(session, name, key)
+
+    @sentry_activate
+    @is_authenticated
+    @requires_roles('ADM', 'COM', 'Admin', 'Commercial')
+    @audited('customer.create')
+    def create_customer(self, session, data):
+        """
+        Crée un client ; un commercial devient le commercial du client.
+
+        Paramètres :
+        ------------
+        data : dict
+            Les informations du client ('commercial' : nom d'utilisateur du commercial, facultatif).
+        """
+        data = checked_values('customers', data)
+        commercial = data.pop('commercial', None)
+        if commercial:
+            user = directory.find(session, commercial, 'COM', state=None)
+            if user is None:
+                raise ValueError(f"Commercial {commercial} introuvable.")
+            data['commercial_id'] = user.epicuser_id
+        elif self.current_user.role == 'COM':
+            data['commercial_id'] = self.current_user.epicuser_id
+        customer = CustomerBase.create_customer(session, data)
+        return self.row(session, 'customers', customer.customer_id)
+
+    @sentry_activate
+    @is_authenticated
+    @requires_roles('ADM', 'GES', 'Admin', 'Gestion')
+    @audited('contract.create')
+    def create_contract(self, session, data):
+        """
+        Crée un contrat pour un client ; le commercial du contrat est celui du client.
+
+        Paramètres :
+        ------------
+        data : dict
+            'description', 'total_amount' et 'customer_id'.
+        """
+        customer = session.get(Customer, data['customer_id'])
+        if customer is None:
+            raise ValueError(f"Client {data['customer_id']} introuvable.")
+        data['commercial_id'] = customer.commercial_id
+        contract = ContractBase.create_contract(session, data)
+        return self.row(session, 'contracts', contract.contract_id)
+
+    @sentry_activate
+    @is_authenticated
+    @requires_roles('ADM', 'COM', 'Admin', 'Commercial')
+    @audited('event.create')
+    def create_event(self, session, data):
+        """
+        Crée un évènement pour un contrat signé, modifiable par l'utilisateur.
+
+        Paramètres :
+        ------------
+        data : dict
+            Les informations de l'évènement, dont 'contract_id'.
+        """
+        contract = (scope(session.query(Contract), Contract, self.current_user, WRITE)
+                    .filter(Contract.contract_id == data['contract_id'], Contract.state == 'S').first())
+        if contract is None:
+            raise ValueError(f"Contrat signé {data['contract_id']} introuvable ou non autorisé.")
+        data['customer_id'] = contract.customer_id
+        event = EventBase.create_event(data, session)
+        return self.row(session, 'events', event.event_id)
+
+    @sentry_activate
+    @is_authenticated
+    @requires_roles('ADM', 'GES', 'Admin', 'Gestion')
+    @audited('user.create')
+    def create_user(self, session, data):
+        """
+        Crée un employé ; son nom d'utilisateur et son email sont attribués automatiquement.
+
+        Paramètres :
+        ------------
+        data : dict
+            'first_name', 'last_name', 'password' et 'role' (code du rôle : COM, GES, SUP ou ADM).
+        """
+        data['role'] = dict(EpicUser.EPIC_ROLES).get(data['role'])
+        user = EpicUserBase.create_user(session, data)
+        return self.row(session, 'users', user.epicuser_id)
+
+    @sentry_activate
+    @is_authenticated
+    @requires_roles('ADM', 'COM', 'Admin', 'Commercial')
+    @audited('customer.update')
+    def update_customer(self, session, customer_id, data):
+        """
+        Modifie un client modifiable par l'utilisateur ; les valeurs sont contrôlées comme à la création.
+        """
+        data = checked_values('customers', data)
+        self.row(session, 'customers', customer_id, WRITE)
+        customer = session.get(Customer, customer_id)
+        for key, value in data.items():
+            setattr(customer, key, value)
+        commit(session)
+        return self.row(session, 'customers', customer_id)
+
+    @sentry_activate
+    @is_authenticated
+    @requires_roles('ADM', 'COM', 'Admin', 'Commercial')
+    @audited('contract.update')
+    def update_contract(self, session, contract_id, data):
+        """
+        Modifie un contrat modifiable par l'utilisateur.
+        """
+        self.row(session, 'contracts', contract_id, WRITE)
+        if 'total_amount' in data:
+            data['remaining_amount'] = data['total_amount']
+        ContractBase.update_contract(contract_id, data, session)
+        return self.row(session, 'contracts', contract_id)
+
+    @sentry_activate
+    @is_authenticated
+    @requires_roles('ADM', 'GES', 'SUP', 'Admin', 'Gestion', 'Support')
+    @audited('event.update')
+    def update_event(self, session, event_id, data):
+        """
+        Modifie un évènement modifiable par l'utilisateur.
+        """
+        self.row(session, 'events', event_id, WRITE)
+        EventBase.update_event(event_id, data, session)
+        return self.row(session, 'events', event_id)
+
+    @sentry_activate
+    @is_authenticated
+    @requires_roles('ADM', 'GES', 'Admin', 'Gestion')
+    @audited('user.update')
+    def update_user(self, session, username, data):
+        """
+        Modifie le nom ou le mot de passe d'un employé.
+        """
+        user = session.query(EpicUser).filter_by(username=username).first()
+        if user is None:
+            raise ValueError(f"Utilisateur {username} introuvable.")
+        password = data.pop('password', None)
+        for key, value in data.items():
+            setattr(user, key, value)
+        if password:
+            EpicUserBase(session).update_user(session, username, password)
+        commit(session)
+        return self.row(session, 'users', user.epicuser_id)
+
+    @sentry_activate
+    @is_authenticated
+    @requires_roles('ADM', 'GES', 'Admin', 'Gestion')
+    @audited('user.reassign')
+    def reassign_user(self, session, username, target=None, dry_run=False):
+        """
+        Réaffecte le portefeuille d'un employé à un collègue, ou à tous selon leur charge.
+
+        Paramètres :
+        ------------
+        username : str
+            L'employé dont le portefeuille est réaffecté.
+        target : str
+            Le collègue qui reçoit tout le portefeuille (None : répartition selon la charge).
+        dry_run : bool
+            Si True, la répartition est seulement calculée.
+
+        Retourne :
+        ----------
+        list : La répartition (PortfolioShare).
+        """
+        user = session.query(EpicUser).filter_by(username=username).first()
+        if user is None:
+            raise ValueError(f"Utilisateur {username} introuvable.")
+        plan = EpicUserBase(session).reassign(session, user, target, dry_run)
+        if not dry_run:
+            commit(session)
+        return plan
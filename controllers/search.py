@@ -0,0 +1,165 @@
+# Import généraux
+import os
+import re
+import sys
+from sqlalchemy import and_, case, func, or_, text
+
+# Déterminez le chemin absolu du répertoire parent
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
+
+# Ajoutez le répertoire parent au PYTHONPATH
+sys.path.insert(0, parent_dir)
+
+# Import des Controllers
+from controllers.scope import READ, scope
+from controllers.typeahead import CONTAINS_MIN_LENGTH
+
+# Import des Modèles
+from models.entities import (
+    CONTRACT_SEARCH, CUSTOMER_SEARCH, EVENT_SEARCH, SEARCH_CONFIG,
+    Contract, Customer, Event, escape_like, search_document)
+from models.read_models import SearchHit
+
+# Nombre maximal de résultats de la recherche globale
+SEARCH_LIMIT = 20
+
+
+class SearchSource:
+    """
+    Entité interrogée par la recherche globale.
+
+    Chaque source est lue par une seule requête limitée, restreinte par `scope` et triée
+    par pertinence : seules les lignes retournées sont transférées.
+    """
+
+    def __init__(self, kind, entity, key, columns, trigram_columns, fields, hit):
+        """
+        Paramètres :
+        ------------
+        kind : str
+            Le type de résultat affiché ('Client', 'Contrat' ou 'Evènement').
+        entity : class
+            L'entité interrogée.
+        key : Column
+            La clé primaire.
+        columns : tuple
+            Les colonnes du document plein texte (voir `models.entities.search_document`).
+        trigram_columns : tuple
+            Les colonnes indexées par pg_trgm, recherchées aussi par sous-chaîne.
+        fields : tuple
+            Les colonnes lues pour construire le résultat.
+        hit : callable
+            Construit le couple (libellé, détail) d'une ligne.
+        """
+        self.kind = kind
+        self.entity = entity
+        self.key = key
+        self.columns = columns
+        self.trigram_columns = trigram_columns
+        self.fields = fields
+        self.hit = hit
+
+    def postgresql_match(self, text_input, terms):
+        """
+        Retourne le critère et la pertinence sur PostgreSQL.
+
+        Le document plein texte (index GIN) est interrogé par préfixe de chaque mot ; les saisies
+        d'au moins CONTAINS_MIN_LENGTH caractères sont aussi recherchées par sous-chaîne dans
+        les colonnes trigrammes. La pertinence est le maximum du rang plein texte et de la
+        similarité trigramme.
+        """
+        document = search_document(*self.columns)
+        query = func.to_tsquery(text(SEARCH_CONFIG), ' & '.join(f'{term}:*' for term in terms))
+        criteria = [document.op('@@')(query)]
+        if len(text_input) >= CONTAINS_MIN_LENGTH:
+            pattern = f'%{escape_like(text_input)}%'
+            criteria += [column.ilike(pattern, escape='\\') for column in self.trigram_columns]
+        rank = func.greatest(func.ts_rank(document, query),
+                             *(func.similarity(column, text_input) for column in self.trigram_columns))
+        return or_(*criteria), rank
+
+    def fallback_match(self, text_input, terms):
+        """
+        Retourne le critère et la pertinence sur les autres moteurs (SQLite).
+
+        Chaque mot doit apparaître dans l'une des colonnes ; les lignes dont une colonne
+        commence par la saisie sont classées en premier.
+        """
+        criteria = and_(*(or_(*(column.ilike(f'%{escape_like(term)}%', escape='\\') for column in self.columns))
+                          for term in terms))
+        prefix = or_(*(column.ilike(f'{escape_like(text_input)}%', escape='\\') for column in self.columns))
+        return criteria, case((prefix, 1.0), else_=0.5)
+
+    def __call__(self, session, user, text_input, terms, limit, mine=False):
+        """
+        Retourne les résultats de la source, les plus pertinents en premier.
+
+        Le paramètre `mine` est celui de `scope`.
+        """
+        if session.get_bind().dialect.name == 'postgresql':
+            criteria, rank = self.postgresql_match(text_input, terms)
+        else:
+            criteria, rank = self.fallback_match(text_input, terms)
+        rank = rank.label('rank')
+        query = scope(session.query(self.key, *self.fields, rank).filter(criteria), self.entity, user, READ, mine=mine)
+        rows = query.order_by(rank.desc(), self.key).limit(limit)
+        return [SearchHit(self.kind, row[0], *self.hit(row), float(row.rank)) for row in rows]
+
+
+SOURCES = (
+    SearchSource('Client', Customer, Customer.customer_id, CUSTOMER_SEARCH,
+                 (Customer.last_name, Customer.company_name, Customer.email, Customer.phone),
+                 CUSTOMER_SEARCH,
+                 lambda row: (f"{row.first_name} {row.last_name}",
+                              f"{row.company_name} - {row.email} - {row.phone}")),
+    SearchSource('Contrat', Contract, Contract.contract_id, CONTRACT_SEARCH,
+                 (Contract.description,),
+                 (Contract.description, Contract.customer_id),
+                 lambda row: (row.description, f"Client {row.customer_id}")),
+    SearchSource('Evènement', Event, Event.event_id, EVENT_SEARCH,
+                 (Event.title, Event.location),
+                 (Event.title, Event.location, Event.date_started),
+                 lambda row: (row.title, f"{row.location or ''} - {row.date_started:%d/%m/%Y}")),
+)
+
+
+def search_terms(text_input):
+    """
+    Retourne les mots d'une saisie, en minuscules (lettres, chiffres et '_' uniquement).
+    """
+    return re.findall(r'\w+', text_input.lower())
+
+
+def search(session, user, text_input, limit=SEARCH_LIMIT, mine=False):
+    """
+    Recherche une saisie dans les clients, les contrats et les évènements.
+
+    Sont recherchés : le nom, l'entreprise, l'email et le téléphone des clients, la description
+    des contrats, le titre et le lieu des évènements. Sur PostgreSQL, la recherche utilise les
+    index plein texte et trigrammes ; sur SQLite, une recherche LIKE équivalente.
+
+    Paramètres :
+    ------------
+    session : Session
+        La session SQLAlchemy.
+    user : EpicUser
+        L'utilisateur authentifié ; seuls les éléments qu'il peut voir sont retournés.
+    text_input : str
+        La saisie de l'utilisateur.
+    limit : int
+        Le nombre maximal de résultats.
+    mine : bool
+        Si True, seuls les éléments de l'utilisateur sont recherchés (voir `scope`).
+
+    Retourne :
+    ----------
+    list : Les résultats (SearchHit), les plus pertinents en premier.
+    """
+    text_input = text_input.strip()
+    terms = search_terms(text_input)
+    if not terms:
+        return []
+    hits = [hit for source in SOURCES for hit in source(session, user, text_input, terms, limit, mine)]
+    hits.sort(key=lambda hit: -hit.rank)
+    return hits[:limit]
@@ -0,0 +1,118 @@
+# Import généraux
+import os
+import sys
+import time
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
+
+# Déterminez le chemin absolu du répertoire parent
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
+
+# Ajoutez le répertoire parent au PYTHONPATH
+sys.path.insert(0, parent_dir)
+
+# Import des Controllers
+from controllers.config import PasswordPolicy
+
+# Hacheur partagé par le processus, construit à la première utilisation
+_password_hasher = None
+# Hacheurs des processus de travail, indexés par leurs paramètres
+_worker_hashers = {}
+
+
+def get_password_hasher():
+    """
+    Retourne le hacheur Argon2 partagé, configuré à partir de la section 'argon2' de database.ini.
+
+    Retourne :
+    ----------
+    PasswordHasher : Le hacheur partagé.
+    """
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher(**PasswordPolicy().to_dict())
+    return _password_hasher
+
+
+def set_password_hasher(**params):
+    """
+    Remplace le hacheur partagé par un hacheur construit avec les paramètres fournis.
+
+    Paramètres :
+    ------------
+    **params : dict
+        Paramètres de `PasswordHasher` (time_cost, memory_cost, parallelism, hash_len, salt_len).
+        Sans paramètre, le hacheur sera reconstruit depuis la configuration au prochain appel.
+    """
+    global _password_hasher
+    _password_hasher = PasswordHasher(**params) if params else None
+
+
+def hash_password(password, params):
+    """
+    Hache un mot de passe avec les paramètres Argon2 fournis.
+
+    Fonction de module afin de pouvoir être exécutée dans un pool de processus :
+    chaque processus conserve un hacheur par jeu de paramètres.
+
+    Paramètres :
+    ------------
+    password : str
+        Le mot de passe en clair.
+    params : dict
+        Paramètres de `PasswordHasher`.
+
+    Retourne :
+    ----------
+    str : Le hachage du mot de passe.
+    """
+    key = tuple(sorted(params.items()))
+    hasher = _worker_hashers.get(key)
+    if hasher is None:
+        hasher = _worker_hashers[key] = PasswordHasher(**params)
+    return hasher.hash(password)
+
+
+def benchmark_password_hashing(candidates, rounds=5, password="benchmark-password"):
+    """
+    Mesure le coût de hachage et de vérification pour plusieurs jeux de paramètres Argon2.
+
+    Paramètres :
+    ------------
+    candidates : iterable
+        Dictionnaires de paramètres de `PasswordHasher` à évaluer.
+    rounds : int
+        Nombre de hachages et de vérifications par jeu de paramètres.
+    password : str
+        Le mot de passe utilisé pour les mesures.
+
+    Retourne :
+    ----------
+    list : Un dictionnaire par jeu de paramètres, contenant les paramètres, la durée moyenne
+    d'un hachage et d'une connexion (vérification) en millisecondes, et le nombre de hachages
+    par seconde sur un cœur.
+    """
+    results = []
+    for params in candidates:
+        hasher = PasswordHasher(**params)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            stored = hasher.hash(password)
+        hash_duration = (time.perf_counter() - start) / rounds
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            try:
+                hasher.verify(stored, password)
+            except VerifyMismatchError:
+                pass
+        verify_duration = (time.perf_counter() - start) / rounds
+
+        results.append({
+            'params': params,
+            'hash_ms': hash_duration * 1000,
+            'login_ms': verify_duration * 1000,
+            'hashes_per_second': 1 / hash_duration if hash_duration else 0.0,
+        })
+    return results
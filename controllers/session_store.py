@@ -0,0 +1,314 @@
+# Import généraux
+import getpass
+from abc import ABC, abstractmethod
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+# Déterminez le chemin absolu du répertoire parent
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
+
+# Ajoutez le répertoire parent au PYTHONPATH
+sys.path.insert(0, parent_dir)
+
+SESSION_FILE = 'session.json'
+SESSION_DB = 'session.sqlite3'
+# Intervalle (en secondes) pendant lequel une lecture est servie depuis la mémoire
+# sans vérifier si le support de stockage a été modifié par un autre processus
+REFRESH_INTERVAL = 1.0
+
+# Magasin de session utilisé par le processus, construit à la première utilisation
+_session_store = None
+
+
+class SessionStore(ABC):
+    """
+    Classe de base des magasins de session : conserve le jeton JWT de l'opérateur.
+
+    Les lectures sont servies depuis la mémoire ; le support n'est consulté qu'après une
+    écriture d'un autre processus, au plus une fois par REFRESH_INTERVAL secondes.
+    """
+
+    def __init__(self):
+        self._token = None
+        self._version = None
+        self._checked = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """
+        Retourne le jeton de session, ou None si aucune session n'est ouverte.
+        """
+        with self._lock:
+            self._refresh()
+            return self._token
+
+    def version(self):
+        """
+        Retourne une valeur qui change à chaque écriture de la session, ou None sans session.
+        """
+        with self._lock:
+            self._refresh()
+            return self._version
+
+    def save(self, token):
+        """
+        Enregistre le jeton de session.
+        """
+        with self._lock:
+            self._version = self._write(token)
+            self._token = token
+            self._checked = time.monotonic()
+
+    def clear(self):
+        """
+        Supprime la session.
+
+        Exceptions :
+        ------------
+        OSError : Si aucune session n'existe dans le support de stockage.
+        """
+        with self._lock:
+            self._token = None
+            self._version = None
+            self._checked = time.monotonic()
+            self._delete()
+
+    def _refresh(self):
+        now = time.monotonic()
+        if self._checked is not None and now - self._checked < REFRESH_INTERVAL:
+            return
+        self._checked = now
+        version = self._read_version()
+        if version is None:
+            self._token = None
+        elif version != self._version:
+            self._token = self._read()
+        self._version = version if self._token else None
+
+    @abstractmethod
+    def _read_version(self):
+        """
+        Retourne la version de la session dans le support, ou None sans session.
+        """
+
+    @abstractmethod
+    def _read(self):
+        """
+        Retourne le jeton enregistré dans le support, ou None.
+        """
+
+    @abstractmethod
+    def _write(self, token):
+        """
+        Enregistre le jeton dans le support et retourne la nouvelle version.
+        """
+
+    @abstractmethod
+    def _delete(self):
+        """
+        Supprime la session du support.
+        """
+
+
+class MemorySessionStore(SessionStore):
+    """
+    Magasin de session en mémoire, pour les processus de longue durée et les tests.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._counter = 0
+
+    def _refresh(self):
+        # La mémoire est la seule source : rien à relire
+        pass
+
+    def _read_version(self):
+        return self._version
+
+    def _read(self):
+        return self._token
+
+    def _write(self, token):
+        self._counter += 1
+        return self._counter
+
+    def _delete(self):
+        pass
+
+
+class FileSessionStore(SessionStore):
+    """
+    Magasin de session dans un fichier JSON, écrit de manière atomique.
+    """
+
+    def __init__(self, path):
+        """
+        Paramètres :
+        ------------
+        path : str
+            Le chemin du fichier de session.
+        """
+        super().__init__()
+        self.path = os.path.abspath(path)
+
+    def _read_version(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _read(self):
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f).get('token')
+        except FileNotFoundError:
+            return None
+        except json.JSONDecodeError as e:
+            print(f"Erreur de décodage JSON : {e}")
+            return None
+
+    def _write(self, token):
+        directory = os.path.dirname(self.path)
+        # Écriture dans un fichier temporaire du même répertoire puis remplacement atomique
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.session-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'token': token}, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        return self._read_version()
+
+    def _delete(self):
+        os.remove(self.path)
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    Magasin de session dans une base SQLite locale, indexé par nom de session.
+
+    Plusieurs opérateurs peuvent ainsi garder une session ouverte en même temps sur le même poste.
+    """
+
+    def __init__(self, path, name):
+        """
+        Paramètres :
+        ------------
+        path : str
+            Le chemin de la base SQLite.
+        name : str
+            Le nom de la session de l'opérateur.
+        """
+        super().__init__()
+        self.path = os.path.abspath(path)
+        self.name = name
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS epic_sessions ("
+                "name TEXT PRIMARY KEY, token TEXT NOT NULL, version INTEGER NOT NULL)")
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=5)
+
+    def _query(self, sql, *params):
+        connection = self._connect()
+        try:
+            with connection:
+                return connection.execute(sql, params).fetchone()
+        finally:
+            connection.close()
+
+    def _read_version(self):
+        row = self._query("SELECT version FROM epic_sessions WHERE name = ?", self.name)
+        return row[0] if row else None
+
+    def _read(self):
+        row = self._query("SELECT token FROM epic_sessions WHERE name = ?", self.name)
+        return row[0] if row else None
+
+    def _write(self, token):
+        row = self._query(
+            "INSERT INTO epic_sessions (name, token, version) VALUES (?, ?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET token = excluded.token, version = version + 1 "
+            "RETURNING version", self.name, token)
+        return row[0]
+
+    def _delete(self):
+        connection = self._connect()
+        try:
+            with connection:
+                deleted = connection.execute("DELETE FROM epic_sessions WHERE name = ?", (self.name,)).rowcount
+        finally:
+            connection.close()
+        if not deleted:
+            raise FileNotFoundError(f"Aucune session '{self.name}' dans {self.path}")
+
+
+def create_session_store():
+    """
+    Construit le magasin de session à partir des variables d'environnement.
+
+    EPIC_SESSION_STORE choisit le magasin ('file' par défaut, 'memory' ou 'sqlite'),
+    EPIC_SESSION_PATH son emplacement (par défaut à la racine du projet) et
+    EPIC_SESSION_NAME le nom de la session SQLite (par défaut l'utilisateur système).
+
+    Retourne :
+    ----------
+    SessionStore : Le magasin de session.
+
+    Exceptions :
+    ------------
+    ValueError : Si le type de magasin est inconnu.
+    """
+    kind = os.getenv('EPIC_SESSION_STORE', 'file').lower()
+    path = os.getenv('EPIC_SESSION_PATH')
+    if kind == 'file':
+        return FileSessionStore(path or os.path.join(parent_dir, SESSION_FILE))
+    if kind == 'memory':
+        return MemorySessionStore()
+    if kind == 'sqlite':
+        name = os.getenv('EPIC_SESSION_NAME') or getpass.getuser()
+        return SQLiteSessionStore(path or os.path.join(parent_dir, SESSION_DB), name)
+    raise ValueError(f"Magasin de session inconnu : {kind}")
+
+
+def get_session_store():
+    """
+    Retourne le magasin de session du processus.
+
+    Retourne :
+    ----------
+    SessionStore : Le magasin de session partagé.
+    """
+    global _session_store
+    if _session_store is None:
+        _session_store = create_session_store()
+    return _session_store
+
+
+def set_session_store(store):
+    """
+    Remplace le magasin de session du processus.
+
+    Paramètres :
+    ------------
+    store : SessionStore
+        Le nouveau magasin, ou None pour le reconstruire depuis l'environnement au prochain appel.
+    """
+    global _session_store
+    _session_store = store
@@ -0,0 +1,82 @@
+# Import généraux
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StepTimer:
+    """
+    Classe mesurant la durée des étapes successives d'un traitement.
+
+    Elle est utilisée pour détailler le temps de démarrage de l'application.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialise un chronomètre sans étape enregistrée.
+        """
+        self.steps = []
+
+    @contextmanager
+    def step(self, name):
+        """
+        Mesure la durée du bloc exécuté dans le contexte.
+
+        Paramètres :
+        ------------
+        name : str
+            Le libellé de l'étape mesurée.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((name, (time.perf_counter() - start) * 1000))
+
+    @property
+    def total(self):
+        """
+        Retourne la durée cumulée des étapes, en millisecondes.
+        """
+        return sum(duration for _, duration in self.steps)
+
+
+def measure_import_time(script, args=()):
+    """
+    Mesure le démarrage à froid d'un script avec `python -X importtime`.
+
+    Le script est lancé dans un nouvel interpréteur, sans cache de modules partagé
+    avec le processus courant.
+
+    Paramètres :
+    ------------
+    script : str
+        Le chemin du script à lancer (par exemple main.py).
+    args : iterable
+        Les arguments passés au script (par exemple ['--help']).
+
+    Retourne :
+    ----------
+    tuple : La durée totale du processus en millisecondes, et la liste des modules importés
+    sous forme de tuples (module, durée propre en ms, durée cumulée en ms), du plus coûteux
+    au moins coûteux en durée cumulée.
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', script, *args],
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(script)))
+    wall = (time.perf_counter() - start) * 1000
+
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        if not self_us.strip().isdigit():
+            # Ligne d'en-tête
+            continue
+        modules.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+    modules.sort(key=lambda module: module[2], reverse=True)
+    return wall, modules
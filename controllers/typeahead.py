@@ -0,0 +1,179 @@
+# Import généraux
+import os
+import sys
+from sqlalchemy import or_
+
+# Déterminez le chemin absolu du répertoire parent
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
+
+# Ajoutez le répertoire parent au PYTHONPATH
+sys.path.insert(0, parent_dir)
+
+# Import des Controllers
+from controllers.reference import directory
+from controllers.scope import READ, scope
+
+# Import des Modèles
+from models.entities import Contract, Customer, Event, escape_like
+
+# Nombre maximal de propositions affichées pendant la saisie
+TYPEAHEAD_LIMIT = 20
+# En dessous de cette longueur, la saisie est recherchée en début de valeur (préfixe)
+CONTAINS_MIN_LENGTH = 3
+
+
+def match_criteria(columns, text):
+    """
+    Retourne le critère de recherche d'une saisie dans des colonnes texte.
+
+    Les saisies courtes sont recherchées en début de valeur, les autres n'importe où dans
+    la valeur. Sur PostgreSQL, les deux formes utilisent les index trigrammes (pg_trgm).
+
+    Paramètres :
+    ------------
+    columns : list
+        Les colonnes dans lesquelles chercher.
+    text : str
+        La saisie de l'utilisateur.
+
+    Retourne :
+    ----------
+    ColumnElement : Le critère (OU sur les colonnes).
+    """
+    pattern = escape_like(text)
+    pattern = f'%{pattern}%' if len(text) >= CONTAINS_MIN_LENGTH else f'{pattern}%'
+    return or_(*(column.ilike(pattern, escape='\\') for column in columns))
+
+
+class Typeahead:
+    """
+    Source de propositions d'une liste de sélection, interrogée à chaque saisie.
+
+    Chaque appel exécute une requête limitée à TYPEAHEAD_LIMIT lignes et retourne des couples
+    (clé primaire, libellé) : la liste complète n'est jamais chargée.
+    """
+
+    def __init__(self, query, key, columns, label, order_by, limit=TYPEAHEAD_LIMIT):
+        """
+        Initialise la source de propositions.
+
+        Paramètres :
+        ------------
+        query : Query
+            La requête des colonnes (clé primaire en premier), déjà restreinte à ce que l'utilisateur peut voir.
+        key : Column
+            La clé primaire ; une saisie numérique la recherche aussi.
+        columns : list
+            Les colonnes texte recherchées.
+        label : callable
+            Construit le libellé d'une ligne.
+        order_by : list
+            Les colonnes de tri des propositions.
+        limit : int
+            Le nombre maximal de propositions.
+        """
+        self.query = query
+        self.key = key
+        self.columns = columns
+        self.label = label
+        self.order_by = order_by
+        self.limit = limit
+
+    def filter(self, *criteria):
+        """
+        Retourne une source de propositions restreinte par des critères supplémentaires.
+        """
+        return Typeahead(self.query.filter(*criteria), self.key, self.columns, self.label,
+                         self.order_by, self.limit)
+
+    def __call__(self, text):
+        """
+        Retourne les propositions correspondant à une saisie.
+
+        Paramètres :
+        ------------
+        text : str
+            La saisie de l'utilisateur (vide : premières lignes).
+
+        Retourne :
+        ----------
+        list : Les couples (clé primaire, libellé).
+        """
+        text = text.strip()
+        query = self.query
+        if text:
+            criteria = match_criteria(self.columns, text)
+            if text.isdigit():
+                criteria = or_(self.key == int(text), criteria)
+            query = query.filter(criteria)
+        rows = query.order_by(*self.order_by).limit(self.limit)
+        return [(row[0], self.label(row)) for row in rows]
+
+
+def customer_typeahead(session, user, action=READ, **kwargs):
+    """
+    Retourne la source de propositions des clients visibles par l'utilisateur.
+
+    Les paramètres `action`, `mine` et `unassigned` sont ceux de `scope`.
+    """
+    query = session.query(Customer.customer_id, Customer.first_name, Customer.last_name, Customer.company_name)
+    return Typeahead(scope(query, Customer, user, action, **kwargs), Customer.customer_id,
+                     [Customer.last_name, Customer.company_name],
+                     lambda row: f"{row.customer_id} - {row.first_name} {row.last_name} ({row.company_name})",
+                     [Customer.last_name, Customer.customer_id])
+
+
+def contract_typeahead(session, user, action=READ, **kwargs):
+    """
+    Retourne la source de propositions des contrats visibles par l'utilisateur.
+
+    Les paramètres `action`, `mine` et `unassigned` sont ceux de `scope`.
+    """
+    query = session.query(Contract.contract_id, Contract.description)
+    return Typeahead(scope(query, Contract, user, action, **kwargs), Contract.contract_id,
+                     [Contract.description],
+                     lambda row: f"{row.contract_id} - {row.description}",
+                     [Contract.contract_id])
+
+
+def event_typeahead(session, user, action=READ, **kwargs):
+    """
+    Retourne la source de propositions des évènements visibles par l'utilisateur.
+
+    Les paramètres `action`, `mine` et `unassigned` sont ceux de `scope`.
+    """
+    query = session.query(Event.event_id, Event.title)
+    return Typeahead(scope(query, Event, user, action, **kwargs), Event.event_id,
+                     [Event.title],
+                     lambda row: f"{row.event_id} - {row.title}",
+                     [Event.event_id])
+
+
+def user_typeahead(session, role):
+    """
+    Retourne la source de propositions des employés actifs d'un rôle.
+
+    Les employés sont servis par le cache de référence (voir controllers.reference) :
+    la saisie ne déclenche aucune requête. La recherche suit les règles de `match_criteria`.
+
+    Paramètres :
+    ------------
+    role : str
+        Le code du rôle ('COM', 'GES', 'SUP' ou 'ADM').
+    """
+    users = directory.users(session, role)
+
+    def search(text):
+        text = text.strip().lower()
+        matches = users
+        if text:
+            def match(value):
+                value = value.lower()
+                return text in value if len(text) >= CONTAINS_MIN_LENGTH else value.startswith(text)
+            matches = [user for user in users
+                       if match(user.username) or match(user.last_name)
+                       or (text.isdigit() and user.epicuser_id == int(text))]
+        return [(user.epicuser_id, f"{user.username} ({user.first_name} {user.last_name})")
+                for user in matches[:TYPEAHEAD_LIMIT]]
+    return search
@@ -0,0 +1,97 @@
+# Import généraux
+from contextlib import contextmanager
+from sqlalchemy.orm import scoped_session
+
+# Clé de `Session.info` marquant une unité de travail en cours ('failed' après une annulation)
+UNIT_OF_WORK = 'unit_of_work'
+
+
+class UnitOfWorkFailed(Exception):
+    """
+    Exception levée à la fin d'une unité de travail annulée par un contrôleur (voir `rollback`).
+    """
+
+
+def current_session(session):
+    """
+    Retourne la session réelle d'une session ou d'une scoped_session.
+    """
+    return session() if isinstance(session, scoped_session) else session
+
+
+def in_unit_of_work(session) -> bool:
+    """
+    Indique si une unité de travail est en cours sur la session.
+    """
+    return bool(current_session(session).info.get(UNIT_OF_WORK))
+
+
+def commit(session):
+    """
+    Valide la transaction, ou l'envoie seulement à la base (flush) dans une unité de travail.
+
+    Les contrôleurs appellent `commit` à la fin de chaque écriture : utilisés seuls, ils valident
+    comme avant ; dans une unité de travail, les identifiants générés sont disponibles (INSERT ...
+    RETURNING) et la validation est faite une seule fois, à la fin de l'action.
+    """
+    session = current_session(session)
+    if session.info.get(UNIT_OF_WORK):
+        session.flush()
+    else:
+        session.commit()
+
+
+def rollback(session):
+    """
+    Annule la transaction ; dans une unité de travail, toute l'action est annulée.
+
+    L'unité de travail est marquée en échec : les écritures faites après l'annulation ne seront
+    pas validées, l'action n'est donc jamais enregistrée à moitié.
+    """
+    session = current_session(session)
+    session.rollback()
+    if session.info.get(UNIT_OF_WORK):
+        session.info[UNIT_OF_WORK] = 'failed'
+
+
+@contextmanager
+def unit_of_work(session):
+    """
+    Regroupe les écritures d'une action utilisateur dans une seule transaction.
+
+    Dans le bloc, les `commit` des contrôleurs et des modèles ne font qu'un flush ; à la sortie,
+    la transaction est validée une seule fois. Les objets chargés sont expirés par la validation :
+    leur prochaine lecture voit les écritures des autres sessions (état d'un employé désactivé).
+    Une exception, ou une annulation faite par un contrôleur (voir `rollback`), annule toute
+    l'action. Une unité imbriquée fait partie de l'unité englobante.
+
+    Paramètres :
+    ------------
+    session : Session ou scoped_session
+        La session de l'action.
+
+    Retourne :
+    ----------
+    Session : La session réelle, utilisable dans le bloc.
+
+    Exceptions :
+    ------------
+    UnitOfWorkFailed : Si un contrôleur a annulé l'action : rien n'a été enregistré.
+    """
+    session = current_session(session)
+    if session.info.get(UNIT_OF_WORK):
+        yield session
+        return
+
+    session.info[UNIT_OF_WORK] = True
+    try:
+        yield session
+        if session.info[UNIT_OF_WORK] == 'failed':
+            session.rollback()
+            raise UnitOfWorkFailed("L'action a été annulée : aucune modification n'a été enregistrée.")
+        session.commit()
+    except BaseException:
+        session.rollback()
+        raise
+    finally:
+        session.info.pop(UNIT_OF_WORK, None)
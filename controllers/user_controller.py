@@ -1,17 +1,31 @@
 # Import généraux
+import heapq
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session, scoped_session
 
 # Import Modèles
 from models.entities import EpicUser, Contract, Event, Customer
+from models.read_models import PortfolioShare
 
 # Import Controllers
+from controllers.audit import audited
 from controllers.decorator import is_authenticated, requires_roles, sentry_activate
+from controllers.unit_of_work import commit, rollback
+from controllers.session import invalidate_principal
 
 # Import Views
 from views.console_view import console
 from views.user_view import UserView
 
 
+# Portefeuille de chaque rôle : (entité, colonne du responsable, clé primaire, libellé)
+PORTFOLIOS = {
+    'COM': (Customer, Customer.commercial_id, Customer.customer_id, 'clients'),
+    'GES': (Contract, Contract.gestion_id, Contract.contract_id, 'contrats'),
+    'SUP': (Event, Event.support_id, Event.event_id, 'évènements'),
+}
+
+
 class EpicUserBase:
     """
     Classe de base pour la gestion des utilisateurs EpicUser.
@@ -37,6 +51,7 @@ class EpicUserBase:
         return None
 
     @staticmethod
+    @audited('user.create')
     def create_user(session, data_profil):
         """
         Crée un nouvel utilisateur avec les données fournies.
@@ -56,7 +71,7 @@ class EpicUserBase:
 
         Lève :
         ------
-        ValueError : Si le rôle est invalide ou si le nom d'utilisateur existe déjà.
+        ValueError : Si le rôle est invalide ou si aucun nom d'utilisateur unique n'a pu être attribué.
         """
         role_name = data_profil.get('role')
         if role_name == 'Gestion':
@@ -70,30 +85,23 @@ class EpicUserBase:
         else:
             raise ValueError("Code de rôle invalide")
 
-        username = EpicUser.generate_unique_username(session, data_profil['first_name'], data_profil['last_name'])
-        username_dict = {'username': username}
-        data_profil.update(username_dict)
-        email = EpicUser.generate_unique_email(session, data_profil['username'])
-
-        if session.query(EpicUser).filter_by(username=username).first():
-            raise ValueError("Le nom d'utilisateur existe déjà")
-
         user = EpicUser(
             first_name=data_profil['first_name'],
             last_name=data_profil['last_name'],
-            username=username,
-            email=email,
             role=role_code
         )
         user.set_password(data_profil['password'])
-        session.add(user)
-        session.commit()
+        # Nom d'utilisateur et email uniques, recalculés si un autre processus les a pris entre-temps
+        user.assign_unique_identity(session)
+        data_profil['username'] = user.username
+        commit(session)
 
         return user
 
     @sentry_activate
     @is_authenticated
     @requires_roles('ADM', 'GES', 'Admin', 'Gestion')
+    @audited('user.update')
     def update_user(self, session, name, password=None, role=None, state=None):
         """
         Met à jour les informations d'un utilisateur existant.
@@ -128,7 +136,7 @@ class EpicUserBase:
         if password:
             user.set_password(password)
 
-        session.commit()
+        commit(session)
 
     @staticmethod
     def get_roles(self):
@@ -163,6 +171,7 @@ class EpicUserBase:
 
     @is_authenticated
     @requires_roles('ADM', 'GES', 'Admin', 'Gestion')
+    @audited('user.set_state')
     def set_activate_inactivate(self, session, username):
         """
         Définit l'utilisateur comme actif ou inactif et déclenche les réaffectations ou notifications nécessaires.
@@ -182,177 +191,177 @@ class EpicUserBase:
             return
 
         print(f"Le statut actuel de {username} est {user.state}")
-        
+
         if user.state == 'A':
             user.state = 'I'
             text = f"{user.username} est Inactif.Veuillez réaffecter les Contrats/Clients/Evènement qui lui sont associés"
             console.print(text)
-            if user.role == 'COM':
-                print(f"réaffectation rôle {user.role}")
-                self.reassign_customers(session, user)
-            elif user.role == 'GES':
-                print(f"réaffectation rôle {user.role}")
-                self.reassign_contracts(session, user)
-            elif user.role == 'SUP':
-                print(f"réaffectation rôle {user.role}")
-                self.reassign_events(session, user)
-            session.commit()
+            # Désactivation et réaffectation sont enregistrées dans la même transaction
+            self.reassign_portfolio(session, user)
+            commit(session)
 
         elif user.state == 'I':
             user.state = 'A'
             print(f"{user.username} est de nouveau Actif")
-            session.commit()
+            commit(session)
 
+        # L'état mis en cache pour le principal n'est plus fiable
+        invalidate_principal()
 
-    @sentry_activate
-    @is_authenticated
-    @requires_roles('ADM', 'GES', 'Admin', 'Gestion')
-    def reassign_customers(self, session, user):
+
+    @staticmethod
+    def portfolio_loads(session, role, excluded_id=None):
         """
-        Réaffecte les clients d'un commercial inactif à un autre commercial.
+        Retourne la charge actuelle des employés actifs d'un rôle, calculée par un seul GROUP BY.
 
         Paramètres :
         ------------
-        session (Session) : La session SQLAlchemy pour interagir avec la base de données.
-        """
-        try:
-            # Vérification que la session est une instance de SQLAlchemy Session
-            if not isinstance(session, (Session, scoped_session)):
-                text = "Erreur: l'objet session n'est pas une instance SQLAlchemy Session."
-                console.print(text, style="bold red")
-                return
-
-            # Sélection du nouveau commercial actif pour les réaffectations
-            new_commercial = session.query(EpicUser).filter_by(role='COM', state='A').all()
-
-            # Assurez-vous que prompt_user retourne un utilisateur valide
-            choice = UserView.prompt_user([g.username for g in new_commercial])  # assuming prompt_user returns the username
-            if choice == user.username:
-                texte = f"Erreur: L'utilisateur sélectionné '{choice}' est l'utilisateur que vous souhaitez "
-                texte_l2 = "supprimer/rendre inactif. Veuillez sélectionner un autre utilisateur."
-                text = texte + texte_l2
-                console.print(text, style="bold red")
-                return  # Vous pouvez également lever une exception ou afficher un message d'erreur
-            if not choice:
-                text = "Aucun commercial actif trouvé pour la réaffectation."
-                console.print(text, style="bold")
-                return
-
-            # Obtenez l'objet EpicUser correspondant au choix
-            chosen_user = session.query(EpicUser).filter_by(username=choice).first()
-            if not chosen_user:
-                text = "Le commercial sélectionné pour la réaffectation n'existe pas."
-                console.print(text, style="bold red")
-                return
-
-            customers = session.query(Customer).filter_by(commercial_id=user.epicuser_id).all()
-            for customer in customers:
-                customer.commercial_id = chosen_user.epicuser_id
-            session.commit()
-            text = "Réaffectation des clients du commercial inactif terminée."
-            console.print(text, style="bold green")
+        session (Session) : La session SQLAlchemy.
+        role (str) : Le code du rôle : COM, GES ou SUP.
+        excluded_id (int) : L'employé exclu (celui dont le portefeuille est réaffecté).
 
-        except Exception as e:
-            text = f"Erreur inattendue lors de la réaffectation des clients: {e}"
-            console.print(text, style="bold red")
+        Retourne :
+        -----------
+        list : Les triplets (epicuser_id, username, nombre d'éléments), par nom d'utilisateur.
+        """
+        entity, owner, key, _ = PORTFOLIOS[role]
+        return (session.query(EpicUser.epicuser_id, EpicUser.username, func.count(key))
+                .outerjoin(entity, owner == EpicUser.epicuser_id)
+                .filter(EpicUser.role == role, EpicUser.state == 'A', EpicUser.epicuser_id != excluded_id)
+                .group_by(EpicUser.epicuser_id, EpicUser.username)
+                .order_by(EpicUser.username)
+                .all())
 
-    @sentry_activate
-    @is_authenticated
-    @requires_roles('ADM', 'GES', 'Admin', 'Gestion')
-    def reassign_contracts(self, session, user):
+    @staticmethod
+    def reassignment_plan(loads, count, target_id=None):
         """
-        Réaffecte les contrats d'un gestionnaire inactif à un autre gestionnaire.
+        Répartit des éléments entre des employés.
+
+        Sans employé désigné, chaque élément est attribué à l'employé le moins chargé :
+        les charges sont égalisées autant que possible.
 
         Paramètres :
         ------------
-        session (Session) : La session SQLAlchemy pour interagir avec la base de données.
+        loads (list) : Les charges actuelles (voir `portfolio_loads`).
+        count (int) : Le nombre d'éléments à répartir.
+        target_id (int) : L'employé qui reçoit tous les éléments, ou None pour répartir selon la charge.
+
+        Retourne :
+        -----------
+        list : Les parts (PortfolioShare), dans l'ordre de `loads`.
         """
-        try:
-            # Vérification que la session est une instance de SQLAlchemy Session
-            if not isinstance(session, (Session, scoped_session)):
-                text = "Erreur: l'objet session n'est pas une instance SQLAlchemy Session."
-                console.print(text, style="bold red")
-                return
-
-            # Sélection du nouveau gestionnaire actif pour les réaffectations
-            new_gestion = session.query(EpicUser).filter_by(role='GES', state='A').all()
-
-            # Assurez-vous que prompt_user retourne un utilisateur valide
-            choice = UserView.prompt_user([g.username for g in new_gestion])  # assuming prompt_user returns the username
-            if choice == user.username:
-                texte = f"Erreur: L'utilisateur sélectionné '{choice}' est l'utilisateur que vous souhaitez "
-                texte_l2 = "supprimer/rendre inactif. Veuillez sélectionner un autre utilisateur."
-                text = texte + texte_l2
-                console.print(text, style="bold red")
-            if not choice:
-                text = "Aucun gestionnaire actif trouvé pour la réaffectation."
-                console.print(text, style="bold")
-                return
-
-            # Obtenez l'objet EpicUser correspondant au choix
-            chosen_user = session.query(EpicUser).filter_by(username=choice).first()
-            if not chosen_user:
-                text = "Le gestionnaire sélectionné pour la réaffectation n'existe pas."
-                console.print(text, style="bold red")
-                return
-
-            contracts = session.query(Contract).filter_by(commercial_id=user.epicuser_id).all()
-            for contract in contracts:
-                contract.gestion_id = chosen_user.epicuser_id
-
-            session.commit()
-            text = "Réaffectation des contrats du gestionnaire inactif terminée."
-            console.print(text)
+        added = {user_id: 0 for user_id, _, _ in loads}
+        if target_id is not None:
+            added[target_id] = count
+        else:
+            heap = [(load, username, user_id) for user_id, username, load in loads]
+            heapq.heapify(heap)
+            for _ in range(count):
+                load, username, user_id = heapq.heappop(heap)
+                added[user_id] += 1
+                heapq.heappush(heap, (load + 1, username, user_id))
+        return [PortfolioShare(user_id, username, load, added[user_id]) for user_id, username, load in loads]
+
+    @audited('user.reassign')
+    def reassign(self, session, user, target=None, dry_run=False):
+        """
+        Réaffecte le portefeuille d'un employé (clients, contrats ou évènements) à ses collègues actifs.
 
-        except Exception as e:
-            text = f"Erreur inattendue lors de la réaffectation des contrats: {e}"
-            console.print(text, style="bold red")
+        Les modifications sont faites par des UPDATE ensemblistes (un par collègue), sans chargement
+        des éléments ; la transaction est laissée ouverte : l'appelant la valide avec le reste de
+        l'opération (désactivation, suppression) ou l'annule.
+
+        Paramètres :
+        ------------
+        session (Session) : La session SQLAlchemy.
+        user (EpicUser) : L'employé dont le portefeuille est réaffecté.
+        target (str) : Le nom d'utilisateur du collègue qui reçoit tout le portefeuille,
+                       ou None pour répartir le portefeuille selon la charge de chacun.
+        dry_run (bool) : Si True, la répartition est calculée sans être appliquée.
+
+        Retourne :
+        -----------
+        list : La répartition (PortfolioShare) ; vide si le rôle ne possède pas de portefeuille.
+
+        Exceptions :
+        ------------
+        ValueError : Si aucun collègue actif n'est disponible ou si le collègue désigné n'en fait pas partie.
+        """
+        role = getattr(user.role, 'code', user.role)
+        if role not in PORTFOLIOS:
+            return []
+        entity, owner, key, _ = PORTFOLIOS[role]
+        loads = self.portfolio_loads(session, role, user.epicuser_id)
+        if not loads:
+            raise ValueError("Aucun collègue actif pour la réaffectation.")
+
+        owned = select(key).where(owner == user.epicuser_id)
+        if target is not None:
+            target_id = next((user_id for user_id, username, _ in loads if username == target), None)
+            if target_id is None:
+                raise ValueError(f"{target} n'est pas un collègue actif de {user.username}.")
+            count = session.scalar(select(func.count()).select_from(owned.subquery()))
+            plan = self.reassignment_plan(loads, count, target_id)
+            if not dry_run and count:
+                session.execute(update(entity).where(owner == user.epicuser_id).values({owner: target_id}))
+            return plan
+
+        # Seules les clés sont lues : chaque collègue reçoit une plage contiguë de clés
+        keys = session.scalars(owned.order_by(key)).all()
+        plan = self.reassignment_plan(loads, len(keys))
+        if not dry_run:
+            start = 0
+            for share in plan:
+                if share.added:
+                    first, last = keys[start], keys[start + share.added - 1]
+                    session.execute(update(entity)
+                                    .where(owner == user.epicuser_id, key.between(first, last))
+                                    .values({owner: share.epicuser_id}))
+                    start += share.added
+        return plan
 
     @sentry_activate
     @is_authenticated
     @requires_roles('ADM', 'GES', 'Admin', 'Gestion')
-    def reassign_events(self, session, user):
+    @audited('user.reassign')
+    def reassign_portfolio(self, session, user):
         """
-        Réaffecte les événements d'un support inactif à un autre support.
+        Réaffecte le portefeuille d'un employé inactif ou supprimé, après aperçu et confirmation.
 
-        :param session: SQLAlchemy session instance
+        L'utilisateur choisit un collègue ou la répartition selon la charge ; la répartition qui
+        en résulte est affichée avant d'être appliquée (voir `reassign`).
+
+        Paramètres :
+        ------------
+        session (Session) : La session SQLAlchemy pour interagir avec la base de données.
+        user (EpicUser) : L'employé dont le portefeuille est réaffecté.
         """
-        try:
-            # Sélection d'un nouveau support actif pour les réaffectations
-            new_support = session.query(EpicUser).filter_by(role='SUP', state='A').all()
-            choice = UserView.prompt_user([g.username for g in new_support])  # assuming prompt_user returns the username
-            if choice == user.username:
-                texte = f"Erreur: L'utilisateur sélectionné '{choice}' est l'utilisateur que vous souhaitez "
-                texte_l2 = "supprimer/rendre inactif. Veuillez sélectionner un autre utilisateur."
-                text = texte + texte_l2
-                console.print(text, style="bold red")
-            if not choice:
-                text = "Aucun support actif trouvé pour la réaffectation."
-                console.print(text, style="bold")
-                return
-
-            # Obtenez l'objet EpicUser correspondant au choix
-            choosen_user = session.query(EpicUser).filter_by(username=choice).first()
-            if not choosen_user:
-                text = "Le support sélectionné pour la réaffectation n'existe pas."
-                console.print(text, style="bold red")
-                return
-
-            events = session.query(Event).filter_by(support_id=user.epicuser_id).all()
-            for event in events:
-                event.support_id = choosen_user.epicuser_id
-
-            session.commit()
-            text = "Réaffectation des évènements du gestionnaire inactif terminée."
-            console.print(text)
+        role = getattr(user.role, 'code', user.role)
+        if role not in PORTFOLIOS:
+            return
+        label = PORTFOLIOS[role][3]
+        loads = self.portfolio_loads(session, role, user.epicuser_id)
+        if not loads:
+            console.print("Aucun collègue actif trouvé pour la réaffectation.", style="bold")
+            return
 
-        except Exception as e:
-            text = f"Erreur inattendue lors de la réaffectation des événements: {e}"
-            console.print(text, style="bold red")
+        choice = UserView.prompt_reassignment(loads)
+        if choice is None:
+            return
+        target = None if choice == UserView.BALANCE else choice
+        plan = self.reassign(session, user, target, dry_run=True)
+        UserView.display_reassignment_plan(user.username, label, plan)
+        if not any(share.added for share in plan):
+            return
+        if UserView.prompt_confirm_reassignment():
+            self.reassign(session, user, target)
+            text = f"Réaffectation des {label} de {user.username} terminée."
+            console.print(text, style="bold green")
 
     @sentry_activate
     @is_authenticated
     @requires_roles('ADM', 'GES', 'Admin', 'Gestion')
+    @audited('user.delete')
     def delete_user(self, session, choosen_user):
         """
         Supprime un utilisateur de la base de données.
@@ -387,24 +396,20 @@ class EpicUserBase:
             console.print(message, style="bold red")
             if UserView.prompt_delete_user():
 
-                if user.role.code == 'COM':
-                    self.reassign_customers(session, user)
-                elif user.role.code == 'GES':
-                    self.reassign_contracts(session, user)
-                elif user.role.code == 'SUP':
-                    self.reassign_events(session, user)
+                self.reassign_portfolio(session, user)
 
                 # Suppression de l'utilisateur
                 session.delete(user)
 
                 # Validation de la transaction
-                session.commit()
+                commit(session)
+                invalidate_principal()
                 text = f"L'utilisateur '{user.username}' (ID {user.epicuser_id}) a été supprimé avec succès."
                 console.print(text, style="bold green")
                 return True
         except Exception as e:
             # Annulation de la transaction en cas d'erreur
             if isinstance(session, Session):  # Vérification supplémentaire
-                session.rollback()
+                rollback(session)
             print(f"Erreur lors de la suppression de l'utilisateur '{choosen_user}': {e}")
             return False
@@ -1,7 +1,7 @@
 import click
+import importlib
 import os
 import sys
-import sentry_sdk
 import logging
 
 # Désactiver tous les messages sauf CRITICAL
@@ -18,10 +18,35 @@ parent_dir = os.path.abspath(os.path.join(current_dir, '../../'))
 # Ajoutez le répertoire parent au PYTHONPATH
 sys.path.insert(0, parent_dir)
 
-from cli import epic_cli
+# Sous-commandes qui n'ont besoin ni de la base de données ni de Sentry
+LIGHT_COMMANDS = {'logout', 'importtime'}
+
+
+class LazyGroup(click.Group):
+    """
+    Groupe de commandes click dont les sous-commandes sont importées à la première utilisation.
+
+    Les sous-commandes sont déclarées par leur chemin 'module:attribut' : l'aide et les commandes
+    légères (logout) n'importent ainsi ni les contrôleurs, ni SQLAlchemy, ni Sentry.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            module_name, attribute = self.lazy_subcommands[cmd_name].split(':')
+            return getattr(importlib.import_module(module_name), attribute)
+        return super().get_command(ctx, cmd_name)
 
 
 def sentry_activate():
+    import sentry_sdk
+
     sentry_sdk.init(
         dsn="https://f005574ea1d1b9036d974ac1ef6eacd1@o4507899769389056.ingest.de.sentry.io/4507899813757008",
         # Set traces_sample_rate to 1.0 to capture 100%
@@ -34,15 +59,32 @@ def sentry_activate():
     )
 
 
-@click.group(help="------ CRM EpicEvent ------")
-def main():
+@click.group(
+    cls=LazyGroup,
+    help="------ CRM EpicEvent ------",
+    lazy_subcommands={
+        'start': 'cli.epic_cli:start',
+        'logout': 'cli.epic_cli:logout',
+        'initbase': 'cli.epic_cli:initbase',
+        'benchhash': 'cli.epic_cli:benchhash',
+        'provision': 'cli.epic_cli:provision',
+        'bulkimport': 'cli.epic_cli:bulkimport',
+        'importtime': 'cli.epic_cli:importtime',
+        'search': 'cli.epic_cli:search',
+        'report': 'cli.epic_cli:report',
+        'customer': 'cli.script_cli:customer',
+        'contract': 'cli.script_cli:contract',
+        'event': 'cli.script_cli:event',
+        'user': 'cli.script_cli:user',
+        'export': 'cli.script_cli:export',
+    })
+@click.pass_context
+def main(ctx):
     """Groupe principal de commandes"""
-    pass
+    # Sentry n'est initialisé qu'au lancement réel d'une commande qui en a besoin
+    if ctx.obj and ctx.obj.get('sentry') and ctx.invoked_subcommand not in LIGHT_COMMANDS:
+        sentry_activate()
 
 
-main.add_command(epic_cli.start)
-main.add_command(epic_cli.logout)
-main.add_command(epic_cli.initbase)
 if __name__ == '__main__':
-    sentry_activate()
-    main()
+    main(obj={'sentry': True})
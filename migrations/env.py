@@ -1,3 +1,5 @@
+import os
+import sys
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
@@ -14,11 +16,33 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# add your model's MetaData object here
-# for 'autogenerate' support
-# from myapp import mymodel
-# target_metadata = mymodel.Base.metadata
-target_metadata = None
+# Ajoutez le répertoire parent au PYTHONPATH
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../'))
+sys.path.insert(0, parent_dir)
+
+from controllers.engine import config_url  # noqa: E402
+from models.entities import Base  # noqa: E402
+
+# Métadonnées des modèles, pour l'autogénération des révisions
+target_metadata = Base.metadata
+
+# Sans URL dans alembic.ini, la base est celle de database.ini
+if not config.get_main_option("sqlalchemy.url"):
+    config.set_main_option(
+        "sqlalchemy.url", config_url(os.path.join(parent_dir, 'database.ini')).replace('%', '%%'))
+
+
+def include_for(dialect_name):
+    """
+    Ignore les index réservés à un autre moteur (``ddl_if``) lors de l'autogénération.
+    """
+    def include_object(obj, name, type_, reflected, compare_to):
+        ddl_if = getattr(obj, '_ddl_if', None)
+        if type_ == "index" and ddl_if is not None and ddl_if.dialect:
+            return ddl_if.dialect == dialect_name
+        return True
+    return include_object
+
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
@@ -44,6 +68,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_for(url.split(":")[0].split("+")[0]),
     )
 
     with context.begin_transaction():
@@ -65,7 +90,10 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            render_as_batch=connection.dialect.name == "sqlite",
+            include_object=include_for(connection.dialect.name),
         )
 
         with context.begin_transaction():
@@ -0,0 +1,48 @@
+"""Index des colonnes filtrées par les listes
+
+Revision ID: 3f1c2a9d7b10
+Revises:
+Create Date: 2026-10-18 09:00:00.000000
+
+Les tables sont créées par `initbase` ; cette révision ajoute les index sur une
+base existante. Sur PostgreSQL, les index sont créés avec CREATE INDEX CONCURRENTLY
+(hors transaction) pour ne pas bloquer les écritures d'une base en service.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a9d7b10'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (nom, table, colonnes, condition de l'index partiel)
+INDEXES = (
+    ('ix_customers_commercial_id', 'customers', ['commercial_id'], None),
+    ('ix_events_contract_id', 'events', ['contract_id'], None),
+    ('ix_events_customer_id', 'events', ['customer_id'], None),
+    ('ix_events_support_id', 'events', ['support_id'], None),
+    ('ix_events_unassigned', 'events', ['date_started'], 'support_id IS NULL'),
+    ('ix_contracts_gestion_id', 'contracts', ['gestion_id'], None),
+    ('ix_contracts_commercial_state_paiement', 'contracts', ['commercial_id', 'state', 'paiement_state'], None),
+    ('ix_contracts_state_paiement', 'contracts', ['state', 'paiement_state'], None),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            condition = sa.text(where) if where else None
+            op.create_index(name, table, columns, if_not_exists=True,
+                            postgresql_concurrently=True,
+                            postgresql_where=condition, sqlite_where=condition)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,48 @@
+"""Index trigrammes des listes de sélection
+
+Revision ID: 7a4e9c2b5d31
+Revises: 3f1c2a9d7b10
+Create Date: 2026-10-18 10:00:00.000000
+
+Index GIN (pg_trgm) des colonnes recherchées pendant la saisie dans les listes de sélection.
+Ils ne concernent que PostgreSQL ; la révision ne fait rien sur les autres moteurs.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a4e9c2b5d31'
+down_revision: Union[str, None] = '3f1c2a9d7b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (nom, table, colonne)
+INDEXES = (
+    ('ix_epic_users_username_trgm', 'epic_users', 'username'),
+    ('ix_epic_users_last_name_trgm', 'epic_users', 'last_name'),
+    ('ix_customers_last_name_trgm', 'customers', 'last_name'),
+    ('ix_customers_company_name_trgm', 'customers', 'company_name'),
+    ('ix_contracts_description_trgm', 'contracts', 'description'),
+    ('ix_events_title_trgm', 'events', 'title'),
+)
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        for name, table, column in INDEXES:
+            op.create_index(name, table, [column], if_not_exists=True,
+                            postgresql_concurrently=True, postgresql_using='gin',
+                            postgresql_ops={column: 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        for name, table, column in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,63 @@
+"""Index de la recherche globale
+
+Revision ID: b52d8e0f4c17
+Revises: 7a4e9c2b5d31
+Create Date: 2026-10-18 14:00:00.000000
+
+Index GIN plein texte (to_tsvector) des clients, contrats et évènements, et index trigrammes
+des colonnes recherchées par sous-chaîne. Les expressions sont celles de
+`models.entities.search_document`. Ils ne concernent que PostgreSQL ; la révision ne fait
+rien sur les autres moteurs.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b52d8e0f4c17'
+down_revision: Union[str, None] = '7a4e9c2b5d31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (nom, table, colonne)
+TRIGRAM_INDEXES = (
+    ('ix_customers_email_trgm', 'customers', 'email'),
+    ('ix_customers_phone_trgm', 'customers', 'phone'),
+    ('ix_events_location_trgm', 'events', 'location'),
+)
+
+# (nom, table, colonnes du document plein texte)
+SEARCH_INDEXES = (
+    ('ix_customers_search', 'customers', ('first_name', 'last_name', 'company_name', 'email', 'phone')),
+    ('ix_contracts_search', 'contracts', ('description',)),
+    ('ix_events_search', 'events', ('title', 'location')),
+)
+
+
+def search_document(columns):
+    document = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+    return sa.text(f"to_tsvector('simple'::regconfig, {document})")
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        for name, table, column in TRIGRAM_INDEXES:
+            op.create_index(name, table, [column], if_not_exists=True,
+                            postgresql_concurrently=True, postgresql_using='gin',
+                            postgresql_ops={column: 'gin_trgm_ops'})
+        for name, table, columns in SEARCH_INDEXES:
+            op.create_index(name, table, [search_document(columns)], if_not_exists=True,
+                            postgresql_concurrently=True, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(SEARCH_INDEXES + TRIGRAM_INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,45 @@
+"""Montants en décimaux exacts
+
+Revision ID: d4a7e1c93b62
+Revises: b52d8e0f4c17
+Create Date: 2026-10-18 14:00:00.000000
+
+Les montants des contrats (Float) et des paiements (Integer) deviennent des NUMERIC(12, 2) :
+les totaux calculés par la base (rapports) sont exacts au centime. Les valeurs existantes
+sont arrondies au centime. Sur SQLite, les tables sont recréées (mode batch d'Alembic).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7e1c93b62'
+down_revision: Union[str, None] = 'b52d8e0f4c17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONEY = sa.Numeric(12, 2)
+
+# (table, colonne, ancien type, nullable)
+AMOUNTS = (
+    ('contracts', 'total_amount', sa.Float(), False),
+    ('contracts', 'remaining_amount', sa.Float(), True),
+    ('paiements', 'amount', sa.Integer(), True),
+)
+
+
+def upgrade() -> None:
+    for table, column, old_type, nullable in AMOUNTS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(column, type_=MONEY, existing_type=old_type, existing_nullable=nullable,
+                                  postgresql_using=f'round({column}::numeric, 2)')
+
+
+def downgrade() -> None:
+    for table, column, old_type, nullable in reversed(AMOUNTS):
+        cast = 'double precision' if isinstance(old_type, sa.Float) else 'integer'
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(column, type_=old_type, existing_type=MONEY, existing_nullable=nullable,
+                                  postgresql_using=f'{column}::{cast}')
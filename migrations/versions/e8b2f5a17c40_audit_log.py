@@ -0,0 +1,42 @@
+"""Journal d'audit
+
+Revision ID: e8b2f5a17c40
+Revises: d4a7e1c93b62
+Create Date: 2026-10-18 14:00:00.000000
+
+Table `audit_log` des écritures faites par les contrôleurs (employé, action, entité,
+modifications), alimentée par l'écrivain en arrière-plan de `controllers.audit`. L'index
+(entity, entity_id, created_at) sert l'historique d'une entité.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b2f5a17c40'
+down_revision: Union[str, None] = 'd4a7e1c93b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'audit_log',
+        sa.Column('audit_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.TIMESTAMP(), nullable=False),
+        sa.Column('actor_id', sa.Integer(), nullable=True),
+        sa.Column('actor', sa.String(length=50), nullable=True),
+        sa.Column('action', sa.String(length=50), nullable=False),
+        sa.Column('entity', sa.String(length=30), nullable=False),
+        sa.Column('entity_id', sa.String(length=50), nullable=True),
+        sa.Column('changes', sa.JSON(), nullable=True),
+        sa.PrimaryKeyConstraint('audit_id'),
+    )
+    op.create_index('ix_audit_log_entity', 'audit_log', ['entity', 'entity_id', 'created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_log_entity', table_name='audit_log')
+    op.drop_table('audit_log')
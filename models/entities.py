@@ -2,14 +2,15 @@ import os
 import sys
 from sqlalchemy import (
     ForeignKey,
-    Column, Integer, String, TIMESTAMP, Sequence, Float
+    DDL, JSON, Column, Integer, Numeric, String, TIMESTAMP, Sequence, Index, event, func, or_, text
 )
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import relationship, configure_mappers
 from sqlalchemy_utils import ChoiceType
-from sqlalchemy.sql import func
-from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 from datetime import datetime
+from decimal import Decimal
+from string import digits
 from sqlalchemy.orm import object_session
 from unidecode import unidecode
 
@@ -21,6 +22,88 @@ parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
 sys.path.insert(0, parent_dir)
 
 from config_init import Base
+from controllers.security import get_password_hasher
+from controllers.unit_of_work import commit, unit_of_work
+
+EMAIL_DOMAIN = '@epic.com'
+# Nombre de préfixes regroupés dans une même requête de recherche des noms existants
+PREFIX_CHUNK_SIZE = 500
+# Montants : décimaux exacts, au centime près
+MONEY = Numeric(12, 2)
+CENT = Decimal('0.01')
+# Configuration de la recherche plein texte : sans racinisation, les noms propres restent intacts
+SEARCH_CONFIG = "'simple'::regconfig"
+
+
+def trigram_index(name, column):
+    """
+    Retourne un index trigramme (GIN, pg_trgm) sur une colonne texte, créé uniquement sur PostgreSQL.
+
+    Il sert les recherches ILIKE 'saisie%' et ILIKE '%saisie%' des listes de sélection.
+    """
+    return Index(name, column, postgresql_using='gin',
+                 postgresql_ops={column: 'gin_trgm_ops'}).ddl_if(dialect='postgresql')
+
+
+def search_document(*columns):
+    """
+    Retourne le document plein texte (tsvector) de colonnes texte, pour PostgreSQL.
+
+    L'expression est celle des index GIN de recherche : la requête doit la reproduire à
+    l'identique pour que PostgreSQL utilise l'index.
+    """
+    document = func.coalesce(columns[0], '')
+    for column in columns[1:]:
+        document = document + ' ' + func.coalesce(column, '')
+    return func.to_tsvector(text(SEARCH_CONFIG), document)
+
+
+def search_index(name, *columns):
+    """
+    Retourne l'index GIN du document plein texte de colonnes, créé uniquement sur PostgreSQL.
+    """
+    return Index(name, search_document(*columns), postgresql_using='gin').ddl_if(dialect='postgresql')
+
+
+def money(value):
+    """
+    Convertit un montant (texte, entier, décimal ou flottant) en décimal exact au centime.
+
+    Exceptions :
+    ------------
+    decimal.InvalidOperation
+        Levée si la valeur n'est pas un nombre.
+    """
+    return Decimal(str(value).strip().replace(',', '.')).quantize(CENT)
+
+
+def escape_like(value):
+    """
+    Échappe les caractères spéciaux de LIKE ('%', '_' et '\\') dans une valeur.
+    """
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def group_by_stem(values, suffix=''):
+    """
+    Regroupe des noms par radical (nom sans suffixe fixe ni chiffres finaux).
+
+    Paramètres :
+    ------------
+    values : iterable
+        Les noms à regrouper.
+    suffix : str
+        Partie fixe retirée avant les chiffres (par exemple '@epic.com').
+
+    Retourne :
+    ----------
+    dict : Les noms, indexés par radical.
+    """
+    groups = {}
+    for value in values:
+        name = value[:len(value) - len(suffix)] if suffix and value.endswith(suffix) else value
+        groups.setdefault(name.rstrip(digits), []).append(value)
+    return groups
 
 
 class EpicUser(Base):
@@ -89,6 +172,12 @@ class EpicUser(Base):
         'polymorphic_identity': 'USR'
     }
 
+    # Recherche des employés dans les listes de sélection
+    __table_args__ = (
+        trigram_index('ix_epic_users_username_trgm', 'username'),
+        trigram_index('ix_epic_users_last_name_trgm', 'last_name'),
+    )
+
     # Relation entre les classes
     customers = relationship('Customer', back_populates='commercial')
     events = relationship('Event', back_populates='support', primaryjoin="EpicUser.epicuser_id==Event.support_id")
@@ -109,15 +198,13 @@ class EpicUser(Base):
             'state': self.state.code if hasattr(self.state, 'code') else str(self.state),
         }
 
-    @classmethod
-    def generate_unique_username(cls, session, first_name, last_name):
+    @staticmethod
+    def base_username(first_name, last_name):
         """
-        Génère un nom d'utilisateur unique à partir du prénom et du nom.
+        Calcule le nom d'utilisateur de base (initiale du prénom et nom, sans accents).
 
         Paramètres :
         ------------
-        session : Session
-            La session de la base de données en cours.
         first_name : str
             Le prénom de l'utilisateur.
         last_name : str
@@ -125,7 +212,7 @@ class EpicUser(Base):
 
         Retourne :
         ----------
-        str : Nom d'utilisateur unique généré.
+        str : Nom d'utilisateur de base, sans suffixe numérique.
         """
         first_name_normalized = unidecode(first_name)
         last_name_normalized = unidecode(last_name)
@@ -133,20 +220,99 @@ class EpicUser(Base):
         # Remplacement des espaces par des underscores dans le nom de famille
         last_name_normalized = last_name_normalized.replace(" ", "_")
 
-        base_username = f"{first_name_normalized[0].lower()}{last_name_normalized.lower()}"
-        username = base_username
-        counter = 1
+        return f"{first_name_normalized[0].lower()}{last_name_normalized.lower()}"
 
-        while session.query(cls).filter_by(username=username).first():
-            username = f"{base_username}{counter}"
-            counter += 1
-        return username
+    @staticmethod
+    def next_free_name(base, taken, suffix=''):
+        """
+        Retourne le premier nom libre de la forme base, base1, base2... à partir des noms pris.
+
+        Le suffixe numérique retenu suit le plus grand suffixe déjà utilisé.
+
+        Paramètres :
+        ------------
+        base : str
+            Le nom de base.
+        taken : iterable
+            Les noms déjà utilisés commençant par la base.
+        suffix : str
+            Partie fixe suivant le numéro (par exemple '@epic.com').
+
+        Retourne :
+        ----------
+        str : Le nom libre.
+        """
+        highest = None
+        for value in taken:
+            if not value.startswith(base) or (suffix and not value.endswith(suffix)):
+                continue
+            number = value[len(base):len(value) - len(suffix)]
+            if number == '':
+                highest = max(highest or 0, 0)
+            elif number.isdigit():
+                highest = max(highest or 0, int(number))
+        if highest is None:
+            return f"{base}{suffix}"
+        return f"{base}{highest + 1}{suffix}"
+
+    @classmethod
+    def names_like(cls, session, column, prefixes):
+        """
+        Récupère en une requête par lot de préfixes les valeurs d'une colonne commençant par ces préfixes.
+
+        Paramètres :
+        ------------
+        session : Session
+            La session de la base de données en cours.
+        column : Column
+            La colonne interrogée (username ou email).
+        prefixes : iterable
+            Les préfixes recherchés.
+
+        Retourne :
+        ----------
+        set : Les valeurs trouvées.
+        """
+        prefixes = sorted(set(prefixes))
+        found = set()
+        for start in range(0, len(prefixes), PREFIX_CHUNK_SIZE):
+            chunk = prefixes[start:start + PREFIX_CHUNK_SIZE]
+            clauses = [column.like(escape_like(prefix) + '%', escape='\\') for prefix in chunk]
+            found.update(value for (value,) in session.query(column).filter(or_(*clauses)))
+        return found
+
+    @classmethod
+    def generate_unique_username(cls, session, first_name, last_name):
+        """
+        Génère un nom d'utilisateur unique à partir du prénom et du nom.
+
+        Une seule requête récupère les noms commençant par le nom de base ; le suffixe
+        retenu suit le plus grand suffixe numérique existant.
+
+        Paramètres :
+        ------------
+        session : Session
+            La session de la base de données en cours.
+        first_name : str
+            Le prénom de l'utilisateur.
+        last_name : str
+            Le nom de famille de l'utilisateur.
+
+        Retourne :
+        ----------
+        str : Nom d'utilisateur unique généré.
+        """
+        base_username = cls.base_username(first_name, last_name)
+        taken = cls.names_like(session, EpicUser.username, [base_username])
+        return cls.next_free_name(base_username, taken)
 
     @classmethod
     def generate_unique_email(cls, session, username):
         """
         Génère une adresse e-mail unique à partir du nom d'utilisateur.
 
+        Une seule requête récupère les adresses commençant par le nom d'utilisateur.
+
         Paramètres :
         ------------
         session : Session
@@ -158,14 +324,74 @@ class EpicUser(Base):
         ----------
         str : Adresse e-mail unique générée.
         """
-        base_email = f"{username}@epic.com"
-        email = base_email
-        counter = 1
+        taken = cls.names_like(session, EpicUser.email, [username])
+        return cls.next_free_name(username, taken, suffix=EMAIL_DOMAIN)
+
+    @classmethod
+    def allocate_identities(cls, session, people):
+        """
+        Attribue un nom d'utilisateur et un email uniques à chaque nouvel utilisateur d'un lot.
 
-        while session.query(cls).filter_by(email=email).first():
-            email = f"{username}{counter}@epic.com"
-            counter += 1
-        return email
+        Les noms existants sont récupérés en une requête par lot de PREFIX_CHUNK_SIZE noms de base,
+        puis les homonymes du lot reçoivent des suffixes successifs.
+
+        Paramètres :
+        ------------
+        session : Session
+            La session de la base de données en cours.
+        people : list
+            Liste de tuples (prénom, nom).
+
+        Retourne :
+        ----------
+        list : Liste de tuples (nom d'utilisateur, email), dans l'ordre des utilisateurs.
+        """
+        bases = [cls.base_username(first_name, last_name) for first_name, last_name in people]
+        taken_usernames = group_by_stem(cls.names_like(session, EpicUser.username, bases))
+        usernames = []
+        for base in bases:
+            username = cls.next_free_name(base, taken_usernames.get(base.rstrip(digits), []))
+            taken_usernames.setdefault(base.rstrip(digits), []).append(username)
+            usernames.append(username)
+
+        taken_emails = group_by_stem(cls.names_like(session, EpicUser.email, usernames), EMAIL_DOMAIN)
+        identities = []
+        for username in usernames:
+            stem = username.rstrip(digits)
+            email = cls.next_free_name(username, taken_emails.get(stem, []), suffix=EMAIL_DOMAIN)
+            taken_emails.setdefault(stem, []).append(email)
+            identities.append((username, email))
+        return identities
+
+    def assign_unique_identity(self, session, attempts=3):
+        """
+        Attribue un nom d'utilisateur et un email uniques puis insère l'utilisateur.
+
+        L'insertion se fait dans un point de sauvegarde : si un autre processus a pris le même
+        nom entre-temps (violation de contrainte d'unicité), les noms sont recalculés et
+        l'insertion est retentée.
+
+        Paramètres :
+        ------------
+        session : Session
+            La session de la base de données en cours.
+        attempts : int
+            Nombre maximal de tentatives.
+
+        Exceptions :
+        ------------
+        ValueError : Si aucun nom libre n'a pu être inséré après toutes les tentatives.
+        """
+        for _ in range(attempts):
+            self.username = self.generate_unique_username(session, self.first_name, self.last_name)
+            self.email = self.generate_unique_email(session, self.username)
+            try:
+                with session.begin_nested():
+                    session.add(self)
+                return self
+            except IntegrityError:
+                continue
+        raise ValueError("Impossible d'attribuer un nom d'utilisateur unique")
 
     def set_password(self, password):
         """
@@ -176,8 +402,7 @@ class EpicUser(Base):
         password : str
             Le mot de passe en texte clair.
         """
-        ph = PasswordHasher()
-        self.password = ph.hash(password)
+        self.password = get_password_hasher().hash(password)
 
     def check_password(self, verification_password):
         """
@@ -192,12 +417,31 @@ class EpicUser(Base):
         ----------
         bool : True si le mot de passe correspond, False sinon.
         """
-        ph = PasswordHasher()
         try:
-            return ph.verify(self.password, verification_password)
+            return get_password_hasher().verify(self.password, verification_password)
         except VerifyMismatchError:
             return False
 
+    def rehash_password_if_needed(self, password):
+        """
+        Recalcule le hachage du mot de passe si ses paramètres ne correspondent plus à la configuration.
+
+        À appeler après une vérification réussie, lorsque le mot de passe en clair est connu.
+
+        Paramètres :
+        ------------
+        password : str
+            Le mot de passe en texte clair, déjà vérifié.
+
+        Retourne :
+        ----------
+        bool : True si le hachage a été recalculé, False sinon.
+        """
+        if get_password_hasher().check_needs_rehash(self.password):
+            self.set_password(password)
+            return True
+        return False
+
     @classmethod
     def find_by_username(cls, session, username):
         """
@@ -231,27 +475,26 @@ class EpicUser(Base):
         """
         Définit l'utilisateur comme inactif et déclenche les réaffectations ou notifications nécessaires.
         """
-        self.state = 'I'
-        session = object_session(self)
-        session.commit()
-
-        if self.role.code == 'COM':
-            self.notify_gestion_to_reassign_user()
-            self.reassign_customers()
-        elif self.role.code == 'GES':
-            self.notify_gestion_to_reassign_user()
-            self.reassign_contracts()
-        elif self.role.code == 'SUP':
-            self.notify_gestion_to_reassign_user()
-            self.reassign_events()
+        # Désactivation et réaffectation sont validées ensemble, ou annulées ensemble
+        with unit_of_work(object_session(self)):
+            self.state = 'I'
+
+            if self.role.code == 'COM':
+                self.notify_gestion_to_reassign_user()
+                self.reassign_customers()
+            elif self.role.code == 'GES':
+                self.notify_gestion_to_reassign_user()
+                self.reassign_contracts()
+            elif self.role.code == 'SUP':
+                self.notify_gestion_to_reassign_user()
+                self.reassign_events()
 
     def reassign_customers(self):
         """Réaffecte les clients du commercial inactif à un autre commercial."""
         new_commercial = self.find_alternate_commercial()
         for customer in self.customers:
             customer.commercial_id = new_commercial.epicuser_id
-        session = object_session(self)
-        session.commit()
+        commit(object_session(self))
 
         # Envoyer une notification au gestionnaire
         self.notify_gestion("Réaffectation des clients du commercial inactif terminée.")
@@ -261,8 +504,7 @@ class EpicUser(Base):
         new_gestion = self.find_alternate_gestion()
         for contract in self.contracts:
             contract.gestion_id = new_gestion.epicuser_id
-        session = object_session(self)
-        session.commit()
+        commit(object_session(self))
 
         # Envoyer une notification au gestionnaire
         self.notify_gestion("Réaffectation des contrats du gestionnaire inactif terminée.")
@@ -272,8 +514,7 @@ class EpicUser(Base):
         new_support = self.find_alternate_support()
         for event in self.events:
             event.support_id = new_support.epicuser_id
-        session = object_session(self)
-        session.commit()
+        commit(object_session(self))
 
         # Envoyer une notification au gestionnaire
         self.notify_gestion("Réaffectation des événements du support inactif terminée.")
@@ -312,24 +553,78 @@ class Admin(EpicUser):
 
 
 class Commercial(EpicUser):
+    """
+    Classe représentant un utilisateur avec le rôle de Commercial.
+
+    Le portefeuille du commercial regroupe les contrats des clients qui lui sont affectés.
+    Il est chargé en une seule requête (jointure contrats - clients) au lieu d'un
+    chargement par client.
+
+    Relations :
+    -----------
+    portfolio_contracts : relationship
+        Contrats des clients du commercial (lecture seule).
+    """
 
     __mapper_args__ = {
         'polymorphic_identity': 'COM',
     }
 
-    @property
-    def contracts(self):
+    portfolio_contracts = relationship(
+        'Contract',
+        secondary='customers',
+        primaryjoin='Commercial.epicuser_id == Customer.commercial_id',
+        secondaryjoin='Customer.customer_id == Contract.customer_id',
+        viewonly=True)
+
+    def portfolio_query(self, session=None):
         """
-        Récupère tous les contrats associés aux clients du commercial.
+        Retourne la requête des contrats des clients du commercial.
+
+        La requête peut être filtrée, comptée ou paginée avant exécution.
+
+        Paramètres :
+        ------------
+        session : Session, optionnel
+            La session à utiliser (par défaut, celle de l'utilisateur).
 
         Retourne :
         ----------
-        list : Liste de tous les contrats.
+        Query : La requête des contrats du portefeuille.
         """
-        contracts = []
-        for customer in self.customers:
-            contracts.extend(customer.contracts)
-        return contracts
+        session = session or object_session(self)
+        return (session.query(Contract)
+                .join(Customer, Contract.customer_id == Customer.customer_id)
+                .filter(Customer.commercial_id == self.epicuser_id))
+
+    def count_portfolio(self, session=None):
+        """
+        Retourne le nombre de contrats du portefeuille, en une requête COUNT.
+        """
+        return self.portfolio_query(session).count()
+
+    def portfolio_page(self, page=1, per_page=20, session=None):
+        """
+        Retourne une page des contrats du portefeuille, triés par identifiant.
+
+        Paramètres :
+        ------------
+        page : int
+            Le numéro de page, à partir de 1.
+        per_page : int
+            Le nombre de contrats par page.
+        session : Session, optionnel
+            La session à utiliser (par défaut, celle de l'utilisateur).
+
+        Retourne :
+        ----------
+        list : Les contrats de la page.
+        """
+        return (self.portfolio_query(session)
+                .order_by(Contract.contract_id)
+                .offset((page - 1) * per_page)
+                .limit(per_page)
+                .all())
 
 
 class Support(EpicUser):
@@ -358,6 +653,14 @@ class Customer(Base):
     """
     __tablename__ = 'customers'
 
+    # Recherche des clients dans les listes de sélection
+    __table_args__ = (
+        trigram_index('ix_customers_last_name_trgm', 'last_name'),
+        trigram_index('ix_customers_company_name_trgm', 'company_name'),
+        trigram_index('ix_customers_email_trgm', 'email'),
+        trigram_index('ix_customers_phone_trgm', 'phone'),
+    )
+
     customer_id = Column(Integer, primary_key=True)
     first_name = Column(String(50), nullable=False)
     last_name = Column(String(50), nullable=False, index=True)
@@ -365,8 +668,8 @@ class Customer(Base):
     phone = Column(String(20), nullable=False, index=True)
     company_name = Column(String(100), nullable=False, index=True)
     creation_time = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
-    update_time = Column(TIMESTAMP, onupdate=func.now(), nullable=False)
-    commercial_id = Column(Integer, ForeignKey('epic_users.epicuser_id'))
+    update_time = Column(TIMESTAMP, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    commercial_id = Column(Integer, ForeignKey('epic_users.epicuser_id'), index=True)
 
     commercial = relationship('EpicUser', back_populates='customers')
     events = relationship('Event', back_populates='customer')
@@ -416,6 +719,15 @@ class Event(Base):
     """
     __tablename__ = 'events'
 
+    # Evènements sans support : liste de la gestion et attribution d'un support
+    __table_args__ = (
+        Index('ix_events_unassigned', 'date_started',
+              postgresql_where=text('support_id IS NULL'),
+              sqlite_where=text('support_id IS NULL')),
+        trigram_index('ix_events_title_trgm', 'title'),
+        trigram_index('ix_events_location_trgm', 'location'),
+    )
+
     event_id = Column(Integer, primary_key=True)
     title = Column(String, nullable=False)
     description = Column(String)
@@ -424,9 +736,9 @@ class Event(Base):
     date_started = Column(TIMESTAMP, nullable=False)
     date_ended = Column(TIMESTAMP, nullable=False)
 
-    contract_id = Column(Integer, ForeignKey('contracts.contract_id'))
-    customer_id = Column(Integer, ForeignKey('customers.customer_id'))
-    support_id = Column(Integer, ForeignKey('epic_users.epicuser_id'))
+    contract_id = Column(Integer, ForeignKey('contracts.contract_id'), index=True)
+    customer_id = Column(Integer, ForeignKey('customers.customer_id'), index=True)
+    support_id = Column(Integer, ForeignKey('epic_users.epicuser_id'), index=True)
 
     customer = relationship('Customer', back_populates='events')
     support = relationship('Support', back_populates='events')
@@ -478,20 +790,27 @@ class Contract(Base):
         ('N', 'Non_Soldé'),
     )
 
+    # Filtres des listes : contrats d'un commercial par état, et contrats par état
+    __table_args__ = (
+        Index('ix_contracts_commercial_state_paiement', 'commercial_id', 'state', 'paiement_state'),
+        Index('ix_contracts_state_paiement', 'state', 'paiement_state'),
+        trigram_index('ix_contracts_description_trgm', 'description'),
+    )
+
     contract_id = Column(Integer, Sequence('contract_id_seq'), primary_key=True)
     description = Column(String(500), nullable=False)
-    total_amount = Column(Float, nullable=False)
-    remaining_amount = Column(Float, nullable=True)  # Peut être initialisé à None au début
+    total_amount = Column(MONEY, nullable=False)
+    remaining_amount = Column(MONEY, nullable=True)  # Peut être initialisé à None au début
     state = Column(ChoiceType(CONTRACT_STATES, impl=String(length=1)), default='C')
     customer_id = Column(Integer, ForeignKey('customers.customer_id'), nullable=False, index=True)
     paiement_state = Column(ChoiceType(PAIEMENT_STATES, impl=String(length=1)), default='N')
 
     commercial_id = Column(Integer, ForeignKey('epic_users.epicuser_id'))
-    gestion_id = Column(Integer, ForeignKey('epic_users.epicuser_id'))
+    gestion_id = Column(Integer, ForeignKey('epic_users.epicuser_id'), index=True)
 
     customer = relationship('Customer', back_populates='contracts')
     events = relationship('Event', back_populates='contract')
-    paiements = relationship('Paiement', back_populates='contract', lazy='joined')
+    paiements = relationship('Paiement', back_populates='contract', lazy='selectin')
     commercial = relationship('EpicUser', foreign_keys=[commercial_id], back_populates='commercial_contracts')
     gestionnaire = relationship('EpicUser', foreign_keys=[gestion_id], back_populates='contracts')
 
@@ -513,7 +832,7 @@ class Paiement(Base):
 
     paiement_id = Column(String, primary_key=True)  # Changement ici
     date_amount = Column(TIMESTAMP, nullable=False, default=datetime.now)
-    amount = Column(Integer)
+    amount = Column(MONEY)
     contract_id = Column(Integer, ForeignKey('contracts.contract_id'), nullable=False, index=True)
 
     contract = relationship('Contract', back_populates='paiements')
@@ -531,4 +850,61 @@ class Paiement(Base):
         return f'{self.date_amount}: {self.paiement_id}/{self.amount}'  # Modifié ici pour paiement_id
 
 
+class AuditLog(Base):
+    """
+    Classe représentant une entrée du journal d'audit (ajout seul, voir controllers.audit).
+
+    Attributs :
+    -----------
+    audit_id : Column
+        Identifiant unique de l'entrée.
+    created_at : Column
+        Date et heure (UTC) de l'écriture auditée.
+    actor_id : Column
+        Identifiant de l'employé à l'origine de l'action (sans clé étrangère : le journal
+        survit à la suppression de l'employé).
+    actor : Column
+        Nom d'utilisateur de l'employé à l'origine de l'action.
+    action : Column
+        L'action métier (par exemple 'contract.sign').
+    entity : Column
+        La table de l'entité écrite (par exemple 'contracts').
+    entity_id : Column
+        La clé primaire de l'entité, en texte (None pour une écriture ensembliste).
+    changes : Column
+        Les modifications : {colonne: [avant, après]}.
+    """
+    __tablename__ = 'audit_log'
+
+    # Historique d'une entité, par date
+    __table_args__ = (
+        Index('ix_audit_log_entity', 'entity', 'entity_id', 'created_at'),
+    )
+
+    audit_id = Column(Integer, primary_key=True)
+    created_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
+    actor_id = Column(Integer)
+    actor = Column(String(50))
+    action = Column(String(50), nullable=False)
+    entity = Column(String(30), nullable=False)
+    entity_id = Column(String(50))
+    changes = Column(JSON)
+
+    def __repr__(self):
+        return f'{self.created_at} {self.actor} {self.action} {self.entity}/{self.entity_id}'
+
+
+# Documents de la recherche globale (voir controllers.search)
+CUSTOMER_SEARCH = (Customer.first_name, Customer.last_name, Customer.company_name, Customer.email, Customer.phone)
+CONTRACT_SEARCH = (Contract.description,)
+EVENT_SEARCH = (Event.title, Event.location)
+
+search_index('ix_customers_search', *CUSTOMER_SEARCH)
+search_index('ix_contracts_search', *CONTRACT_SEARCH)
+search_index('ix_events_search', *EVENT_SEARCH)
+
+# Extension des index trigrammes, créée avec les tables sur PostgreSQL
+event.listen(Base.metadata, 'before_create',
+             DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql'))
+
 configure_mappers()
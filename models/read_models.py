@@ -0,0 +1,301 @@
+# Import généraux
+import os
+import sys
+from datetime import datetime
+from decimal import Decimal
+from typing import NamedTuple, Optional
+from sqlalchemy import String, case, func, type_coerce
+from sqlalchemy.orm import aliased
+
+# Déterminez le chemin absolu du répertoire parent
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
+
+# Ajoutez le répertoire parent au PYTHONPATH
+sys.path.insert(0, parent_dir)
+
+from models.entities import Contract, Customer, EpicUser, Event, Paiement
+
+# Les modèles de lecture sont des tuples immuables construits à partir de requêtes
+# sur les seules colonnes affichées : ni suivi par la session, ni conversion ChoiceType,
+# ni chargement de relations. Les écritures continuent de passer par les entités.
+
+
+def choice_label(column, choices):
+    """
+    Retourne une expression SQL donnant le libellé d'une colonne ChoiceType.
+
+    Paramètres :
+    ------------
+    column : Column
+        La colonne ChoiceType.
+    choices : tuple
+        Les couples (code, libellé) de la colonne.
+
+    Retourne :
+    ----------
+    Case : L'expression CASE code -> libellé.
+    """
+    return case(dict(choices), value=type_coerce(column, String))
+
+
+def fetch(row_type, query):
+    """
+    Exécute une requête de colonnes et retourne les lignes sous forme de `row_type`.
+    """
+    return [row_type._make(row) for row in query]
+
+
+class UserRow(NamedTuple):
+    """
+    Ligne de la liste des employés.
+    """
+    epicuser_id: int
+    first_name: str
+    last_name: str
+    username: str
+    email: str
+    role: str
+    state: str
+
+    @classmethod
+    def query(cls, session):
+        """
+        Retourne la requête des colonnes de la liste des employés.
+        """
+        return session.query(
+            EpicUser.epicuser_id, EpicUser.first_name, EpicUser.last_name,
+            EpicUser.username, EpicUser.email,
+            choice_label(EpicUser.role, EpicUser.EPIC_ROLES),
+            choice_label(EpicUser.state, EpicUser.USER_STATES))
+
+
+class CustomerRow(NamedTuple):
+    """
+    Ligne de la liste des clients.
+    """
+    customer_id: int
+    first_name: str
+    last_name: str
+    company_name: str
+    phone: str
+    email: str
+    commercial_username: Optional[str]
+    creation_time: datetime
+    update_time: datetime
+
+    @classmethod
+    def query(cls, session):
+        """
+        Retourne la requête des colonnes de la liste des clients.
+        """
+        commercial = aliased(EpicUser, name='commercial')
+        return (session.query(
+                    Customer.customer_id, Customer.first_name, Customer.last_name,
+                    Customer.company_name, Customer.phone, Customer.email,
+                    commercial.username, Customer.creation_time, Customer.update_time)
+                .outerjoin(commercial, Customer.commercial_id == commercial.epicuser_id))
+
+
+class ContractRow(NamedTuple):
+    """
+    Ligne de la liste des contrats.
+    """
+    contract_id: int
+    description: str
+    customer_first_name: Optional[str]
+    customer_last_name: Optional[str]
+    total_amount: Decimal
+    remaining_amount: Optional[Decimal]
+    state: str
+    commercial_username: Optional[str]
+    gestion_id: Optional[int]
+
+    @classmethod
+    def query(cls, session):
+        """
+        Retourne la requête des colonnes de la liste des contrats.
+
+        Les clients sont joints : la requête peut être filtrée sur `Customer.commercial_id`.
+        """
+        commercial = aliased(EpicUser, name='commercial')
+        return (session.query(
+                    Contract.contract_id, Contract.description,
+                    Customer.first_name, Customer.last_name,
+                    Contract.total_amount, Contract.remaining_amount,
+                    choice_label(Contract.state, Contract.CONTRACT_STATES),
+                    commercial.username, Contract.gestion_id)
+                .outerjoin(Customer, Contract.customer_id == Customer.customer_id)
+                .outerjoin(commercial, Customer.commercial_id == commercial.epicuser_id))
+
+
+class EventRow(NamedTuple):
+    """
+    Ligne de la liste des évènements.
+    """
+    event_id: int
+    title: str
+    location: Optional[str]
+    attendees: Optional[int]
+    date_started: datetime
+    date_ended: datetime
+    customer_id: Optional[int]
+    support_id: Optional[int]
+
+    @classmethod
+    def query(cls, session):
+        """
+        Retourne la requête des colonnes de la liste des évènements.
+        """
+        return session.query(
+            Event.event_id, Event.title, Event.location, Event.attendees,
+            Event.date_started, Event.date_ended, Event.customer_id, Event.support_id)
+
+
+class PaiementRow(NamedTuple):
+    """
+    Ligne de l'export des paiements.
+
+    Les contrats sont joints : la requête peut être restreinte par `scope` sur Contract.
+    """
+    paiement_id: str
+    contract_id: int
+    amount: Optional[Decimal]
+    date_amount: datetime
+
+    @classmethod
+    def query(cls, session):
+        """
+        Retourne la requête des colonnes de l'export des paiements.
+        """
+        return (session.query(Paiement.paiement_id, Paiement.contract_id, Paiement.amount, Paiement.date_amount)
+                .join(Contract, Paiement.contract_id == Contract.contract_id))
+
+
+class ContractPaiementRow(NamedTuple):
+    """
+    Ligne de l'export des contrats avec le total de leurs paiements.
+    """
+    contract_id: int
+    description: str
+    customer_id: Optional[int]
+    company_name: Optional[str]
+    total_amount: Decimal
+    remaining_amount: Optional[Decimal]
+    state: str
+    paiement_state: str
+    paiement_count: int
+    paid_amount: Decimal
+    last_paiement: Optional[datetime]
+
+    @classmethod
+    def query(cls, session):
+        """
+        Retourne la requête des colonnes de l'export des contrats et de leurs paiements.
+
+        Les paiements sont agrégés par contrat dans une sous-requête jointe : une seule
+        ligne par contrat, sans chargement des paiements.
+        """
+        paiements = (session.query(Paiement.contract_id,
+                                   func.count(Paiement.paiement_id).label('count'),
+                                   func.sum(Paiement.amount).label('amount'),
+                                   func.max(Paiement.date_amount).label('last'))
+                     .group_by(Paiement.contract_id)
+                     .subquery())
+        return (session.query(
+                    Contract.contract_id, Contract.description, Contract.customer_id, Customer.company_name,
+                    Contract.total_amount, Contract.remaining_amount,
+                    choice_label(Contract.state, Contract.CONTRACT_STATES),
+                    choice_label(Contract.paiement_state, Contract.PAIEMENT_STATES),
+                    func.coalesce(paiements.c.count, 0), func.coalesce(paiements.c.amount, 0),
+                    paiements.c.last)
+                .outerjoin(Customer, Contract.customer_id == Customer.customer_id)
+                .outerjoin(paiements, paiements.c.contract_id == Contract.contract_id))
+
+
+class ContractChoice(NamedTuple):
+    """
+    Choix d'un contrat dans une liste de sélection.
+    """
+    contract_id: int
+    description: str
+
+    @classmethod
+    def query(cls, session):
+        """
+        Retourne la requête des colonnes de la liste de sélection des contrats.
+        """
+        return session.query(Contract.contract_id, Contract.description)
+
+
+class EventChoice(NamedTuple):
+    """
+    Choix d'un évènement dans une liste de sélection.
+    """
+    event_id: int
+    title: str
+
+    @classmethod
+    def query(cls, session):
+        """
+        Retourne la requête des colonnes de la liste de sélection des évènements.
+        """
+        return session.query(Event.event_id, Event.title)
+
+
+class SearchHit(NamedTuple):
+    """
+    Résultat de la recherche globale (client, contrat ou évènement).
+    """
+    kind: str
+    key: int
+    label: str
+    detail: str
+    rank: float
+
+
+class PortfolioShare(NamedTuple):
+    """
+    Part d'un portefeuille réaffecté à un employé : charge actuelle et éléments reçus.
+    """
+    epicuser_id: int
+    username: str
+    load: int
+    added: int
+
+
+class ReportRow(NamedTuple):
+    """
+    Ligne d'un rapport financier (par commercial, par client ou par mois), ou ligne de total.
+
+    Les rapports par mois portent sur les paiements : `count` est alors le nombre de
+    paiements, `signed` et `outstanding` sont None.
+    """
+    key: Optional[str]
+    label: Optional[str]
+    count: int
+    signed: Optional[Decimal]
+    collected: Decimal
+    outstanding: Optional[Decimal]
+    total: bool
+
+
+class UserRef(NamedTuple):
+    """
+    Employé du cache de référence (voir controllers.reference) : rôle et état sont des codes.
+    """
+    epicuser_id: int
+    username: str
+    first_name: str
+    last_name: str
+    role: str
+    state: str
+
+    @classmethod
+    def query(cls, session):
+        """
+        Retourne la requête des colonnes de tous les employés.
+        """
+        return session.query(
+            EpicUser.epicuser_id, EpicUser.username, EpicUser.first_name, EpicUser.last_name,
+            type_coerce(EpicUser.role, String), type_coerce(EpicUser.state, String))
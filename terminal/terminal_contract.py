@@ -14,9 +14,16 @@ sys.path.insert(0, parent_dir)
 from controllers.decorator import (is_authenticated, requires_roles, sentry_activate)
 from controllers.contract_controller import ContractBase
 from controllers.user_controller import EpicUserBase
+from controllers.loading import loading_plan
+from controllers.pagination import KeysetPager, browse
+from controllers.scope import WRITE, scope
+from controllers.reference import directory
+from controllers.typeahead import contract_typeahead, customer_typeahead, user_typeahead
+from controllers.unit_of_work import rollback
 
 # Import Modèles
-from models.entities import Customer, Contract, Commercial, EpicUser, Gestion
+from models.entities import Customer, Contract, Commercial, Gestion
+from models.read_models import ContractRow
 
 # Import Terminaux
 from terminal.terminal_customer import EpicTerminalCustomer
@@ -79,12 +86,9 @@ class EpicTerminalContract:
 
                 # Filtrer par client
                 if ContractView.prompt_confirm_customer():
-                    customers = session.query(Customer).filter_by(commercial_id=self.current_user.epicuser_id).all()
-                    if customers:
-                        select_customer = CustomerView.prompt_client([customer.name for customer in customers])
-                        selected_customer = next((customer for customer in customers if customer.name == select_customer), None)
-                        if selected_customer:
-                            filter_by_customer = selected_customer.customer_id
+                    customers = customer_typeahead(session, self.current_user, mine=True)
+                    if customers(''):
+                        filter_by_customer = CustomerView.prompt_find_customer(customers)
                     else:
                         text = "Aucun client trouvé pour ce commercial."
                         console.print(text, style="red")
@@ -109,24 +113,23 @@ class EpicTerminalContract:
                             filter_by_paiement = 'P'
 
                 # Construire la requête de filtrage des contrats
-                query = session.query(Contract)
+                query = scope(ContractRow.query(session), Contract, self.current_user, mine=bool(filter_by_user))
 
-                if filter_by_user:
-                    query = query.filter_by(commercial_id=filter_by_user)
                 if filter_by_customer:
-                    query = query.filter_by(customer_id=filter_by_customer)
+                    query = query.filter(Contract.customer_id == filter_by_customer)
                 if filter_by_statut:
-                    query = query.filter_by(state=filter_by_statut)
+                    query = query.filter(Contract.state == filter_by_statut)
                 if filter_by_paiement:
-                    query = query.filter_by(paiement_state=filter_by_paiement)
+                    query = query.filter(Contract.paiement_state == filter_by_paiement)
 
-                # Exécuter la requête et afficher les résultats
-                contracts = query.all()
-                ContractView.display_list_contracts(contracts)
+                # Exécuter la requête et afficher les résultats, page par page
+                pager = KeysetPager(query, ContractRow, [Contract.contract_id], ['contract_id'])
+                browse(pager, ContractView.display_list_contracts)
         else:
             # Afficher tous les contrats si l'utilisateur n'est pas un commercial
-            contracts = session.query(Contract).all()
-            ContractView.display_list_contracts(contracts)
+            query = scope(ContractRow.query(session), Contract, self.current_user)
+            pager = KeysetPager(query, ContractRow, [Contract.contract_id], ['contract_id'])
+            browse(pager, ContractView.display_list_contracts)
 
     @sentry_activate
     @is_authenticated
@@ -152,9 +155,7 @@ class EpicTerminalContract:
                 raise ValueError("La session passée n'est pas une instance de SQLAlchemy Session.")
 
             # Récupérer les clients
-            customers = session.query(Customer).all()
-            customer_data = [{"name": f"{c.first_name} {c.last_name} {c.customer_id}", "value": c.customer_id} for c in customers]
-            customer_id = CustomerView.prompt_client(customer_data)
+            customer_id = CustomerView.prompt_find_customer(customer_typeahead(session, self.current_user))
 
             # Obtenir les données du contrat
             data = ContractView.prompt_data_contract()
@@ -172,8 +173,11 @@ class EpicTerminalContract:
                     EpicTerminalContract.update_contract_gestion(self, session)
 
         except KeyboardInterrupt:
+            rollback(session)
             DataView.display_interupt()
         except Exception as e:
+            # Le contrat n'est pas enregistré sans son gestionnaire : toute l'action est annulée
+            rollback(session)
             text = f"Erreur rencontrée: {e}"
             console.print(text, style="bold red")
 
@@ -194,16 +198,11 @@ class EpicTerminalContract:
                 raise ValueError("Utilisateur non connecté ou non valide.")
 
             session = session()
-            contracts = session.query(Contract).all()
 
-            if self.current_user.role == 'COM' and isinstance(self.current_user, Commercial):
-                contracts = [contract for contract in contracts if contract in self.current_user.contracts]
-            selected_contract = EventView.prompt_select_contract(contracts)
-            if not selected_contract:
-                raise ValueError("Contrat sélectionné invalide")
-
-            contract_id = selected_contract.contract_id
-            contract = session.query(Contract).filter_by(contract_id=contract_id).first()
+            # Contrats modifiables par l'utilisateur (ceux de ses clients pour un commercial)
+            contract_id = EventView.prompt_find_contract(contract_typeahead(session, self.current_user, WRITE))
+            contract = (session.query(Contract).options(*loading_plan('contract_detail'))
+                        .filter_by(contract_id=contract_id).first())
             if not contract:
                 raise ValueError("Contrat introuvable")
 
@@ -244,19 +243,15 @@ class EpicTerminalContract:
             return
 
         # Récupérer tous les contrats sans gestionnaire
-        contracts = session.query(Contract).filter_by(gestion_id=None).all()
-        ref = EventView.prompt_select_contract(contracts)
-        selected_contract = session.query(Contract).filter_by(contract_id=ref.contract_id).first()
-        selected_contract_id = selected_contract.contract_id
-
-        # Récupérer tous les gestionnaires
-        gestionnaires = session.query(EpicUser).filter_by(role='GES').all()
+        contracts = contract_typeahead(session, self.current_user, WRITE, unassigned=True)
+        selected_contract_id = EventView.prompt_find_contract(contracts)
 
         # Demander à l'utilisateur de sélectionner un gestionaire
-        selected_gestion_username = UserView.prompt_select_gestion(gestionnaires)
+        gestionnaires = user_typeahead(session, 'GES')
+        selected_gestion_id = UserView.prompt_find_user(gestionnaires, "Choix du gestionnaire")
 
-        # Récupérer l'ID du gestionnaire sélectionné
-        selected_gestion = session.query(EpicUser).filter_by(username=selected_gestion_username).first()
+        # Récupérer le gestionnaire sélectionné
+        selected_gestion = directory.get(session, selected_gestion_id)
         if not selected_gestion:
             text = "Erreur : Le gestionnaire sélectionné n'existe pas."
             console.print(text, style="bold red")
@@ -283,14 +278,12 @@ class EpicTerminalContract:
             text = "Erreur : La session est non initialisée."
             console.print(text, style="bold red")
             return
-        # Récupérer tous les gestionnaires
-        gestionnaires = session.query(EpicUser).filter_by(role='GES').all()
-
         # Demander à l'utilisateur de sélectionner un gestionaire
-        selected_gestion_username = UserView.prompt_select_gestion(gestionnaires)
+        gestionnaires = user_typeahead(session, 'GES')
+        selected_gestion_id = UserView.prompt_find_user(gestionnaires, "Choix du gestionnaire")
 
-        # Récupérer l'ID du gestionnaire sélectionné
-        selected_gestion = session.query(EpicUser).filter_by(username=selected_gestion_username).first()
+        # Récupérer le gestionnaire sélectionné
+        selected_gestion = directory.get(session, selected_gestion_id)
         if not selected_gestion:
             text = "Erreur : Le gestionnaire sélectionné n'existe pas."
             console.print(text, style="bold red")
@@ -313,10 +306,9 @@ class EpicTerminalContract:
 
         Cette méthode ajoute les détails du paiement à un contrat spécifique.
         """
-        contracts = session.query(Contract).all()
-        ref = EventView.prompt_select_contract(contracts)
+        contract_id = EventView.prompt_find_contract(contract_typeahead(session, self.current_user, WRITE))
 
-        selected_contract = session.query(Contract).filter_by(contract_id=ref.contract_id).first()
+        selected_contract = session.get(Contract, contract_id)
         if not selected_contract:
             raise ValueError("Contrat introuvable")
 
@@ -14,9 +14,14 @@ sys.path.insert(0, parent_dir)
 from controllers.decorator import is_authenticated, requires_roles, sentry_activate
 from controllers.user_controller import EpicUserBase, EpicUser
 from controllers.customer_controller import CustomerBase
+from controllers.pagination import KeysetPager, browse
+from controllers.scope import WRITE, scope
+from controllers.reference import directory
+from controllers.typeahead import customer_typeahead, user_typeahead
 
 # Import Modèles
-from models.entities import Customer, Commercial, Admin
+from models.entities import Customer, Commercial
+from models.read_models import CustomerRow
 
 # Import Views
 from views.user_view import UserView
@@ -78,12 +83,14 @@ class EpicTerminalCustomer:
 
         Cette méthode récupère tous les clients et les affiche.
         """
-        customers = session.query(Customer).all()
-        if not customers:
+        # Clients triés par nom, lus page par page
+        pager = KeysetPager(scope(CustomerRow.query(session), Customer, self.current_user), CustomerRow,
+                            [Customer.last_name, Customer.customer_id], ['last_name', 'customer_id'])
+        if not pager.first():
             text = "Aucun client existant. Retour au menu principal."
             console.print(text, style="red")
             return
-        CustomerView.display_list_customers(customers)
+        browse(pager, CustomerView.display_list_customers)
 
     @sentry_activate
     @is_authenticated
@@ -107,29 +114,20 @@ class EpicTerminalCustomer:
             return
 
         # Récupérer tous les clients sans commercial
-        customers = session.query(Customer).filter_by(commercial_id=None).all()
-        customers_data = [{"name": f"{c.first_name} {c.last_name}", "value": c.customer_id} for c in customers]
-
-        # Demander à l'utilisateur de sélectionner un client
-        selected_customer_id = CustomerView.prompt_client(customers_data)
-        if not selected_customer_id:
-            text = "Erreur : Aucun client sélectionné."
+        customers = customer_typeahead(session, self.current_user, unassigned=True)
+        if not customers(''):
+            text = "Aucun client sans commercial."
             console.print(text, style="red")
             return
 
-        # Récupérer tous les commerciaux
-        commercials = session.query(EpicUser).filter_by(role='COM').all()
-        commercial_usernames = [c.username for c in commercials]
+        # Demander à l'utilisateur de sélectionner un client
+        selected_customer_id = CustomerView.prompt_find_customer(customers)
 
         # Demander à l'utilisateur de sélectionner un commercial
-        selected_commercial_username = UserView.prompt_commercial(commercial_usernames)
-        if not selected_commercial_username:
-            text = "Erreur : Aucun commercial sélectionné."
-            console.print(text, style="bold red")
-            return
+        selected_commercial_id = UserView.prompt_find_user(user_typeahead(session, 'COM'), "Choix du commercial")
 
-        # Récupérer l'ID du commercial sélectionné
-        selected_commercial = session.query(EpicUser).filter_by(username=selected_commercial_username).first()
+        # Récupérer le commercial sélectionné
+        selected_commercial = directory.get(session, selected_commercial_id)
         if not selected_commercial:
             text = "Erreur : Le commercial sélectionné n'existe pas."
             console.print(text, style="bold red")
@@ -195,27 +193,16 @@ class EpicTerminalCustomer:
 
         roles = EpicUserBase.get_roles(self)
         self.roles = roles
-        if isinstance(self.current_user, Admin):
-            # Récupérer tous les clients associés à l'utilisateur actuel
-            customers = session.query(Customer).all()
-            customers_data = [{"name": f"{c.first_name} {c.last_name}", "value": c.customer_id} for c in customers]
-        else:
-            customers = session.query(Customer).filter_by(commercial_id=self.current_user.epicuser_id).all()
-            customers_data = [{"name": f"{c.first_name} {c.last_name}", "value": c.customer_id} for c in customers]
+        # Clients modifiables par l'utilisateur : tous pour un administrateur, les siens pour un commercial
+        customers = customer_typeahead(session, self.current_user, WRITE)
 
         # Vérifiez s'il y a des clients associés
-        if not customers_data:
+        if not customers(''):
             text = "Aucun client trouvé pour ce commercial."
             console.print(text, style="red")
             return
 
-        selected_customer_id = CustomerView.prompt_client(customers_data)
-
-        # Vérifiez si l'ID du client sélectionné est valide
-        if selected_customer_id is None:
-            text = "Erreur : Aucune sélection de client."
-            console.print(text, style="red")
-            return
+        selected_customer_id = CustomerView.prompt_find_customer(customers)
 
         # Rechercher le client par ID
         customer = session.query(Customer).filter_by(customer_id=selected_customer_id).one_or_none()
@@ -253,19 +240,11 @@ class EpicTerminalCustomer:
             console.print(text, style="bold red")
             return
 
-        # Récupérer tous les commerciaux
-        commercials = session.query(EpicUser).filter_by(role='COM').all()
-        commercial_usernames = [c.username for c in commercials]
-
         # Demander à l'utilisateur de sélectionner un commercial
-        selected_commercial_username = UserView.prompt_commercial(commercial_usernames)
-        if not selected_commercial_username:
-            text = "Erreur : Aucun commercial sélectionné."
-            console.print(text, style="bold red")
-            return
+        selected_commercial_id = UserView.prompt_find_user(user_typeahead(session, 'COM'), "Choix du commercial")
 
-        # Récupérer l'ID du commercial sélectionné
-        selected_commercial = session.query(EpicUser).filter_by(username=selected_commercial_username).first()
+        # Récupérer le commercial sélectionné
+        selected_commercial = directory.get(session, selected_commercial_id)
         if not selected_commercial:
             text = "Erreur : Le commercial sélectionné n'existe pas."
             console.print(text, style="bold red")
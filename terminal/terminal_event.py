@@ -12,9 +12,14 @@ sys.path.insert(0, parent_dir)
 from controllers.decorator import (is_authenticated, requires_roles, sentry_activate)
 from controllers.event_controller import EventBase, Event
 from controllers.user_controller import EpicUserBase
+from controllers.pagination import KeysetPager, browse
+from controllers.scope import WRITE, scope
+from controllers.reference import directory
+from controllers.typeahead import contract_typeahead, event_typeahead, user_typeahead
 
 # Import Modèles
-from models.entities import EpicUser, Commercial, Contract, Gestion, Support
+from models.entities import Contract, Gestion, Support
+from models.read_models import EventRow
 
 # Import Views
 from views.event_view import EventView
@@ -61,16 +66,13 @@ class EpicTerminalEvent:
                 raise ValueError("Utilisateur non connecté ou non valide.")
 
             session = session()
-            events = session.query(Event).all()
-            if self.current_user.role == 'SUP':
-                events = session.query(Event).filter_by(support_id=self.current_user.epicuser_id)
-            else:
-                events = session.query(Event).all()
-            if events:
-                event = EventView.prompt_select_event(events)  # Sélection de l'événement
+            # Evènements modifiables par l'utilisateur (les siens pour un support)
+            events = event_typeahead(session, self.current_user, WRITE)
+            if events(''):
+                event_id = EventView.prompt_find_event(events)  # Sélection de l'événement
                 data = EventView.prompt_data_event()  # Récupération des nouvelles données de l'événement
                 # Passez directement la session à la méthode update_event
-                EventBase.update_event(event.event_id, data, session)
+                EventBase.update_event(event_id, data, session)
 
         except KeyboardInterrupt:
             DataView.display_interupt()
@@ -98,16 +100,13 @@ class EpicTerminalEvent:
 
         try:
             session = session()
-            if self.current_user.role == 'COM' and isinstance(self.current_user, Commercial):
-                contracts = session.query(Contract).filter(Contract.state == "S",
-                                                           Contract.commercial_id == self.current_user.epicuser_id).all()
-            else:
-                contracts = session.query(Contract).filter_by(state="S").all()
+            # Contrats signés modifiables par l'utilisateur (ceux de ses clients pour un commercial)
+            contracts = contract_typeahead(session, self.current_user, WRITE).filter(Contract.state == "S")
 
-            if contracts:
-                contract = EventView.prompt_select_contract(contracts)
+            if contracts(''):
+                contract_id = EventView.prompt_find_contract(contracts)
                 data = EventView.prompt_data_event()
-                data['contract_id'] = contract.contract_id
+                data['contract_id'] = contract_id
                 EventBase.create_event(data, session)
                 if EventView.prompt_add_support():
                     EpicTerminalEvent.update_event_support(self, session)
@@ -135,26 +134,30 @@ class EpicTerminalEvent:
         """
         roles = EpicUserBase.get_roles(self)
         self.roles = roles
+        query = EventRow.query(session)
         if self.current_user.role == 'GES':
             if isinstance(self.current_user, Gestion):
-                if EventView.prompt_filtered_events_gestion():
-                    events = session.query(Event).all()
-                    EventView.display_list_events(events)
-                else:
-                    events = session.query(Event).filter_by(support_id=None).all()
-                    EventView.display_list_events(events)
+                # Tous les évènements, ou seulement ceux sans support
+                unassigned = not EventView.prompt_filtered_events_gestion()
+                self.browse_events(scope(query, Event, self.current_user, unassigned=unassigned))
         elif self.current_user.role == 'SUP':
             if isinstance(self.current_user, Support):
-                if EventView.prompt_filtered_events_support():
-                    events = session.query(Event).all()
-                    EventView.display_list_events(events)
-                else:
-                    events = session.query(Event).filter_by(support_id=self.current_user.epicuser_id).all()
-                    EventView.display_list_events(events)
+                # Tous les évènements, ou seulement ceux du support
+                mine = not EventView.prompt_filtered_events_support()
+                self.browse_events(scope(query, Event, self.current_user, mine=mine))
 
         else:
-            events = session.query(Event).all()
-            EventView.display_list_events(events)
+            self.browse_events(scope(query, Event, self.current_user))
+
+    @staticmethod
+    def browse_events(query):
+        """
+        Affiche les évènements d'une requête de lignes, page par page (par identifiant).
+
+        :param query: Requête des lignes d'évènements (EventRow).
+        """
+        pager = KeysetPager(query, EventRow, [Event.event_id], ['event_id'])
+        browse(pager, EventView.display_list_events)
 
     @sentry_activate
     @is_authenticated
@@ -176,23 +179,24 @@ class EpicTerminalEvent:
             return
 
         # Récupérer tous les événements non attribués à un support
-        events = session.query(Event).filter_by(support_id=None).all()
-        if events:
-            event = EventView.prompt_select_event(events)
-
-        # Récupérer tous les supports
-        supports = session.query(EpicUser).filter_by(role='SUP').all()
+        events = event_typeahead(session, self.current_user, WRITE, unassigned=True)
+        if not events(''):
+            text = "Aucun évènement sans support."
+            console.print(text, style="red")
+            return
+        event_id = EventView.prompt_find_event(events)
 
         # Demander à l'utilisateur de sélectionner un support
-        selected_support_username = UserView.prompt_select_support(supports)
+        supports = user_typeahead(session, 'SUP')
+        selected_support_id = UserView.prompt_find_user(supports, "Choix du support")
 
-        # Récupérer l'ID du support sélectionné
-        selected_support = session.query(EpicUser).filter_by(username=selected_support_username).first()
+        # Récupérer le support sélectionné
+        selected_support = directory.get(session, selected_support_id)
         if not selected_support:
             text = "Erreur : Le support sélectionné n'existe pas."
             console.print(text, style="bold red")
             return
         # Mettre à jour le support de l'évènement
-        EventBase.update_support_event(session, event.event_id, selected_support.epicuser_id)
-        text = f"Le support {selected_support.username} a été attribué à l'évènement {event.event_id} avec succès."
+        EventBase.update_support_event(session, event_id, selected_support.epicuser_id)
+        text = f"Le support {selected_support.username} a été attribué à l'évènement {event_id} avec succès."
         console.print(text, style="cyan")
@@ -0,0 +1,53 @@
+# Import généraux
+import os
+import sys
+
+# Déterminez le chemin absolu du répertoire parent
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.abspath(os.path.join(current_dir, '../../'))
+
+# Ajoutez le répertoire parent au PYTHONPATH
+sys.path.insert(0, parent_dir)
+
+
+# Import Controllers
+from controllers.decorator import is_authenticated, sentry_activate
+from controllers.search import SEARCH_LIMIT, search
+
+# Import Views
+from views.data_view import DataView
+
+
+class EpicTerminalSearch:
+    """
+    Classe pour la recherche globale (clients, contrats et évènements) depuis l'interface terminal.
+    """
+
+    def __init__(self, base, session):
+        """
+        Initialise la classe EpicTerminalSearch avec la base de données.
+
+        :param base: L'objet EpicDatabase pour accéder aux opérations de la base de données.
+        :param session: La session SQLAlchemy pour effectuer des requêtes.
+        """
+        self.epic = base
+        self.session = session
+        self.current_user = None
+
+    @sentry_activate
+    @is_authenticated
+    def search(self, session, text=None, limit=SEARCH_LIMIT, mine=False) -> None:
+        """
+        Recherche un texte dans les clients, les contrats et les évènements visibles par l'utilisateur.
+
+        :param session: Session SQLAlchemy pour interagir avec la base de données.
+        :param text: Le texte recherché ; demandé à l'utilisateur s'il n'est pas fourni.
+        :param limit: Le nombre maximal de résultats.
+        :param mine: Si True, seuls les éléments de l'utilisateur sont recherchés.
+        """
+        try:
+            if text is None:
+                text = DataView.prompt_search_text()
+            DataView.display_search_results(text, search(session, self.current_user, text, limit, mine))
+        except KeyboardInterrupt:
+            DataView.display_interupt()
@@ -12,6 +12,11 @@ sys.path.insert(0, parent_dir)
 # Import Controllers
 from controllers.decorator import is_authenticated, requires_roles, sentry_activate
 from controllers.user_controller import EpicUserBase, EpicUser
+from controllers.unit_of_work import commit, rollback
+from controllers.pagination import KeysetPager, browse
+
+# Import Modèles
+from models.read_models import UserRow
 
 # Import Views
 from views.user_view import UserView
@@ -104,7 +109,7 @@ class EpicTerminalUser:
                     self.current_user.set_password(new_password)
 
                 # Sauvegarder les changements dans la session
-                actual_session.commit()
+                commit(actual_session)
 
                 # Afficher le profil mis à jour
                 DataView.display_profil(self.current_user)
@@ -112,7 +117,7 @@ class EpicTerminalUser:
             except Exception as e:
                 text = f"Erreur lors de la mise à jour du profil : {str(e)}"
                 console.print(text, style="bold red")
-                session.rollback()
+                rollback(session)
 
     @sentry_activate
     @is_authenticated
@@ -125,8 +130,10 @@ class EpicTerminalUser:
 
         :param session: Session SQLAlchemy pour interagir avec la base de données.
         """
-        users = self.session.query(EpicUser).all()
-        UserView.display_list_users(users)
+        # Employés triés par nom, lus page par page
+        pager = KeysetPager(UserRow.query(self.session), UserRow,
+                            [EpicUser.last_name, EpicUser.epicuser_id], ['last_name', 'epicuser_id'])
+        browse(pager, UserView.display_list_users)
 
     @sentry_activate
     @is_authenticated
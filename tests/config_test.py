@@ -4,6 +4,7 @@ import os
 import datetime
 import jwt
 import pytest
+import unittest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, scoped_session
 # Add the root directory to PYTHONPATH
@@ -15,6 +16,7 @@ sys.path.insert(0, parent_dir)
 from controllers import user_controller, contract_controller, epic_controller, event_controller, customer_controller
 from config_init import Base, SECRET_KEY, ALGORITHM
 from controllers.epic_controller import EpicDatabase
+from models.entities import Commercial, Gestion
 # Setup SQLAlchemy in-memory database for testing
 engine = create_engine('sqlite:///:memory:', echo=False)
 Session = sessionmaker(bind=engine)
@@ -26,21 +28,48 @@ TOKEN_CACHE = None
 
 @pytest.fixture(scope='session')
 def epic_database():
-    # Créer une instance de la base de données
-    db = EpicDatabase(database='test_db', host='localhost', user='user', password='password')
+    # Créer une instance de la base de données SQLite en mémoire
+    db = EpicDatabase(database=':memory:', backend='sqlite')
+    db.database_creation(username=None, password=None)
     return db
 
 
 @pytest.fixture(scope='function')
 def test_session(epic_database):
     # Créer une session de test
-    engine = epic_database.get_engine()
+    engine = epic_database.engine
     Session = scoped_session(sessionmaker(bind=engine))
     session = Session()
     yield session
     session.remove()
 
 
+class DatabaseTestCase(unittest.TestCase):
+    """
+    Base de test SQLite créée pour chaque test, avec un commercial (pmartin) et un gestionnaire
+    (jdurand) déjà enregistrés. Les classes de test ajoutent leurs propres données dans setUp.
+    """
+
+    def database_url(self):
+        return 'sqlite:///:memory:'
+
+    def setUp(self):
+        self.engine = create_engine(self.database_url())
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.commercial = Commercial(first_name='Paul', last_name='Martin', username='pmartin',
+                                     email='pmartin@epic.com', password='x', state='A')
+        self.gestion = Gestion(first_name='Julie', last_name='Durand', username='jdurand',
+                               email='jdurand@epic.com', password='x', state='A')
+        self.session.add_all([self.commercial, self.gestion])
+        self.session.commit()
+
+    def tearDown(self):
+        self.session.close()
+        Base.metadata.drop_all(self.engine)
+        self.engine.dispose()
+
+
 def generate_token(username, role, secret_key=SECRET_KEY, expiration_days=30):
     expiration_date = datetime.datetime.utcnow() + datetime.timedelta(days=expiration_days)
     payload = {
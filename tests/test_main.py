@@ -1,7 +1,10 @@
+import os
 from unittest.mock import patch
 import pytest
 from click.testing import CliRunner
 from main import sentry_activate, main
+from controllers.session_store import MemorySessionStore
+from controllers.timing import measure_import_time
 
 
 @patch('sentry_sdk.init')
@@ -24,3 +27,26 @@ def test_epic_cli_start(runner):
     assert result.exit_code == 1
     # Vérifiez la sortie attendue ou tout autre comportement spécifique
     assert "\x1b[1;32mInitialisation de EpicBase\x1b[0m\x1b[1;33m...\x1b[0m\n\x1b[32mConnexion à la " in result.output
+
+
+# Budget de démarrage à froid de `main.py --help` (en millisecondes)
+HELP_COLD_START_BUDGET_MS = 1000
+HEAVY_MODULES = ('sqlalchemy', 'sentry_sdk', 'questionary', 'controllers', 'terminal')
+
+
+def test_help_cold_start_budget():
+    main_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'main.py')
+    wall, modules = measure_import_time(main_path, ['--help'])
+
+    imported = {name.split('.')[0] for name, _, _ in modules}
+    assert not imported & set(HEAVY_MODULES)
+    assert wall < HELP_COLD_START_BUDGET_MS
+
+
+def test_logout_clears_session(runner):
+    store = MemorySessionStore()
+    store.save('token')
+    with patch('controllers.session_store.get_session_store', return_value=store):
+        result = runner.invoke(main, ['logout'])
+    assert result.exit_code == 0
+    assert store.load() is None
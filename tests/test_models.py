@@ -1,7 +1,9 @@
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import sessionmaker
-from models.entities import EpicUser, Base, Customer, Event, Contract
+from models.entities import EpicUser, Base, Customer, Event, Contract, Commercial
+from models.read_models import ContractRow, fetch
+from controllers.security import set_password_hasher
 from datetime import datetime, timedelta
 
 
@@ -74,6 +76,39 @@ def test_generate_unique_email(test_session):
     assert unique_email != 'nducoin@epic.com'
 
 
+def test_generate_unique_username_uses_highest_suffix(test_session):
+    for username in ('pleroy', 'pleroy3', 'pleroyx'):
+        test_session.add(EpicUser(role='COM', first_name='Paul', last_name='Leroy', username=username,
+                                  password='securepassword', email=f'{username}@epic.com', state='A'))
+    test_session.commit()
+
+    assert EpicUser.generate_unique_username(test_session, 'Pierre', 'Leroy') == 'pleroy4'
+    assert EpicUser.generate_unique_email(test_session, 'pleroy') == 'pleroy4@epic.com'
+
+
+def test_allocate_identities(test_session):
+    identities = EpicUser.allocate_identities(
+        test_session, [('Paula', 'Leroy'), ('Pia', 'Leroy'), ('Zoé', 'Nouvel_le')])
+
+    assert identities == [
+        ('pleroy4', 'pleroy4@epic.com'),
+        ('pleroy5', 'pleroy5@epic.com'),
+        ('znouvel_le', 'znouvel_le@epic.com'),
+    ]
+
+
+def test_assign_unique_identity_retries_on_conflict(test_session, monkeypatch):
+    candidates = iter(['pleroy', 'pleroy6'])
+    monkeypatch.setattr(EpicUser, 'generate_unique_username', classmethod(lambda cls, *args: next(candidates)))
+
+    user = EpicUser(role='SUP', first_name='Pierre', last_name='Leroy', password='securepassword', state='A')
+    user.assign_unique_identity(test_session)
+    test_session.commit()
+
+    assert user.username == 'pleroy6'
+    assert user.email == 'pleroy6@epic.com'
+
+
 def test_set_password(test_session):
     user = EpicUser(
         role='COM',
@@ -125,6 +160,22 @@ def test_check_password_incorrect(test_session):
     assert user.check_password('wrongpassword') is False
 
 
+def test_rehash_password_if_needed():
+    user = EpicUser(role='COM', first_name='Rémi', last_name='Hash', username='rhash', email='rhash@epic.com')
+    set_password_hasher(time_cost=1, memory_cost=8192, parallelism=1)
+    try:
+        user.set_password('securepassword')
+        assert user.rehash_password_if_needed('securepassword') is False
+
+        set_password_hasher(time_cost=2, memory_cost=8192, parallelism=1)
+        old_hash = user.password
+        assert user.rehash_password_if_needed('securepassword') is True
+        assert user.password != old_hash
+        assert user.check_password('securepassword') is True
+    finally:
+        set_password_hasher()
+
+
 def test_find_by_username(test_session):
     user = EpicUser(
         role='COM',
@@ -277,3 +328,52 @@ def test_create_epic_event(test_session):
     test_session.commit()
     assert event.event_id is not None
     assert event.title == 'Event 1'
+
+
+def test_commercial_portfolio(test_session):
+    commercial = Commercial(first_name='Paul', last_name='Portfolio', username='pportfolio',
+                            email='pportfolio@epic.com', password='x', state='A')
+    test_session.add(commercial)
+    test_session.commit()
+    for index in range(2):
+        customer = Customer(first_name='Client', last_name=str(index), email='client@example.com',
+                            phone='0102030405', company_name='Company', commercial_id=commercial.epicuser_id)
+        test_session.add(customer)
+        test_session.flush()
+        for _ in range(3):
+            test_session.add(Contract(description='Portfolio', total_amount=100, customer_id=customer.customer_id))
+    test_session.commit()
+
+    assert len(commercial.portfolio_contracts) == 6
+    assert commercial.count_portfolio() == 6
+    page = commercial.portfolio_page(page=2, per_page=4)
+    assert len(page) == 2
+    assert all(contract.customer.commercial_id == commercial.epicuser_id for contract in page)
+
+
+def test_filter_indexes():
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    indexes = {index['name']: index['column_names'] for index in inspect(engine).get_indexes('contracts')}
+    assert indexes['ix_contracts_commercial_state_paiement'] == ['commercial_id', 'state', 'paiement_state']
+    assert 'ix_events_unassigned' in {index['name'] for index in inspect(engine).get_indexes('events')}
+
+
+def test_contract_rows(test_session):
+    commercial = Commercial(first_name='Rita', last_name='Rows', username='rrows',
+                            email='rrows@epic.com', password='x', state='A')
+    test_session.add(commercial)
+    test_session.flush()
+    customer = Customer(first_name='Client', last_name='Rows', email='rows@example.com',
+                        phone='0102030405', company_name='Rows', commercial_id=commercial.epicuser_id)
+    test_session.add(customer)
+    test_session.flush()
+    test_session.add(Contract(description='Rows', total_amount=100, state='S', customer_id=customer.customer_id))
+    test_session.commit()
+
+    query = ContractRow.query(test_session).filter(Customer.commercial_id == commercial.epicuser_id)
+    rows = fetch(ContractRow, query)
+    assert len(rows) == 1
+    assert rows[0].state == 'Signé'
+    assert rows[0].commercial_username == 'rrows'
+    assert rows[0].customer_last_name == 'Rows'
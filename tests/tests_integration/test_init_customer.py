@@ -4,7 +4,8 @@ from terminal.terminal_customer import EpicTerminalCustomer
 from views.customer_view import CustomerView
 from views.user_view import UserView
 from controllers.epic_controller import EpicDatabase
-from controllers.session import create_engine, sessionmaker
+from controllers.session import sessionmaker
+from sqlalchemy import create_engine
 from datetime import datetime
 
 
@@ -0,0 +1,36 @@
+import pytest
+from click.testing import CliRunner
+import os
+import sys
+from unittest.mock import MagicMock, patch
+# Déterminez le chemin absolu du répertoire parent
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.abspath(os.path.join(current_dir, '../../'))
+
+# Ajoutez le répertoire parent au PYTHONPATH
+sys.path.insert(0, parent_dir)
+
+from cli.script_cli import customer, export
+from controllers.unit_of_work import UnitOfWorkFailed
+
+
+@pytest.fixture
+def runner():
+    return CliRunner()
+
+
+@patch('controllers.epic_controller.EpicBase', MagicMock())
+def test_export_error_is_reported(runner):
+    with patch('controllers.export_controller.ExportBase.export', side_effect=PermissionError("Accès refusé")):
+        result = runner.invoke(export, ['customers'])
+    assert result.exit_code == 1
+    assert not isinstance(result.exception, NameError)
+    assert "Accès refusé" in result.output
+
+
+@patch('controllers.epic_controller.EpicBase', MagicMock())
+def test_cancelled_unit_is_reported(runner):
+    with patch('controllers.script_controller.ScriptBase.show', side_effect=UnitOfWorkFailed("Annulée")):
+        result = runner.invoke(customer, ['show', '1'])
+    assert result.exit_code == 1
+    assert "Annulée" in result.output
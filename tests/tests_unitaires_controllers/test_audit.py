@@ -0,0 +1,100 @@
+import csv
+import os
+import tempfile
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from config_test import DatabaseTestCase
+from controllers.audit import audited, history, set_actor, writer
+from controllers.contract_controller import ContractBase
+from controllers.event_controller import EventBase
+from controllers.import_controller import ImportBase
+from controllers.unit_of_work import unit_of_work
+from models.entities import AuditLog, Base, Customer, Event
+
+
+class TestAudit(DatabaseTestCase):
+
+    def database_url(self):
+        # L'écrivain du journal utilise sa propre connexion : la base doit être un fichier
+        return f"sqlite:///{os.path.join(self.directory.name, 'audit.db')}"
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        super().setUp()
+        self.customer = Customer(first_name='Jean', last_name='Dupont', email='jean@example.com', phone='0102030405',
+                                 company_name='Rivoli', commercial_id=self.commercial.epicuser_id)
+        self.session.add(self.customer)
+        self.session.commit()
+        self.event = Event(title='Salon', date_started=datetime(2026, 5, 1), date_ended=datetime(2026, 5, 2),
+                           customer_id=self.customer.customer_id)
+        self.session.add(self.event)
+        self.session.commit()
+        set_actor(self.session, self.commercial)
+
+    def tearDown(self):
+        writer.drain(5)
+        super().tearDown()
+        self.directory.cleanup()
+
+    def test_update_is_logged_with_actor_and_diff(self):
+        EventBase.update_event(self.event.event_id, {'title': 'Gala', 'attendees': 80}, self.session)
+        self.assertTrue(writer.drain(5))
+
+        entries = history(self.session, 'events', self.event.event_id)
+        self.assertEqual(len(entries), 1)
+        self.assertEqual((entries[0].action, entries[0].actor), ('event.update', 'pmartin'))
+        self.assertEqual(entries[0].changes['title'], ['Salon', 'Gala'])
+        self.assertEqual(entries[0].changes['attendees'], [None, 80])
+
+    def test_rolled_back_writes_are_not_logged(self):
+        data = {'description': 'Gala', 'total_amount': '1000', 'customer_id': self.customer.customer_id,
+                'commercial_id': self.commercial.epicuser_id}
+        with self.assertRaises(RuntimeError):
+            with unit_of_work(self.session):
+                ContractBase.create_contract(self.session, data)
+                raise RuntimeError
+        contract = ContractBase.create_contract(self.session, data)
+        self.assertTrue(writer.drain(5))
+
+        entries = history(self.session, 'contracts', contract.contract_id)
+        self.assertEqual([entry.action for entry in entries], ['contract.create'])
+        self.assertEqual(entries[0].changes['total_amount'], [None, '1000.00'])
+        self.assertEqual(self.session.query(AuditLog).filter_by(entity='contracts').count(), 1)
+
+    def test_bulk_import_is_logged_per_row(self):
+        path = os.path.join(self.directory.name, 'customers.csv')
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            rows = csv.writer(f)
+            rows.writerow(['first_name', 'last_name', 'email', 'phone', 'company_name', 'commercial'])
+            rows.writerows([[name, 'Durand', f'{name}@example.com', '0102030405', 'Vendome', 'pmartin']
+                            for name in ('Anne', 'Luc')])
+        importer = ImportBase(self.session)
+        importer.current_user = self.commercial
+        report = audited('customer.import')(ImportBase.import_rows)(importer, self.session, 'customers', path)
+        self.assertTrue(writer.drain(5))
+
+        self.assertEqual(report['imported'], 2)
+        luc = self.session.query(Customer).filter_by(first_name='Luc').one()
+        entries = history(self.session, 'customers', luc.customer_id)
+        self.assertEqual([(entry.action, entry.actor) for entry in entries], [('customer.import', 'pmartin')])
+        self.assertEqual(entries[0].changes['email'], [None, 'Luc@example.com'])
+
+    def test_in_memory_database_is_logged_synchronously(self):
+        # Base en mémoire partagée par une seule connexion (voir controllers.engine)
+        engine = create_engine('sqlite:///:memory:', poolclass=StaticPool, connect_args={'check_same_thread': False})
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        try:
+            event = Event(title='Salon', date_started=datetime(2026, 5, 1), date_ended=datetime(2026, 5, 2))
+            session.add(event)
+            session.commit()
+            EventBase.update_event(event.event_id, {'title': 'Gala'}, session)
+
+            entries = history(session, 'events', event.event_id)
+            self.assertEqual([entry.changes['title'] for entry in entries], [['Salon', 'Gala']])
+        finally:
+            session.close()
+            engine.dispose()
@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+
+from controllers.config import Config
+from controllers.database_controller import EpicDatabase
+from controllers.engine import dispose_engines
+from controllers.security import set_password_hasher
+from models.entities import Customer, EpicUser
+
+
+class TestSQLiteBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        set_password_hasher(time_cost=1, memory_cost=8, parallelism=1)
+
+    def tearDown(self):
+        set_password_hasher()
+        dispose_engines()
+        self.tmpdir.cleanup()
+
+    def test_config_selects_sqlite(self):
+        filename = os.path.join(self.tmpdir.name, 'database.ini')
+        with open(filename, 'w') as f:
+            f.write("[database]\nBACKEND = sqlite\n\n[sqlite]\nPATH = epic.db\n")
+        config = Config(filename)
+        self.assertEqual(config.backend, 'sqlite')
+        self.assertEqual(config.database, os.path.join(self.tmpdir.name, 'epic.db'))
+
+    def test_create_config_keeps_other_sections(self):
+        filename = os.path.join(self.tmpdir.name, 'database.ini')
+        with open(filename, 'w') as f:
+            f.write("[postgresql]\nDATABASE = old_db\nHOST = localhost\nUSER = user\nPASSWORD = pwd\nPORT = 5432\n\n"
+                    "[argon2]\nTIME_COST = 2\n")
+        Config(filename).create_config('app_db', 'admin', 'secret', '5432')
+        with open(filename) as f:
+            content = f.read()
+        self.assertIn('[argon2]', content)
+        self.assertIn('DATABASE = app_db', content)
+
+    def test_sqlite_file_database(self):
+        path = os.path.join(self.tmpdir.name, 'epic.db')
+        db = EpicDatabase(database=path, backend='sqlite')
+        db.database_creation(username=None, password=None)
+        self.assertTrue(os.path.exists(path))
+
+        user = EpicUser(role='COM', first_name='Jean', last_name='Dupont', username='jdupont',
+                        email='jdupont@epic.com', state='A')
+        user.set_password('secret')
+        db.session.add(user)
+        db.session.commit()
+        customer = Customer(first_name='Paul', last_name='Martin', email='paul@martin.fr', phone='0102030405',
+                            company_name='Martin', commercial_id=user.epicuser_id)
+        db.session.add(customer)
+        db.session.commit()
+
+        self.assertIsNotNone(customer.update_time)
+        self.assertEqual(db.check_connection('jdupont', 'secret').epicuser_id, user.epicuser_id)
+        db.database_disconnect()
+
+
+if __name__ == '__main__':
+    unittest.main()
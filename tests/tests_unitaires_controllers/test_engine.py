@@ -0,0 +1,40 @@
+import os
+import tempfile
+import unittest
+
+from controllers.engine import database_url, dispose_engines, get_engine
+
+
+class TestEngineRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, 'database.ini')
+        with open(self.filename, 'w') as f:
+            f.write("[postgresql]\nDATABASE = app_db\nHOST = localhost\nUSER = user\nPASSWORD = pwd\nPORT = 5432\n\n"
+                    "[pool]\nPOOL_SIZE = 3\nMAX_OVERFLOW = 2\nPOOL_RECYCLE = 60\nSTATEMENT_TIMEOUT = 5000\n")
+
+    def tearDown(self):
+        dispose_engines()
+        self.tmpdir.cleanup()
+
+    def test_engine_is_shared(self):
+        engine = get_engine(filename=self.filename)
+        url = database_url('app_db', 'localhost', 'user', 'pwd', '5432')
+        self.assertIs(get_engine(url, filename=self.filename), engine)
+
+    def test_pool_configuration(self):
+        engine = get_engine(filename=self.filename)
+        self.assertEqual(engine.pool.size(), 3)
+        self.assertEqual(engine.pool._max_overflow, 2)
+        self.assertEqual(engine.pool._recycle, 60)
+        self.assertTrue(engine.pool._pre_ping)
+
+    def test_dispose_engines_empties_registry(self):
+        engine = get_engine(filename=self.filename)
+        dispose_engines()
+        self.assertIsNot(get_engine(filename=self.filename), engine)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import gzip
+import json
+import os
+import tempfile
+
+from config_test import DatabaseTestCase
+from controllers.export_controller import ExportBase
+from models.entities import Contract, Customer, Paiement
+from models.read_models import ContractPaiementRow
+from views.script_view import ScriptView, open_output
+
+
+class TestExport(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        customer = Customer(first_name='Jean', last_name='Dupont', email='jean@example.com', phone='0102030405',
+                            company_name='Rivoli', commercial_id=self.commercial.epicuser_id)
+        self.session.add(customer)
+        self.session.commit()
+        self.contracts = [Contract(description=f'Contrat {i}', total_amount=1000, customer_id=customer.customer_id)
+                          for i in range(3)]
+        self.session.add_all(self.contracts)
+        self.session.commit()
+        self.session.add_all([Paiement('P1', 200, self.contracts[0].contract_id),
+                              Paiement('P2', 300, self.contracts[0].contract_id),
+                              Paiement('P3', 100, self.contracts[2].contract_id)])
+        self.session.commit()
+        self.exporter = ExportBase(self.session)
+        self.exporter.current_user = self.commercial
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        super().tearDown()
+        self.directory.cleanup()
+
+    def test_contract_paiements_totals(self):
+        rows = list(self.exporter.rows(self.session, 'contract_paiements', batch_size=2))
+        self.assertEqual([(row.paiement_count, row.paid_amount) for row in rows], [(2, 500), (0, 0), (1, 100)])
+        self.assertEqual(rows[0].company_name, 'Rivoli')
+
+    def test_export_jsonl_gzip_with_progress(self):
+        path = os.path.join(self.directory.name, 'paiements.jsonl.gz')
+        counts = []
+        with open_output(path) as stream:
+            count = ScriptView.write_rows(self.exporter.rows(self.session, 'contract_paiements'),
+                                          ContractPaiementRow._fields, 'jsonl', stream, counts.append)
+        self.assertEqual(count, 3)
+        self.assertEqual(counts, [3])
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual([line['contract_id'] for line in lines], [c.contract_id for c in self.contracts])
+        self.assertEqual(lines[0]['paid_amount'], '500.00')
@@ -0,0 +1,84 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from config_test import DatabaseTestCase
+from controllers.import_controller import ImportBase
+from models.entities import Contract, Customer, Event
+
+
+class TestImport(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.importer = ImportBase(self.session)
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        super().tearDown()
+        self.directory.cleanup()
+
+    def write(self, name, rows):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        return path
+
+    def test_import_customers_rejects_invalid_rows(self):
+        self.importer.current_user = self.gestion
+        good = {'first_name': 'Jean-Éric', 'last_name': 'Dupont', 'email': 'jean@example.com',
+                'phone': '01 02 03 04 05', 'company_name': 'Rivoli Events', 'commercial': 'pmartin'}
+        path = self.write('customers.csv', [
+            good,
+            dict(good, email='pas-un-email'),
+            dict(good, commercial='inconnu'),
+            dict(good, first_name='Anne', commercial=''),
+        ])
+        report = self.importer.import_rows(self.session, 'customers', path, chunk_size=2)
+        self.assertEqual((report['read'], report['imported'], report['rejected']), (4, 2, 2))
+
+        customers = self.session.query(Customer).order_by(Customer.customer_id).all()
+        self.assertEqual([(c.first_name, c.commercial_id) for c in customers],
+                         [('Jean-Éric', self.commercial.epicuser_id), ('Anne', None)])
+        with open(report['errors_path'], newline='', encoding='utf-8') as f:
+            errors = list(csv.DictReader(f))
+        self.assertEqual([error['line'] for error in errors], ['3', '4'])
+        self.assertTrue(errors[0]['error'].startswith('email'))
+
+    def test_import_contracts_and_events_resolve_parents(self):
+        customer = Customer(first_name='Jean', last_name='Dupont', email='jean@example.com', phone='0102030405',
+                            company_name='Rivoli', commercial_id=self.commercial.epicuser_id)
+        self.session.add(customer)
+        self.session.commit()
+
+        self.importer.current_user = self.gestion
+        path = self.write('contracts.csv', [
+            {'description': 'Gala annuel', 'total_amount': '1500', 'customer_id': customer.customer_id,
+             'gestion': 'jdurand'},
+            {'description': 'Salon', 'total_amount': '900', 'customer_id': '999', 'gestion': ''},
+        ] + [{'description': 'Congrès', 'total_amount': total, 'customer_id': customer.customer_id, 'gestion': ''}
+             for total in ('12 abc', '399999', '100000.999')])
+        report = self.importer.import_rows(self.session, 'contracts', path)
+        self.assertEqual((report['imported'], report['rejected']), (1, 4))
+        contract = self.session.query(Contract).one()
+        self.assertEqual((contract.commercial_id, contract.gestion_id, contract.remaining_amount),
+                         (self.commercial.epicuser_id, self.gestion.epicuser_id, 1500.0))
+
+        self.importer.current_user = self.commercial
+        path = self.write('events.csv', [
+            {'title': 'Soiree', 'location': 'Paris', 'attendees': '', 'date_started': '01/02/2026',
+             'date_ended': '02/02/2026', 'contract_id': contract.contract_id, 'support': ''},
+        ])
+        self.assertEqual(self.importer.import_rows(self.session, 'events', path)['rejected'], 1)
+        contract.state = 'S'
+        self.session.commit()
+        self.assertEqual(self.importer.import_rows(self.session, 'events', path)['imported'], 1)
+        event = self.session.query(Event).one()
+        self.assertEqual((event.customer_id, event.attendees), (customer.customer_id, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+
+from config_test import DatabaseTestCase
+from controllers.loading import loading_plan
+from models.entities import Contract, Customer, Paiement
+
+
+class TestLoadingPlans(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        for index in range(5):
+            customer = Customer(first_name='Client', last_name=str(index), email='client@example.com',
+                                phone='0102030405', company_name='Company', commercial_id=self.commercial.epicuser_id)
+            self.session.add(customer)
+            self.session.flush()
+            contract = Contract(description=f'Contrat {index}', total_amount=100, customer_id=customer.customer_id)
+            self.session.add(contract)
+            self.session.flush()
+            self.session.add(Paiement(f'P{index}', 10, contract.contract_id))
+        self.session.commit()
+        self.session.expunge_all()
+
+        self.statements = []
+        event.listen(self.engine, 'before_cursor_execute', self.count_statement)
+
+    def tearDown(self):
+        event.remove(self.engine, 'before_cursor_execute', self.count_statement)
+        super().tearDown()
+
+    def count_statement(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def test_contract_list_runs_a_single_query(self):
+        contracts = self.session.query(Contract).options(*loading_plan('contract_list')).all()
+        usernames = {contract.customer.commercial.username for contract in contracts}
+        self.assertEqual(usernames, {'pmartin'})
+        self.assertEqual(len(self.statements), 1)
+
+    def test_strict_plan_refuses_unplanned_relationship(self):
+        contract = self.session.query(Contract).options(*loading_plan('contract_picker', strict=True)).first()
+        with self.assertRaises(InvalidRequestError):
+            contract.paiements
+
+    def test_contract_detail_loads_paiements_without_extra_rows(self):
+        contracts = self.session.query(Contract).options(*loading_plan('contract_detail')).all()
+        self.assertEqual(len(contracts), 5)
+        self.assertTrue(all(len(contract.paiements) == 1 for contract in contracts))
+        count = len(self.statements)
+        [contract.events for contract in contracts]
+        self.assertEqual(len(self.statements), count)
+
+
+if __name__ == '__main__':
+    unittest.main()
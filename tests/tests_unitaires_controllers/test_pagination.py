@@ -0,0 +1,53 @@
+import unittest
+from unittest.mock import patch, MagicMock
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from controllers.pagination import KeysetPager, browse
+from models.entities import Base, Customer
+from models.read_models import CustomerRow
+
+
+class TestKeysetPager(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        # Deux clients par nom : la pagination doit départager par identifiant
+        for index in range(7):
+            self.session.add(Customer(first_name='Client', last_name=f'Nom{index // 2}', email='client@example.com',
+                                      phone='0102030405', company_name='Company'))
+        self.session.commit()
+        self.pager = KeysetPager(CustomerRow.query(self.session), CustomerRow,
+                                 [Customer.last_name, Customer.customer_id], ['last_name', 'customer_id'],
+                                 page_size=3)
+
+    def tearDown(self):
+        self.session.close()
+        Base.metadata.drop_all(self.engine)
+
+    def test_next_and_previous(self):
+        first = [row.customer_id for row in self.pager.first()]
+        self.assertEqual(first, [1, 2, 3])
+        self.assertTrue(self.pager.has_next)
+        self.assertFalse(self.pager.has_previous)
+
+        self.assertEqual([row.customer_id for row in self.pager.next()], [4, 5, 6])
+        self.assertEqual([row.customer_id for row in self.pager.next()], [7])
+        self.assertFalse(self.pager.has_next)
+
+        self.assertEqual([row.customer_id for row in self.pager.previous()], [4, 5, 6])
+        self.assertEqual([row.customer_id for row in self.pager.previous()], first)
+        self.assertFalse(self.pager.has_previous)
+        self.assertEqual(self.pager.page_number, 1)
+
+    @patch('controllers.pagination.DataView.prompt_page_navigation', side_effect=['next', 'quit'])
+    def test_browse(self, mock_navigation):
+        display = MagicMock()
+        browse(self.pager, display)
+        self.assertEqual([call.kwargs['page'] for call in display.call_args_list], [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
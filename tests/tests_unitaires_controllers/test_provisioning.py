@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from controllers.provisioning_controller import ProvisioningBase
+from controllers.security import set_password_hasher
+from models.entities import Base, EpicUser, escape_like
+
+
+class TestProvisioning(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        # Paramètres Argon2 minimaux pour des tests rapides
+        set_password_hasher(time_cost=1, memory_cost=8, parallelism=1)
+
+    def tearDown(self):
+        set_password_hasher()
+        self.session.close()
+        Base.metadata.drop_all(self.engine)
+
+    def test_escape_like(self):
+        self.assertEqual(escape_like('j_du%pont'), 'j\\_du\\%pont')
+
+    def test_read_employees_csv_and_jsonl(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            csv_path = os.path.join(tmpdir, 'employees.csv')
+            with open(csv_path, 'w', encoding='utf-8') as f:
+                f.write("first_name,last_name,password,role\nJean,Dupont,secret,COM\n")
+            jsonl_path = os.path.join(tmpdir, 'employees.jsonl')
+            with open(jsonl_path, 'w', encoding='utf-8') as f:
+                f.write('{"first_name": "Jean", "last_name": "Dupont", "password": "secret", "role": "COM"}\n\n')
+
+            self.assertEqual(ProvisioningBase.read_employees(csv_path)[0][0], 2)
+            self.assertEqual(ProvisioningBase.read_employees(jsonl_path)[0][1]['last_name'], 'Dupont')
+
+    def test_insert_users(self):
+        existing = EpicUser(role='COM', first_name='Jean', last_name='Dupont', username='jdupont',
+                            password='x', email='jdupont@epic.com', state='A')
+        self.session.add(existing)
+        self.session.commit()
+
+        rows = [
+            (2, {'first_name': 'Julie', 'last_name': 'Dupont', 'password': 'secret', 'role': 'Support'}),
+            (3, {'first_name': 'Jules', 'last_name': 'Dupont', 'password': 'secret', 'role': 'GES'}),
+            (4, {'first_name': 'Paul', 'last_name': 'Martin', 'password': '', 'role': 'ADM'}),
+            (5, {'first_name': 'Paul', 'last_name': 'Martin', 'password': 'secret', 'role': 'Chef'}),
+            (6, {'first_name': 'Marc', 'last_name': 'Petit', 'password': 1234, 'role': 'COM'}),
+            (7, ['Marc', 'Petit', 'secret', 'COM']),
+        ]
+        report = ProvisioningBase.insert_users(self.session, rows, workers=1)
+
+        self.assertEqual([entry['status'] for entry in report],
+                         ['created', 'created', 'error', 'error', 'created', 'error'])
+        self.assertEqual([entry['username'] for entry in report[:2]], ['jdupont1', 'jdupont2'])
+        user = self.session.query(EpicUser).filter_by(username='jdupont2').one()
+        self.assertEqual(user.email, 'jdupont2@epic.com')
+        self.assertEqual(user.role, 'GES')
+        self.assertTrue(user.check_password('secret'))
+        self.assertTrue(self.session.query(EpicUser).filter_by(username='mpetit').one().check_password('1234'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+from sqlalchemy import event
+
+from config_test import DatabaseTestCase
+from controllers.reference import directory
+from models.entities import Commercial
+
+
+class TestReference(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.session.add(Commercial(first_name='Léa', last_name='Petit', username='lpetit',
+                                    email='lpetit@epic.com', password='x', state='I'))
+        self.session.commit()
+        self.statements = []
+        event.listen(self.engine, 'before_cursor_execute', self.count)
+
+    def tearDown(self):
+        event.remove(self.engine, 'before_cursor_execute', self.count)
+        super().tearDown()
+
+    def count(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def test_users_are_served_from_cache(self):
+        commercial_id = self.commercial.epicuser_id
+        self.assertEqual([user.username for user in directory.users(self.session, 'COM')], ['pmartin'])
+        loaded = len(self.statements)
+        self.assertEqual(directory.get(self.session, commercial_id).username, 'pmartin')
+        self.assertEqual(directory.find(self.session, 'jdurand', 'GES').role, 'GES')
+        self.assertIsNone(directory.find(self.session, 'lpetit', 'COM'))
+        self.assertEqual([user.username for user in directory.users(self.session, 'COM', 'I')], ['lpetit'])
+        self.assertEqual(len(self.statements), loaded)
+
+    def test_cache_is_invalidated_by_user_writes(self):
+        directory.users(self.session, 'COM')
+        self.commercial.state = 'I'
+        self.session.add(Commercial(first_name='Marc', last_name='Roux', username='mroux',
+                                    email='mroux@epic.com', password='x', state='A'))
+        self.session.commit()
+        self.assertEqual([user.username for user in directory.users(self.session, 'COM')], ['mroux'])
@@ -0,0 +1,53 @@
+from decimal import Decimal
+
+from config_test import DatabaseTestCase
+from controllers import reporting
+from controllers.reporting import ReportBase
+from models.entities import Contract, Customer, Paiement
+
+
+class TestReporting(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        customers = [Customer(first_name='Jean', last_name='Dupont', email=f'{name}@example.com', phone='0102030405',
+                              company_name=name, commercial_id=commercial_id)
+                     for name, commercial_id in (('Rivoli', self.commercial.epicuser_id), ('Vendome', None))]
+        self.session.add_all(customers)
+        self.session.commit()
+        self.signed = Contract(description='Salon', total_amount=Decimal('1000.10'),
+                               customer_id=customers[0].customer_id, state='S')
+        unsigned = Contract(description='Gala', total_amount=Decimal('500.00'),
+                            customer_id=customers[0].customer_id, state='C')
+        unassigned = Contract(description='Congrès', total_amount=Decimal('0.30'),
+                              customer_id=customers[1].customer_id, state='S')
+        # Le constructeur initialise le restant dû au montant total
+        self.signed.remaining_amount = Decimal('699.95')
+        unassigned.remaining_amount = Decimal('0.10')
+        self.session.add_all([self.signed, unsigned, unassigned])
+        self.session.commit()
+        self.session.add(Paiement('P1', Decimal('300.15'), self.signed.contract_id))
+        self.session.commit()
+        self.reports = ReportBase(self.session)
+        self.reports.current_user = self.commercial
+        reporting.invalidate_reports()
+
+    def test_report_by_commercial_is_exact(self):
+        rows = self.reports.rows(self.session, 'commercial')
+        self.assertEqual([(row.label, row.count, row.signed, row.collected, row.outstanding, row.total)
+                          for row in rows], [
+            (None, 1, Decimal('0.30'), Decimal('0.20'), Decimal('0.10'), False),
+            ('pmartin', 2, Decimal('1000.10'), Decimal('300.15'), Decimal('699.95'), False),
+            (None, 3, Decimal('1000.40'), Decimal('300.35'), Decimal('700.05'), True),
+        ])
+        mine = self.reports.rows(self.session, 'customer', mine=True)
+        self.assertEqual([row.label for row in mine], ['Rivoli', None])
+
+    def test_cache_until_next_paiement(self):
+        first = self.reports.rows(self.session, 'month')
+        self.assertIs(self.reports.rows(self.session, 'month'), first)
+        self.assertEqual(first[-1].collected, Decimal('300.15'))
+
+        self.session.add(Paiement('P2', Decimal('99.95'), self.signed.contract_id))
+        self.session.commit()
+        self.assertEqual(self.reports.rows(self.session, 'month')[-1].collected, Decimal('400.10'))
@@ -0,0 +1,53 @@
+import unittest
+
+from config_test import DatabaseTestCase
+from controllers.scope import WRITE, scope
+from models.entities import Contract, Customer, Event, Support
+from datetime import datetime
+
+
+class TestScope(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.support = Support(first_name='Marc', last_name='Petit', username='mpetit',
+                               email='mpetit@epic.com', password='x', state='A')
+        self.session.add(self.support)
+        self.session.flush()
+        mine = Customer(first_name='A', last_name='Mine', email='a@example.com', phone='01',
+                        company_name='A', commercial_id=self.commercial.epicuser_id)
+        other = Customer(first_name='B', last_name='Other', email='b@example.com', phone='02', company_name='B')
+        self.session.add_all([mine, other])
+        self.session.flush()
+        self.session.add_all([
+            Contract(description='Mine', total_amount=10, customer_id=mine.customer_id),
+            Contract(description='Other', total_amount=10, customer_id=other.customer_id,
+                     gestion_id=self.gestion.epicuser_id),
+            Event(title='Mine', date_started=datetime.now(), date_ended=datetime.now(),
+                  customer_id=mine.customer_id, support_id=self.support.epicuser_id),
+            Event(title='Other', date_started=datetime.now(), date_ended=datetime.now(),
+                  customer_id=other.customer_id),
+        ])
+        self.session.commit()
+
+    def titles(self, entity, column, user, **kwargs):
+        return sorted(value for value, in scope(self.session.query(column), entity, user, **kwargs))
+
+    def test_read_shows_everything(self):
+        self.assertEqual(self.titles(Contract, Contract.description, self.support), ['Mine', 'Other'])
+
+    def test_write_restricts_to_own_items(self):
+        self.assertEqual(self.titles(Contract, Contract.description, self.commercial, action=WRITE), ['Mine'])
+        self.assertEqual(self.titles(Event, Event.title, self.commercial, action=WRITE), ['Mine'])
+        self.assertEqual(self.titles(Event, Event.title, self.support, action=WRITE), ['Mine'])
+        self.assertEqual(self.titles(Contract, Contract.description, self.gestion, action=WRITE), ['Mine', 'Other'])
+        self.assertEqual(self.titles(Contract, Contract.description, self.support, action=WRITE), [])
+
+    def test_mine_and_unassigned(self):
+        self.assertEqual(self.titles(Contract, Contract.description, self.gestion, mine=True), ['Other'])
+        self.assertEqual(self.titles(Event, Event.title, self.gestion, unassigned=True), ['Other'])
+        self.assertEqual(self.titles(Customer, Customer.last_name, self.commercial, mine=True), ['Mine'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import io
+import json
+import unittest
+from datetime import datetime
+
+from config_test import DatabaseTestCase
+from controllers.scope import WRITE
+from controllers.script_controller import ScriptBase, checked_values, record_fields
+from models.entities import Customer
+from views.script_view import ScriptView
+
+
+class TestScript(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.session.add_all([
+            Customer(first_name='Jean', last_name='Dupont', email='jean@rivoli.fr', phone='0102030405',
+                     company_name='Rivoli', commercial_id=self.commercial.epicuser_id),
+            Customer(first_name='Anne', last_name='Lefort', email='anne@example.com', phone='0607080910',
+                     company_name='Salon'),
+        ])
+        self.session.commit()
+        self.script = ScriptBase(self.session)
+
+    def test_records_filters_and_scope(self):
+        self.script.current_user = self.gestion
+        rows = list(self.script.records(self.session, 'customers', {'commercial': 'pmartin', 'company': None}))
+        self.assertEqual([row.last_name for row in rows], ['Dupont'])
+        rows = list(self.script.records(self.session, 'customers', {'company': 'SAL'}))
+        self.assertEqual([row.last_name for row in rows], ['Lefort'])
+        self.assertEqual([row.username for row in self.script.records(self.session, 'users', {'role': 'COM'})],
+                         ['pmartin'])
+
+        self.script.current_user = self.commercial
+        self.assertEqual([row.last_name for row in self.script.records(self.session, 'customers', mine=True)],
+                         ['Dupont'])
+        lefort = self.session.query(Customer).filter_by(last_name='Lefort').one()
+        self.assertEqual(self.script.row(self.session, 'customers', lefort.customer_id).company_name, 'Salon')
+        with self.assertRaises(ValueError):
+            self.script.row(self.session, 'customers', lefort.customer_id, WRITE)
+
+    def test_checked_values_uses_import_rules(self):
+        self.assertEqual(checked_values('customers', {'email': ' anne@salon.fr ', 'commercial': 'pmartin'}),
+                         {'email': 'anne@salon.fr', 'commercial': 'pmartin'})
+        for data in ({'email': 'pas-un-email'}, {'phone': 'abc'}, {'last_name': ''}):
+            with self.assertRaises(ValueError):
+                checked_values('customers', data)
+
+    def test_write_rows_jsonl_and_csv(self):
+        self.script.current_user = self.gestion
+        rows = list(self.script.records(self.session, 'customers', {'commercial': 'pmartin'}))
+
+        stream = io.StringIO()
+        self.assertEqual(ScriptView.write_rows(rows, record_fields('customers'), 'jsonl', stream), 1)
+        line = json.loads(stream.getvalue())
+        self.assertEqual((line['company_name'], line['commercial_username']), ('Rivoli', 'pmartin'))
+        self.assertEqual(datetime.fromisoformat(line['creation_time']), rows[0].creation_time)
+
+        stream = io.StringIO()
+        ScriptView.write_rows(rows, record_fields('customers'), 'csv', stream)
+        header, row = stream.getvalue().splitlines()
+        self.assertTrue(header.startswith('customer_id,first_name,last_name'))
+        self.assertIn('Rivoli', row)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from datetime import datetime
+
+from config_test import DatabaseTestCase
+from controllers.search import search
+from models.entities import Contract, Customer, Event
+
+
+class TestSearch(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        dupont = Customer(first_name='Jean', last_name='Dupont', email='jean@rivoli.fr', phone='0102030405',
+                          company_name='Rivoli', commercial_id=self.commercial.epicuser_id)
+        lefort = Customer(first_name='Anne', last_name='Lefort', email='anne@example.com', phone='0607080910',
+                          company_name='Salon Dupont')
+        self.session.add_all([dupont, lefort])
+        self.session.flush()
+        contract = Contract(description='Gala Rivoli', total_amount=1000, customer_id=lefort.customer_id)
+        self.session.add(contract)
+        self.session.flush()
+        self.session.add(Event(title='Soirée', location='Paris Rivoli', date_started=datetime(2026, 1, 1),
+                               date_ended=datetime(2026, 1, 2), customer_id=lefort.customer_id,
+                               contract_id=contract.contract_id))
+        self.session.commit()
+
+    def test_search_across_entities_ranks_prefix_first(self):
+        hits = search(self.session, self.gestion, 'rivoli')
+        self.assertEqual([hit.kind for hit in hits], ['Client', 'Contrat', 'Evènement'])
+        hits = search(self.session, self.gestion, 'dupont')
+        self.assertEqual([hit.label for hit in hits], ['Jean Dupont', 'Anne Lefort'])
+        self.assertEqual([hit.kind for hit in search(self.session, self.gestion, '0607')], ['Client'])
+
+    def test_every_word_must_match(self):
+        self.assertEqual([hit.label for hit in search(self.session, self.gestion, 'salon dupont')], ['Anne Lefort'])
+        self.assertEqual(search(self.session, self.gestion, 'salon paris'), [])
+        self.assertEqual(search(self.session, self.gestion, ' % '), [])
+
+    def test_search_mine(self):
+        hits = search(self.session, self.commercial, 'rivoli', mine=True)
+        self.assertEqual([(hit.kind, hit.label) for hit in hits], [('Client', 'Jean Dupont')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
 import os
 import sys
+import tempfile
 import unittest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock
 import jwt
 # Déterminez le chemin absolu du répertoire parent
 current_dir = os.path.dirname(__file__)
@@ -13,8 +14,13 @@ print(parent_dir)
 
 # Imports des fonctions à tester depuis le fichier cible
 from controllers.session import (
-    create_token, load_session, clear_session,
-    renew_session, get_current_user, force_refresh_token, serialize_user
+    create_token, load_session, clear_session, save_session,
+    renew_session, get_current_user, force_refresh_token, serialize_user,
+    load_principal, resolve_principal_user, invalidate_principal, decode_token,
+    validate_session
+)
+from controllers.session_store import (
+    FileSessionStore, MemorySessionStore, SQLiteSessionStore, set_session_store
 )
 
 
@@ -35,19 +41,19 @@ class TestEpicFunctions(unittest.TestCase):
         self.assertEqual(decoded['username'], self.user_data['username'])
         self.assertEqual(decoded['role'], self.user_data['role'])
 
-    @patch("controllers.session.open", new_callable=mock_open, read_data='{"token": "sometoken"}')
-    @patch("controllers.session.os.path.join", return_value="/test/path/session.json")
-    def test_load_session(self, mock_path_join, mock_open_func):
-        token = load_session()
-        mock_open_func.assert_called_once_with("/test/path/session.json", 'r')
+    def test_load_session(self):
+        store = MemorySessionStore()
+        store.save('sometoken')
+        with patch("controllers.session.get_session_store", return_value=store):
+            token = load_session()
         self.assertEqual(token, 'sometoken')
 
-    @patch("controllers.session.os.remove")
     @patch("controllers.session.logging.info")
-    def test_clear_session(self, mock_logging_info, mock_os_remove):
-        with patch("controllers.session.os.path.exists", return_value=True):
+    def test_clear_session(self, mock_logging_info):
+        store = MagicMock()
+        with patch("controllers.session.get_session_store", return_value=store):
             clear_session()
-            mock_os_remove.assert_called_once_with('session.json')
+            store.clear.assert_called_once_with()
             mock_logging_info.assert_called_once_with("Fichier de session supprimé avec succès.")
 
     @patch("controllers.session.get_current_user")
@@ -115,3 +121,116 @@ class TestEpicFunctions(unittest.TestCase):
         self.assertEqual(user_dict['first_name'], 'Test')
         self.assertEqual(user_dict['last_name'], 'User')
         self.assertEqual(user_dict['state'], 'Actif')
+
+
+class TestPrincipalCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        set_session_store(FileSessionStore(os.path.join(self.tmpdir.name, 'session.json')))
+        invalidate_principal()
+        save_session(create_token({'username': 'tuser', 'role': 'ADM'}))
+
+    def tearDown(self):
+        invalidate_principal()
+        set_session_store(None)
+        self.tmpdir.cleanup()
+
+    def test_load_principal_decodes_once(self):
+        with patch("controllers.session.decode_token", wraps=decode_token) as mock_decode:
+            first = load_principal()
+            second = load_principal()
+        self.assertIs(first, second)
+        self.assertEqual(first['claims']['username'], 'tuser')
+        mock_decode.assert_called_once()
+
+    def test_clear_session_invalidates_principal(self):
+        load_principal()
+        clear_session()
+        with self.assertRaises(PermissionError):
+            load_principal()
+
+    def test_resolve_principal_user_queries_once(self):
+        session = MagicMock()
+        user = MagicMock(epicuser_id=7, role=MagicMock(code='ADM'), state=MagicMock(code='A'))
+        session.query.return_value.filter_by.return_value.one_or_none.return_value = user
+        session.get.return_value = user
+
+        self.assertIs(resolve_principal_user(session), user)
+        self.assertIs(resolve_principal_user(session), user)
+
+        session.query.assert_called_once()
+        session.get.assert_called_once()
+        principal = load_principal()
+        self.assertEqual((principal['user_id'], principal['role'], principal['state']), (7, 'ADM', 'A'))
+
+    def _session_returning(self, role, state):
+        session = MagicMock()
+        user = MagicMock(epicuser_id=7, role=MagicMock(code=role), state=MagicMock(code=state))
+        session.query.return_value.filter_by.return_value.one_or_none.return_value = user
+        return session, user
+
+    def test_validate_session_active_user(self):
+        session, user = self._session_returning('ADM', 'A')
+        self.assertIs(validate_session(session), user)
+
+    def test_validate_session_inactive_user(self):
+        session, _ = self._session_returning('ADM', 'I')
+        with self.assertRaises(PermissionError):
+            validate_session(session)
+
+    def test_validate_session_role_changed(self):
+        session, _ = self._session_returning('SUP', 'A')
+        with self.assertRaises(PermissionError):
+            validate_session(session)
+
+
+class TestSessionStores(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_memory_store(self):
+        store = MemorySessionStore()
+        self.assertIsNone(store.load())
+        self.assertIsNone(store.version())
+        store.save('token1')
+        version = store.version()
+        store.save('token2')
+        self.assertEqual(store.load(), 'token2')
+        self.assertNotEqual(store.version(), version)
+        store.clear()
+        self.assertIsNone(store.load())
+
+    def test_file_store_atomic_write_and_cached_reads(self):
+        path = os.path.join(self.tmpdir.name, 'session.json')
+        store = FileSessionStore(path)
+        store.save('token1')
+        self.assertEqual(os.listdir(self.tmpdir.name), ['session.json'])
+
+        with patch("controllers.session_store.open") as mock_open_func:
+            self.assertEqual(store.load(), 'token1')
+        mock_open_func.assert_not_called()
+
+        # Un autre processus lit la même session depuis le fichier
+        self.assertEqual(FileSessionStore(path).load(), 'token1')
+        store.clear()
+        self.assertFalse(os.path.exists(path))
+        with self.assertRaises(OSError):
+            store.clear()
+
+    def test_sqlite_store_keeps_one_session_per_operator(self):
+        path = os.path.join(self.tmpdir.name, 'session.sqlite3')
+        alice = SQLiteSessionStore(path, 'alice')
+        bob = SQLiteSessionStore(path, 'bob')
+        alice.save('token-alice')
+        bob.save('token-bob')
+
+        self.assertEqual(SQLiteSessionStore(path, 'alice').load(), 'token-alice')
+        self.assertEqual(SQLiteSessionStore(path, 'bob').load(), 'token-bob')
+        bob.clear()
+        self.assertIsNone(SQLiteSessionStore(path, 'bob').load())
+        self.assertEqual(SQLiteSessionStore(path, 'alice').load(), 'token-alice')
@@ -0,0 +1,41 @@
+import unittest
+
+from config_test import DatabaseTestCase
+from controllers.scope import WRITE
+from controllers.typeahead import customer_typeahead, user_typeahead
+from models.entities import Customer
+
+
+class TestTypeahead(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        for index in range(30):
+            self.session.add(Customer(first_name='Client', last_name=f'Dupont{index:02d}', email='c@example.com',
+                                      phone='01', company_name='Acme_Events',
+                                      commercial_id=self.commercial.epicuser_id if index < 2 else None))
+        self.session.add(Customer(first_name='Anne', last_name='Lefort', email='a@example.com',
+                                  phone='01', company_name='Rivoli'))
+        self.session.commit()
+
+    def test_results_are_limited(self):
+        customers = customer_typeahead(self.session, self.gestion)
+        self.assertEqual(len(customers('dup')), 20)
+        self.assertEqual(customers('lef')[0][1], '31 - Anne Lefort (Rivoli)')
+
+    def test_short_input_matches_prefix_and_digits_match_id(self):
+        customers = customer_typeahead(self.session, self.gestion)
+        self.assertEqual(customers('vo'), [])
+        self.assertEqual([key for key, label in customers('ri')], [31])
+        self.assertEqual([key for key, label in customers('ri_')], [])
+        self.assertEqual([key for key, label in customers('riv')], [31])
+        self.assertEqual(customers('31')[0][0], 31)
+
+    def test_scope_and_role(self):
+        customers = customer_typeahead(self.session, self.commercial, WRITE)
+        self.assertEqual([key for key, label in customers('')], [1, 2])
+        self.assertEqual(user_typeahead(self.session, 'GES')('jd'), [(self.gestion.epicuser_id, 'jdurand (Julie Durand)')])
+
+
+if __name__ == '__main__':
+    unittest.main()
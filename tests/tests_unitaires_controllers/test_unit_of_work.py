@@ -0,0 +1,62 @@
+import unittest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from controllers.contract_controller import ContractBase
+from controllers.customer_controller import CustomerBase
+from controllers.unit_of_work import UnitOfWorkFailed, rollback, unit_of_work
+from models.entities import Base, Contract, Customer
+
+
+class TestUnitOfWork(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.session = scoped_session(sessionmaker(bind=self.engine))
+        self.statements = []
+        event.listen(self.engine, 'before_cursor_execute',
+                     lambda conn, cursor, statement, *args: self.statements.append(statement))
+
+    def tearDown(self):
+        self.session.remove()
+        Base.metadata.drop_all(self.engine)
+
+    def create(self, session, first_name='Jean'):
+        customer = CustomerBase.create_customer(session, {
+            'first_name': first_name, 'last_name': 'Dupont', 'email': f'{first_name}@example.com',
+            'phone': '0102030405', 'company_name': 'Rivoli'})
+        return ContractBase.create_contract(session, {
+            'description': 'Salon', 'total_amount': 1000, 'customer_id': customer.customer_id,
+            'commercial_id': None})
+
+    def test_single_commit_then_fresh_reads(self):
+        commits = []
+        event.listen(self.session(), 'after_commit', lambda session: commits.append(session))
+
+        with unit_of_work(self.session) as session:
+            contract_id = self.create(session).contract_id
+            self.assertIsNotNone(contract_id)
+
+        self.assertEqual(len(commits), 1)
+        # Une écriture d'une autre session est vue après la validation de l'unité
+        other = sessionmaker(bind=self.engine)()
+        other.get(Contract, contract_id).description = 'Gala'
+        other.commit()
+        other.close()
+        self.assertEqual(self.session.query(Contract).one().description, 'Gala')
+
+    def test_failed_action_is_rolled_back(self):
+        with self.assertRaises(UnitOfWorkFailed):
+            with unit_of_work(self.session) as session:
+                self.create(session, 'Jean')
+                rollback(session)
+                self.create(session, 'Anne')
+
+        with self.assertRaises(RuntimeError):
+            with unit_of_work(self.session) as session:
+                self.create(session, 'Paul')
+                raise RuntimeError
+
+        self.assertEqual(self.session.query(Customer).count(), 0)
+        self.assertEqual(self.session.query(Contract).count(), 0)
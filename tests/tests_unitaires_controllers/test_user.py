@@ -106,3 +106,46 @@ class TestEpicBase(unittest.TestCase):
 
         updated_user = self.session.query(EpicUser).filter_by(username='jdoe').first()
         self.assertEqual(updated_user.state, 'I')
+
+    def add_gestion(self, username, state='A'):
+        user = EpicUser(username=username, role='GES', first_name='Gestion', last_name=username.capitalize(),
+                        password='securepassword', email=f'{username}@epic.com', state=state)
+        self.session.add(user)
+        self.session.commit()
+        return user
+
+    def add_contracts(self, gestion, count):
+        self.session.add_all([Contract(description=f"Contrat {i}", total_amount=100, customer_id=1,
+                                       gestion_id=gestion.epicuser_id) for i in range(count)])
+        self.session.commit()
+
+    def test_reassign_balances_contracts_by_load(self):
+        leaving = self.add_gestion('gleaving', state='I')
+        busy = self.add_gestion('gbusy')
+        idle = self.add_gestion('gidle')
+        self.add_gestion('ginactive', state='I')
+        self.add_contracts(leaving, 5)
+        self.add_contracts(busy, 3)
+
+        base = EpicUserBase(self.session)
+        preview = base.reassign(self.session, leaving, dry_run=True)
+        self.assertEqual([(s.username, s.load, s.added) for s in preview], [('gbusy', 3, 1), ('gidle', 0, 4)])
+        self.assertEqual(self.session.query(Contract).filter_by(gestion_id=leaving.epicuser_id).count(), 5)
+
+        base.reassign(self.session, leaving)
+        self.session.commit()
+        counts = [self.session.query(Contract).filter_by(gestion_id=user.epicuser_id).count()
+                  for user in (leaving, busy, idle)]
+        self.assertEqual(counts, [0, 4, 4])
+
+    def test_reassign_to_colleague(self):
+        leaving = self.add_gestion('gleaving', state='I')
+        colleague = self.add_gestion('gcolleague')
+        self.add_contracts(leaving, 2)
+
+        base = EpicUserBase(self.session)
+        with self.assertRaises(ValueError):
+            base.reassign(self.session, leaving, 'mcourte')
+        base.reassign(self.session, leaving, 'gcolleague')
+        self.session.commit()
+        self.assertEqual(self.session.query(Contract).filter_by(gestion_id=colleague.epicuser_id).count(), 2)
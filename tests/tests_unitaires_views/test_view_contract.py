@@ -10,29 +10,24 @@ parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
 sys.path.insert(0, parent_dir)
 
 
+from models.read_models import ContractRow
 from views.contract_view import ContractView
 from rich.console import Console
 
 
 class TestContractView(unittest.TestCase):
 
+    @patch('builtins.input')
     @patch.object(Console, 'print')
-    def test_display_list_contracts(self, mock_print):
-        # Mock data
-        mock_contract = MagicMock()
-        mock_contract.description = "Contract A"
-        mock_contract.customer.first_name = "John"
-        mock_contract.customer.last_name = "Doe"
-        mock_contract.remaining_amount = 100
-        mock_contract.total_amount = 1000
-        mock_contract.state.value = "Active"
-        mock_contract.customer.commercial.username = "jdoe"
-        mock_contract.gestion_id = "123"
-        mock_contract.events = []
-
-        ContractView.display_list_contracts([mock_contract])
-        # Check if print was called
-        mock_print.assert_called()
+    def test_display_list_contracts(self, mock_print, mock_input):
+        # Ligne de la liste des contrats
+        row = ContractRow(1, "Contract A", "John", "Doe", 1000, 100, "Signé", "jdoe", 123)
+
+        ContractView.display_list_contracts([row])
+        # La table est affichée, sans message d'erreur
+        table = mock_print.call_args_list[0].args[0]
+        self.assertEqual(table.row_count, 1)
+        self.assertEqual(mock_print.call_count, 2)
         # Additional assertions can be made based on how your data is formatted
 
     @patch.object(Console, 'print')
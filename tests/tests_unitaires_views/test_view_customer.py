@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import patch, MagicMock
+from models.read_models import CustomerRow
 from views.customer_view import CustomerView
 from datetime import datetime
 
@@ -44,13 +45,13 @@ class TestCustomerView(unittest.TestCase):
             'company_name': 'Company Inc.'
         })
 
+    @patch('builtins.input')
     @patch('rich.console.Console.print')
-    def test_display_list_customers(self, mock_print):
-        # Mock des clients
+    def test_display_list_customers(self, mock_print, mock_input):
+        # Lignes de la liste des clients
         mock_customers = [
-            MagicMock(first_name='John', last_name='Doe', company_name='Acme',
-                      phone='123456789', email='john.doe@example.com', commercial=None,
-                      creation_time=datetime(2023, 1, 1), update_time=datetime(2023, 2, 1))
+            CustomerRow(1, 'John', 'Doe', 'Acme', '123456789', 'john.doe@example.com', None,
+                        datetime(2023, 1, 1), datetime(2023, 2, 1))
         ]
 
         # Appel de la méthode
@@ -13,24 +13,18 @@ parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
 # Ajoutez le répertoire parent au PYTHONPATH
 sys.path.insert(0, parent_dir)
 
+from models.read_models import EventRow
 from views.event_view import EventView
 
 
 class TestEventView(unittest.TestCase):
 
+    @patch('builtins.input')
     @patch.object(Console, 'print')
     @patch('views.event_view.Table', autospec=True)
-    def test_display_list_events(self, mock_table, mock_print):
-        mock_event = MagicMock()
-        mock_event.event_id = 1
-        mock_event.title = 'Event Title'
-        mock_event.location = 'Event Location'
-        mock_event.attendees = 50
-        mock_event.date_started = datetime(2024, 1, 1)
-        mock_event.date_ended = datetime(2024, 1, 2)
-        mock_event.customer_id = 'Customer123'
-        mock_event.support_id = 'Support123'
-        all_events = [mock_event]
+    def test_display_list_events(self, mock_table, mock_print, mock_input):
+        all_events = [EventRow(1, 'Event Title', 'Event Location', 50,
+                               datetime(2024, 1, 1), datetime(2024, 1, 2), 123, 456)]
 
         # Appel de la méthode
         EventView.display_list_events(all_events)
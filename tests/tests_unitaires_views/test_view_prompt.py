@@ -12,11 +12,25 @@ parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
 # Ajoutez le répertoire parent au PYTHONPATH
 sys.path.insert(0, parent_dir)
 
+from prompt_toolkit.document import Document
 from views.prompt_view import PromptView
 
 
 class TestPromptView(unittest.TestCase):
 
+    @patch('views.prompt_view.questionary.autocomplete')
+    def test_prompt_search_returns_key(self, mock_autocomplete):
+        search = lambda text: [(7, '7 - Contrat Alpha'), (8, '8 - Contrat Beta')]
+
+        def answer():
+            # La saisie affiche les propositions, puis l'utilisateur en choisit une
+            completer = mock_autocomplete.call_args.kwargs['completer']
+            list(completer.get_completions(Document('Contrat'), None))
+            return '8 - Contrat Beta'
+        mock_autocomplete.return_value.ask.side_effect = answer
+
+        self.assertEqual(PromptView.prompt_search('Choix du contrat:', search), 8)
+
     @patch('views.prompt_view.questionary.select')
     def test_prompt_select_success(self, mock_select):
         # Configuration du mock pour simuler une sélection réussie
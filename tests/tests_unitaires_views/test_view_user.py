@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import patch, MagicMock
+from models.read_models import UserRow
 from views.user_view import UserView
 from enum import Enum
 
@@ -101,16 +102,11 @@ def test_prompt_role(mock_select):
 
 def test_display_list_users(mocker):
     mock_print = mocker.patch("rich.console.Console.print")
-    mock_user = MagicMock()
-    mock_user.first_name = "Jane"
-    mock_user.last_name = "Doe"
-    mock_user.epicuser_id = 1
-    mock_user.username = "jdoe"
-    mock_user.email = "jane.doe@example.com"
-    mock_user.role.value = "Admin"
-    mock_user.state.value = "Active"
-
-    UserView.display_list_users([mock_user])
+    mocker.patch("builtins.input")
+    mocker.patch("builtins.print")
+    user = UserRow(1, "Jane", "Doe", "jdoe", "jane.doe@example.com", "Admin", "Actif")
+
+    UserView.display_list_users([user])
 
     # Vérifiez que print a été appelé une fois
     mock_print.assert_called_once()
@@ -1,4 +1,6 @@
 import questionary
+from rich.table import Table
+from rich import box
 from .console_view import console
 import re
 
@@ -16,6 +18,68 @@ class AuthenticationView:
         text = "Vous êtes déconnecté"
         console.print(text)
 
+    @classmethod
+    def display_timings(cls, steps, total) -> None:
+        """
+        Affiche le détail du temps de démarrage par étape.
+
+        :param steps: Liste de tuples (libellé de l'étape, durée en millisecondes).
+        :type steps: list
+        :param total: Durée totale en millisecondes.
+        :type total: float
+        """
+        table = Table(title="Temps de démarrage", box=box.SQUARE, title_style="bold blue")
+        table.add_column("Étape", style="cyan", header_style="bold cyan")
+        table.add_column("Durée (ms)", justify="right", style="cyan", header_style="bold cyan")
+        for name, duration in steps:
+            table.add_row(name, f"{duration:.1f}")
+        table.add_row("Total", f"{total:.1f}", style="bold")
+        console.print(table)
+
+    @classmethod
+    def display_hash_benchmark(cls, results) -> None:
+        """
+        Affiche les résultats du banc d'essai de hachage Argon2.
+
+        :param results: Liste de dictionnaires retournés par `benchmark_password_hashing`.
+        :type results: list
+        """
+        table = Table(title="Banc d'essai Argon2", box=box.SQUARE, title_style="bold blue")
+        for column in ("time_cost", "memory_cost (KiB)", "parallelism", "Hachage (ms)",
+                       "Connexion (ms)", "Hachages/s"):
+            table.add_column(column, justify="right", style="cyan", header_style="bold cyan")
+        for result in results:
+            params = result['params']
+            table.add_row(
+                str(params['time_cost']),
+                str(params['memory_cost']),
+                str(params['parallelism']),
+                f"{result['hash_ms']:.1f}",
+                f"{result['login_ms']:.1f}",
+                f"{result['hashes_per_second']:.1f}")
+        console.print(table)
+
+    @classmethod
+    def display_import_report(cls, command, wall, modules) -> None:
+        """
+        Affiche les modules les plus coûteux à importer au démarrage d'une commande.
+
+        :param command: La commande mesurée.
+        :type command: str
+        :param wall: Durée totale du processus en millisecondes.
+        :type wall: float
+        :param modules: Liste de tuples (module, durée propre en ms, durée cumulée en ms).
+        :type modules: list
+        """
+        table = Table(title=f"Temps d'import : {command}", box=box.SQUARE, title_style="bold blue")
+        table.add_column("Module", style="cyan", header_style="bold cyan")
+        table.add_column("Propre (ms)", justify="right", style="cyan", header_style="bold cyan")
+        table.add_column("Cumulé (ms)", justify="right", style="cyan", header_style="bold cyan")
+        for name, self_ms, cumulative_ms in modules:
+            table.add_row(name, f"{self_ms:.1f}", f"{cumulative_ms:.1f}")
+        console.print(table)
+        console.print(f"Démarrage complet : {wall:.1f} ms", style="bold")
+
     @classmethod
     def display_welcome(cls, username) -> None:
         """
@@ -11,6 +11,13 @@ error_console = Console(
     style="bold red on black")
 
 
+def page_title(title, page=None):
+    """
+    Retourne le titre d'une liste, suivi du numéro de page s'il est fourni.
+    """
+    return title if page is None else f"{title} - page {page}"
+
+
 def long_task():
     with Progress() as progress:
         task = progress.add_task("Chargement...", total=100)
@@ -12,7 +12,7 @@ parent_dir = os.path.abspath(os.path.join(current_dir, '../../'))
 # Ajoutez le répertoire parent au PYTHONPATH
 sys.path.insert(0, parent_dir)
 
-from views.console_view import console
+from views.console_view import console, page_title
 from views.regexformat import regexformat
 
 
@@ -22,17 +22,19 @@ class ContractView:
     """
 
     @classmethod
-    def display_list_contracts(cls, all_contracts) -> None:
+    def display_list_contracts(cls, all_contracts, page=None) -> None:
         """
         Affiche la liste des contrats.
 
-        :param all_contracts: Liste des instances de contrat.
+        :param all_contracts: Liste des lignes de contrat (ContractRow).
         :type all_contracts: list
         :param pager: Indique si le pager est utilisé. Par défaut à False.
         :type pager: bool, optionnel
+        :param page: Numéro de la page affichée ; la navigation remplace alors l'attente de l'utilisateur.
+        :type page: int, optionnel
         """
         table = Table(
-            title="Liste des Contrats",
+            title=page_title("Liste des Contrats", page),
             box=box.SQUARE,
             title_justify="center",
             title_style="bold blue"
@@ -47,9 +49,9 @@ class ContractView:
 
         for c in all_contracts:
             try:
-                client_name = f"{c.customer.first_name} {c.customer.last_name}".strip()
+                client_name = f"{c.customer_first_name or ''} {c.customer_last_name or ''}".strip()
                 remaining_amount = str(c.remaining_amount) if c.remaining_amount is not None else "0"
-                commercial_username = str(c.customer.commercial.username) if c.customer and c.customer.commercial else ""
+                commercial_username = c.commercial_username or ""
                 gestion_id = str(c.gestion_id) if c.gestion_id is not None else ""
 
                 table.add_row(
@@ -57,7 +59,7 @@ class ContractView:
                     client_name,
                     str(c.total_amount),
                     remaining_amount,
-                    c.state.value,
+                    c.state,
                     commercial_username,
                     gestion_id
                 )
@@ -70,10 +72,11 @@ class ContractView:
 
         console.print(table)
 
-        # Après l'affichage de la liste, demander à l'utilisateur de continuer
-        text = "\nAppuyez sur Entrée pour continuer..."
-        console.print(text)
-        input()
+        if page is None:
+            # Après l'affichage de la liste, demander à l'utilisateur de continuer
+            text = "\nAppuyez sur Entrée pour continuer..."
+            console.print(text)
+            input()
 
     @classmethod
     def display_contract_info(cls, contract) -> None:
@@ -13,7 +13,7 @@ parent_dir = os.path.abspath(os.path.join(current_dir, '../../'))
 # Ajoutez le répertoire parent au PYTHONPATH
 sys.path.insert(0, parent_dir)
 
-from views.console_view import console
+from views.console_view import console, page_title
 from views.prompt_view import PromptView
 from views.regexformat import regexformat
 
@@ -36,6 +36,17 @@ class CustomerView:
         """
         return PromptView.prompt_select("Choix du client:", all_customers, **kwargs)
 
+    @classmethod
+    def prompt_find_customer(cls, search) -> int:
+        """
+        Demande à l'utilisateur de choisir un client en tapant son nom ou son entreprise.
+
+        :param search: Fonction de recherche des clients (voir `controllers.typeahead`).
+        :return: L'identifiant du client choisi.
+        :rtype: int
+        """
+        return PromptView.prompt_search("Choix du client (nom, entreprise ou numéro):", search)
+
     @classmethod
     def prompt_data_customer(cls, full_name_required=True) -> dict:
         """
@@ -81,19 +92,21 @@ class CustomerView:
                 'company_name': company_name}
 
     @classmethod
-    def display_list_customers(cls, all_customers, pager=False) -> None:
+    def display_list_customers(cls, all_customers, pager=False, page=None) -> None:
         """
         Affiche la liste des clients.
 
-        :param all_customers: Liste des instances de client.
+        :param all_customers: Liste des lignes de client (CustomerRow).
         :type all_customers: list
         :param pager: Indique si le pager est utilisé. Par défaut à False.
         :type pager: bool, optionnel
+        :param page: Numéro de la page affichée ; la navigation remplace alors l'attente de l'utilisateur.
+        :type page: int, optionnel
         """
         fmt_date = '%d/%m/%Y'
 
         table = Table(
-            title="Liste des Clients",
+            title=page_title("Liste des Clients", page),
             box=box.SQUARE,
             title_justify="center",
             title_style="bold blue"
@@ -110,7 +123,7 @@ class CustomerView:
             update_time = f"{c.update_time.strftime(fmt_date)}"
             table.add_row(
                 f"{c.first_name} {c.last_name}", c.company_name, c.phone, c.email,
-                str(c.commercial.username) if c.commercial else 'Aucun commercial',
+                c.commercial_username or 'Aucun commercial',
                 creation_time, update_time
             )
 
@@ -120,9 +133,10 @@ class CustomerView:
         else:
             console.print(table)
 
-        # Après l'affichage de la liste, demander à l'utilisateur de continuer
-        console.print("\nAppuyez sur Entrée pour continuer...")
-        input()
+        if page is None:
+            # Après l'affichage de la liste, demander à l'utilisateur de continuer
+            console.print("\nAppuyez sur Entrée pour continuer...")
+            input()
 
     @classmethod
     def prompt_customers(cls, all_customers) -> str:
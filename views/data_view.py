@@ -1,6 +1,8 @@
 import os
 import sys
+import questionary
 from rich.panel import Panel
+from rich.table import Table
 from rich import box
 from rich.align import Align
 # Déterminez le chemin absolu du répertoire parent
@@ -10,6 +12,7 @@ parent_dir = os.path.abspath(os.path.join(current_dir, '../'))
 # Ajoutez le répertoire parent au PYTHONPATH
 sys.path.insert(0, parent_dir)
 from views.console_view import console
+from views.prompt_view import PromptView
 
 
 class DataView:
@@ -24,6 +27,103 @@ class DataView:
         """
         console.print('Aucun contrat trouvé')
 
+    @classmethod
+    def prompt_page_navigation(cls, has_previous, has_next):
+        """
+        Demande à l'utilisateur la page suivante, la page précédente ou le retour au menu.
+
+        Paramètres :
+        ------------
+        has_previous (bool) : Indique s'il existe une page précédente.
+        has_next (bool) : Indique s'il existe une page suivante.
+
+        Retourne :
+        -----------
+        str : 'next', 'previous' ou 'quit'.
+        """
+        choices = {}
+        if has_next:
+            choices['Page suivante'] = 'next'
+        if has_previous:
+            choices['Page précédente'] = 'previous'
+        choices['Retour au menu'] = 'quit'
+        try:
+            return choices[PromptView.prompt_select('Navigation :', list(choices))]
+        except KeyboardInterrupt:
+            return 'quit'
+
+    @classmethod
+    def prompt_search_text(cls):
+        """
+        Demande le texte de la recherche globale.
+
+        Retourne :
+        -----------
+        str : Le texte saisi.
+
+        Lève :
+        -------
+        KeyboardInterrupt : Si l'utilisateur interrompt la saisie.
+        """
+        result = questionary.text(
+            "Rechercher (nom, entreprise, email, téléphone, contrat, évènement) :",
+            validate=lambda text: bool(text.strip()) or "Saisissez un texte à rechercher").ask()
+        if result is None:
+            raise KeyboardInterrupt
+        return result
+
+    @classmethod
+    def display_search_results(cls, text, hits):
+        """
+        Affiche les résultats de la recherche globale.
+
+        Paramètres :
+        ------------
+        text (str) : Le texte recherché.
+        hits (list) : Les résultats (SearchHit), les plus pertinents en premier.
+        """
+        if not hits:
+            console.print(f"Aucun résultat pour « {text} »", style="red")
+            return
+        table = Table(
+            title=f"Résultats pour « {text} »",
+            box=box.SQUARE,
+            title_justify="center",
+            title_style="bold blue"
+        )
+        table.add_column("Type", justify="center", style="cyan", header_style="bold cyan")
+        table.add_column("Numéro", justify="center", style="cyan", header_style="bold cyan")
+        table.add_column("Nom", justify="center", style="cyan", header_style="bold cyan")
+        table.add_column("Détail", justify="center", style="cyan", header_style="bold cyan")
+        for hit in hits:
+            table.add_row(hit.kind, str(hit.key), hit.label, hit.detail)
+        console.print(table)
+
+    @classmethod
+    def display_import_report(cls, entity, report):
+        """
+        Affiche le rapport d'un import en masse.
+
+        Paramètres :
+        ------------
+        entity (str) : L'entité importée ('customers', 'contracts' ou 'events').
+        report (dict) : Le rapport (clés 'read', 'imported', 'rejected', 'errors_path' et 'seconds').
+        """
+        rate = report['read'] / report['seconds'] if report['seconds'] else 0
+        text = f"Lignes lues : {report['read']}\n"
+        text += f"Lignes importées : {report['imported']}\n"
+        text += f"Lignes rejetées : {report['rejected']}\n"
+        text += f"Durée : {report['seconds']:.2f} s ({rate:.0f} lignes/s)"
+        if report['rejected']:
+            text += f"\nErreurs : {report['errors_path']}"
+        p = Panel(
+            Align.left(text, vertical='top'),
+            box=box.ROUNDED,
+            style='green' if not report['rejected'] else 'red',
+            title_align='left',
+            title=f'Import {entity}')
+        console.print(p)
+
     @classmethod
     def display_interupt(cls):
         """
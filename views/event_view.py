@@ -15,7 +15,8 @@ parent_dir = os.path.abspath(os.path.join(current_dir, '../../'))
 # Ajoutez le répertoire parent au PYTHONPATH
 sys.path.insert(0, parent_dir)
 
-from views.console_view import console
+from views.console_view import console, page_title
+from views.prompt_view import PromptView
 from views.regexformat import regexformat
 from controllers.contract_controller import Contract
 
@@ -26,17 +27,18 @@ class EventView:
     """
 
     @classmethod
-    def display_list_events(cls, all_events, pager=False) -> None:
+    def display_list_events(cls, all_events, pager=False, page=None) -> None:
         """
         Affiche la liste des évènements.
 
         Paramètres :
         ------------
-        all_events (list) : Liste d'instances d'évènements à afficher.
+        all_events (list) : Liste des lignes d'évènements (EventRow) à afficher.
         pager (bool, optionnel) : Indique si la pagination est utilisée. Par défaut à False.
+        page (int, optionnel) : Numéro de la page affichée ; la navigation remplace alors l'attente de l'utilisateur.
         """
         table = Table(
-            title="Liste des Evènements",
+            title=page_title("Liste des Evènements", page),
             box=box.SQUARE,
             title_justify="center",
             title_style="bold blue"
@@ -51,7 +53,7 @@ class EventView:
         table.add_column("Support", justify="center", style="cyan", header_style="bold cyan")
 
         for e in all_events:
-            if e.support:
+            if e.support_id:
                 str_support = str(e.support_id)
             else:
                 str_support = ''
@@ -73,9 +75,10 @@ class EventView:
                 console.print(table)
         else:
             console.print(table)
-        # Après l'affichage de la liste, demander à l'utilisateur de continuer
-        console.print("\nAppuyez sur Entrée pour continuer...")
-        input()
+        if page is None:
+            # Après l'affichage de la liste, demander à l'utilisateur de continuer
+            console.print("\nAppuyez sur Entrée pour continuer...")
+            input()
 
     @classmethod
     def prompt_data_event(cls, **kwargs):
@@ -194,6 +197,36 @@ class EventView:
                     return contract
         return None
 
+    @classmethod
+    def prompt_find_contract(cls, search) -> int:
+        """
+        Demande à l'utilisateur de choisir un contrat en tapant sa description ou son numéro.
+
+        Paramètres :
+        ------------
+        search (callable) : Fonction de recherche des contrats (voir `controllers.typeahead`).
+
+        Retourne :
+        -----------
+        int : L'identifiant du contrat choisi.
+        """
+        return PromptView.prompt_search("Choix du contrat (description ou numéro):", search)
+
+    @classmethod
+    def prompt_find_event(cls, search) -> int:
+        """
+        Demande à l'utilisateur de choisir un évènement en tapant son titre ou son numéro.
+
+        Paramètres :
+        ------------
+        search (callable) : Fonction de recherche des évènements (voir `controllers.typeahead`).
+
+        Retourne :
+        -----------
+        int : L'identifiant de l'évènement choisi.
+        """
+        return PromptView.prompt_search("Choix de l'évènement (titre ou numéro):", search)
+
     @classmethod
     def prompt_select_statut(cls) -> str:
         """
@@ -160,7 +160,8 @@ class MenuView:
         Returns:
             Panel: Menu d'accueil formaté.
         """
-        menu_text = "    01-Voir mes données\n"
+        menu_text = "    00-Rechercher un client, un contrat ou un évènement\n"
+        menu_text += "    01-Voir mes données\n"
         menu_text += "    02-Mettre à jour mes données\n"
         menu_text += "    03-Liste des clients\n"
         menu_text += "    04-Liste des contrats\n"
@@ -1,4 +1,29 @@
 import questionary
+from prompt_toolkit.completion import Completer, Completion
+
+
+class SearchCompleter(Completer):
+    """
+    Complétion alimentée par une fonction de recherche, appelée à chaque saisie.
+
+    Les propositions affichées sont mémorisées avec leur clé, pour retrouver
+    la clé du libellé choisi sans parcourir de liste.
+    """
+
+    def __init__(self, search):
+        """
+        Paramètres :
+        ------------
+        search (callable) : Fonction retournant les couples (clé, libellé) d'une saisie.
+        """
+        self.search = search
+        self.keys = {}
+
+    def get_completions(self, document, complete_event):
+        text = document.text_before_cursor
+        for key, label in self.search(text):
+            self.keys[label] = key
+            yield Completion(label, start_position=-len(text))
 
 
 class PromptView:
@@ -31,3 +56,33 @@ class PromptView:
         if result is None:
             raise KeyboardInterrupt
         return result
+
+    @classmethod
+    def prompt_search(cls, text, search):
+        """
+        Demande à l'utilisateur de choisir un élément en tapant le début de son nom.
+
+        Les propositions sont recherchées au fil de la saisie par la fonction `search`
+        (requête limitée en base) ; seule une proposition de la liste est acceptée.
+
+        Paramètres :
+        ------------
+        text (str) : Question ou texte affiché pour l'utilisateur.
+        search (callable) : Fonction retournant les couples (clé, libellé) d'une saisie.
+
+        Retourne :
+        -----------
+        La clé de l'élément choisi.
+
+        Lève :
+        -------
+        KeyboardInterrupt : Si l'utilisateur interrompt la sélection.
+        """
+        completer = SearchCompleter(search)
+        result = questionary.autocomplete(
+            text, choices=[], completer=completer,
+            validate=lambda value: value in completer.keys or "Choisissez une proposition de la liste",
+        ).ask()
+        if result is None:
+            raise KeyboardInterrupt
+        return completer.keys[result]
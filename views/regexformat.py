@@ -1,10 +1,15 @@
+import re
+
 regex_email = "^[_A-Za-z0-9-\\+]+(\\.[_A-Za-z0-9-]+)*"
 regex_email += "@[A-Za-z0-9-]+(\\.[A-Za-z0-9]+)*(\\.[A-Za-z]{2,})$"
 
-regex_phone = "^(?:(?:\+|00)33|0)\s*[1-9](?:[\s.-]*\d{2}){4}$"
+regex_phone = r"^(?:(?:\+|00)33|0)\s*[1-9](?:[\s.-]*\d{2}){4}$"
 
 regex_password = r".*"
 
+# Lettres, accentuées comprises (équivalent de \p{L} pour le module re)
+letter = r"[^\W\d_]"
+
 
 regexformat = {
     '3cn': (
@@ -13,6 +18,9 @@ regexformat = {
     'alphanum': (
         r"^[a-zA-Z0-9 ]+$",
         "Seul des caractères alpha sont autorisés"),
+    'num': (
+        r"^[0-9]+$",
+        "Seuls des chiffres sont autorisés"),
     'numposmax': (
         r"(?<!-)\b([1-3]?\d{1,5}|100000)\b",
         "Le montant doit être positif et inférieur à 100 000"
@@ -29,19 +37,22 @@ regexformat = {
         r"^[a-zA-Z ']+$",
         "Seul des caractères alpha sont autorisés"
     ),
-    'all_nospace' : (
-        r"^[\p{L}-]+$"
+    'all_nospace': (
+        rf"^(?:{letter}|-)+$",
         "Seules les lettres et '-' sont autorisées"
     ),
-    'all_letters' : (
-        r"^[\p{L} ]+$"
+    'all_letters': (
+        rf"^(?:{letter}| )+$",
         "Seules les lettres sont autorisées"
     ),
-    'all_space_union' : (
-        r"^[\p{L} \-]+$"
+    'all_space_union': (
+        rf"^(?:{letter}|[ \-])+$",
         "Seules les lettres et '-' sont autorisées"
     ),
     'email': (regex_email, "Le format de l'email est invalide"),
     'phone': (regex_phone, "Ce n'est pas un numéro de téléphone valide"),
     'password': (regex_password, "Le format du mot de passe est invalide")
-}
\ No newline at end of file
+}
+
+# Motifs compilés une seule fois, pour les validations répétées (imports en masse)
+patterns = {name: re.compile(pattern) for name, (pattern, _) in regexformat.items()}
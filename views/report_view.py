@@ -0,0 +1,73 @@
+from rich.table import Table
+from rich import box
+import os
+import sys
+
+# Déterminez le chemin absolu du répertoire parent
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.abspath(os.path.join(current_dir, '../../'))
+
+# Ajoutez le répertoire parent au PYTHONPATH
+sys.path.insert(0, parent_dir)
+
+from views.console_view import console
+
+# Titre et libellé du groupe de chaque rapport
+TITLES = {
+    'commercial': ("Chiffre d'affaires par commercial", "Commercial"),
+    'customer': ("Chiffre d'affaires par client", "Client"),
+    'month': ("Encaissements par mois", "Mois"),
+}
+
+
+def amount(value) -> str:
+    """
+    Formate un montant (décimal exact) : séparateur de milliers, deux décimales.
+    """
+    return '' if value is None else f"{value:,.2f}".replace(',', ' ')
+
+
+class ReportView:
+    """
+    Classe pour afficher les rapports financiers.
+    """
+
+    @classmethod
+    def display_report(cls, name, rows) -> None:
+        """
+        Affiche un rapport financier, la dernière ligne étant le total.
+
+        Paramètres :
+        ------------
+        name (str) : Le rapport : 'commercial', 'customer' ou 'month'.
+        rows (list) : Les lignes du rapport (ReportRow).
+
+        Retourne :
+        -----------
+        None
+        """
+        title, group = TITLES[name]
+        table = Table(
+            title=title,
+            box=box.SQUARE,
+            title_justify="center",
+            title_style="bold blue"
+        )
+        table.add_column(group, justify="left", style="cyan", header_style="bold cyan")
+        if name == 'month':
+            table.add_column("Paiements", justify="right", style="cyan", header_style="bold cyan")
+            table.add_column("Encaissé", justify="right", style="cyan", header_style="bold cyan")
+        else:
+            table.add_column("Contrats", justify="right", style="cyan", header_style="bold cyan")
+            table.add_column("Signé", justify="right", style="cyan", header_style="bold cyan")
+            table.add_column("Encaissé", justify="right", style="cyan", header_style="bold cyan")
+            table.add_column("Restant dû", justify="right", style="cyan", header_style="bold cyan")
+
+        for row in rows:
+            label = "Total" if row.total else (row.label or "Non attribué")
+            values = [amount(row.collected)] if name == 'month' else \
+                [amount(row.signed), amount(row.collected), amount(row.outstanding)]
+            table.add_row(label, str(row.count), *values, style="bold" if row.total else None,
+                          end_section=row.total)
+
+        console.print(table)
@@ -0,0 +1,124 @@
+import csv
+import gzip
+import io
+import json
+import sys
+from contextlib import contextmanager
+from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
+
+from views.console_view import console
+
+# Formats de sortie des commandes non interactives
+FORMATS = ('jsonl', 'csv')
+
+# Nombre de lignes écrites entre deux mises à jour de la progression
+PROGRESS_EVERY = 1000
+
+
+def json_value(value):
+    """
+    Convertit une valeur non sérialisable en JSON (dates) en texte.
+    """
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+
+@contextmanager
+def open_output(path=None, compress=False):
+    """
+    Ouvre la sortie d'un export : un fichier, ou la sortie standard si `path` est None.
+
+    Paramètres :
+    ------------
+    path (str) : Le fichier de sortie ; compressé en gzip s'il se termine par '.gz'.
+    compress (bool) : Si True, la sortie est compressée en gzip.
+
+    Retourne :
+    -----------
+    file : La sortie texte, fermée (et la compression terminée) à la sortie du bloc.
+    """
+    compress = compress or (path or '').endswith('.gz')
+    if path is None:
+        if not compress:
+            yield sys.stdout
+            return
+        with gzip.GzipFile(fileobj=sys.stdout.buffer, mode='wb') as raw, \
+                io.TextIOWrapper(raw, encoding='utf-8', newline='') as stream:
+            yield stream
+        sys.stdout.buffer.flush()
+    elif compress:
+        with gzip.open(path, 'wt', encoding='utf-8', newline='') as stream:
+            yield stream
+    else:
+        with open(path, 'w', encoding='utf-8', newline='') as stream:
+            yield stream
+
+
+class ScriptView:
+    """
+    Classe pour gérer la sortie des commandes non interactives.
+
+    Les données sont écrites sur la sortie standard, une ligne par élément, au fur et
+    à mesure de leur lecture ; les messages restent sur la sortie d'erreur.
+    """
+
+    @classmethod
+    def write_rows(cls, rows, fields, output_format='jsonl', stream=None, progress=None) -> int:
+        """
+        Ecrit des lignes en JSON Lines ou en CSV.
+
+        Paramètres :
+        ------------
+        rows (iterable) : Les lignes (modèles de lecture).
+        fields (tuple) : Les noms des colonnes (en-tête CSV).
+        output_format (str) : 'jsonl' ou 'csv'.
+        stream (file) : La sortie (par défaut : la sortie standard).
+        progress (callable) : Appelée avec le nombre de lignes écrites, toutes les PROGRESS_EVERY lignes.
+
+        Retourne :
+        -----------
+        int : Le nombre de lignes écrites.
+        """
+        stream = stream or sys.stdout
+        count = 0
+        if output_format == 'csv':
+            writer = csv.writer(stream)
+            writer.writerow(fields)
+            write = writer.writerow
+        else:
+            def write(row):
+                stream.write(json.dumps(dict(zip(fields, row)), default=json_value, ensure_ascii=False) + '\n')
+        for row in rows:
+            write(row)
+            count += 1
+            if progress and not count % PROGRESS_EVERY:
+                progress(count)
+        if progress:
+            progress(count)
+        stream.flush()
+        return count
+
+    @classmethod
+    @contextmanager
+    def export_progress(cls, name):
+        """
+        Affiche la progression d'un export (nombre de lignes écrites, durée).
+
+        Retourne :
+        -----------
+        callable : La fonction de mise à jour, appelée avec le nombre de lignes écrites.
+        """
+        with Progress(TextColumn("Export {task.description}"), BarColumn(),
+                      TextColumn("{task.completed} lignes"), TimeElapsedColumn(),
+                      console=console) as bar:
+            task = bar.add_task(name, total=None)
+            yield lambda count: bar.update(task, completed=count)
+
+    @classmethod
+    def display_export_report(cls, name, report):
+        """
+        Affiche le compte rendu d'un export.
+        """
+        speed = report['rows'] / report['seconds'] if report['seconds'] else 0
+        target = report['path'] or 'sortie standard'
+        console.print(f"Export {name} : {report['rows']} lignes vers {target} "
+                      f"en {report['seconds']:.1f} s ({speed:.0f} lignes/s)", style="bold green")
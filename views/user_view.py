@@ -12,7 +12,8 @@ parent_dir = os.path.abspath(os.path.join(current_dir, '../../'))
 # Ajoutez le répertoire parent au PYTHONPATH
 sys.path.insert(0, parent_dir)
 
-from views.console_view import console
+from views.console_view import console, page_title
+from views.prompt_view import PromptView
 from views.regexformat import regexformat
 
 
@@ -21,6 +22,9 @@ class UserView:
     Classe pour gérer l'affichage et les interactions concernant les utilisateurs.
     """
 
+    # Choix "répartir selon la charge" de la réaffectation d'un portefeuille
+    BALANCE = '*'
+
     @classmethod
     def prompt_commercial(cls, all_commercials) -> str:
         """
@@ -39,6 +43,22 @@ class UserView:
             choices=all_commercials,
         ).ask()
 
+    @classmethod
+    def prompt_find_user(cls, search, title="Choix de l'employé") -> int:
+        """
+        Demande à l'utilisateur de choisir un employé en tapant son identifiant ou son nom.
+
+        Paramètres :
+        ------------
+        search (callable) : Fonction de recherche des employés (voir `controllers.typeahead`).
+        title (str) : Question affichée, par exemple "Choix du gestionnaire".
+
+        Retourne :
+        -----------
+        int : L'identifiant (epicuser_id) de l'employé choisi.
+        """
+        return PromptView.prompt_search(f"{title} (identifiant ou nom):", search)
+
     @classmethod
     def prompt_user(cls, all_users) -> str:
         """
@@ -220,21 +240,22 @@ class UserView:
         return {'role': data_role}
 
     @classmethod
-    def display_list_users(cls, all_users, pager=False) -> None:
+    def display_list_users(cls, all_users, pager=False, page=None) -> None:
         """
         Affiche une liste des employés.
 
         Paramètres :
         ------------
-        all_users (list) : Liste des instances d'employés.
+        all_users (list) : Liste des lignes d'employés (UserRow).
         pager (bool, optional) : Si la pagination est nécessaire. Defaults to True.
+        page (int, optional) : Numéro de la page affichée ; la navigation remplace alors l'attente de l'utilisateur.
 
         Retourne :
         -----------
         None
         """
         table = Table(
-            title="Liste des employés d'EpicEvent",
+            title=page_title("Liste des employés d'EpicEvent", page),
             box=box.SQUARE,
             title_justify="center",
             title_style="bold blue"
@@ -250,7 +271,7 @@ class UserView:
         for e in all_users:
             table.add_row(
                 e.last_name, e.first_name,
-                str(e.epicuser_id), e.username, e.email, e.role.value, e.state.value
+                str(e.epicuser_id), e.username, e.email, e.role, e.state
             )
 
         if pager:
@@ -258,9 +279,10 @@ class UserView:
                 console.print(table)
         else:
             console.print(table)
-        # Après l'affichage de la liste, demander à l'utilisateur de continuer
-        print("\nAppuyez sur Entrée pour continuer...")
-        input()
+        if page is None:
+            # Après l'affichage de la liste, demander à l'utilisateur de continuer
+            print("\nAppuyez sur Entrée pour continuer...")
+            input()
 
     @classmethod
     def prompt_update_user(cls, user):
@@ -356,3 +378,94 @@ class UserView:
         """
         return questionary.confirm(
             " Etes-vous sûr de vouloir supprimer l'utilsateur ? Cette action ne peut être annulée ?", **kwargs).ask()
+
+    @classmethod
+    def display_provisioning_report(cls, report) -> None:
+        """
+        Affiche le rapport de création en masse des employés.
+
+        Paramètres :
+        ------------
+        report (list) : Liste des entrées du rapport (clés 'line', 'username', 'status', 'message').
+
+        Retourne :
+        -----------
+        None
+        """
+        table = Table(
+            title="Création des employés",
+            box=box.SQUARE,
+            title_justify="center",
+            title_style="bold blue"
+        )
+        table.add_column("Ligne", justify="center", style="cyan", header_style="bold cyan")
+        table.add_column("Identifiant", justify="center", style="cyan", header_style="bold cyan")
+        table.add_column("Statut", justify="center", style="cyan", header_style="bold cyan")
+        table.add_column("Message", justify="left", style="cyan", header_style="bold cyan")
+
+        for entry in report:
+            style = "green" if entry['status'] == 'created' else "bold red"
+            table.add_row(str(entry['line']), entry['username'], entry['status'], entry['message'], style=style)
+
+        console.print(table)
+        created = sum(1 for entry in report if entry['status'] == 'created')
+        text = f"{created} employé(s) créé(s), {len(report) - created} erreur(s)"
+        console.print(text, style="bold green" if created == len(report) else "bold red")
+
+    @classmethod
+    def prompt_reassignment(cls, loads) -> str:
+        """
+        Demande à qui réaffecter un portefeuille : un collègue, ou tous selon leur charge.
+
+        Paramètres :
+        ------------
+        loads (list) : Les triplets (epicuser_id, username, nombre d'éléments) des collègues actifs.
+
+        Retourne :
+        -----------
+        str : Le nom d'utilisateur choisi, BALANCE pour répartir selon la charge, ou None si abandon.
+        """
+        choices = [questionary.Choice("Répartir selon la charge de chacun", value=cls.BALANCE)]
+        choices += [questionary.Choice(f"{username} ({load})", value=username) for _, username, load in loads]
+        return questionary.select("Réaffecter le portefeuille à :", choices=choices).ask()
+
+    @classmethod
+    def prompt_confirm_reassignment(cls, **kwargs) -> bool:
+        """
+        Demande la confirmation de la réaffectation affichée.
+        """
+        return questionary.confirm("Appliquer cette réaffectation ?", **kwargs).ask()
+
+    @classmethod
+    def display_reassignment_plan(cls, username, label, plan) -> None:
+        """
+        Affiche la répartition d'un portefeuille réaffecté (aperçu avant application).
+
+        Paramètres :
+        ------------
+        username (str) : L'employé dont le portefeuille est réaffecté.
+        label (str) : Le type d'éléments ('clients', 'contrats' ou 'évènements').
+        plan (list) : Les parts (PortfolioShare).
+
+        Retourne :
+        -----------
+        None
+        """
+        table = Table(
+            title=f"Réaffectation des {label} de {username}",
+            box=box.SQUARE,
+            title_justify="center",
+            title_style="bold blue"
+        )
+        table.add_column("Employé", justify="left", style="cyan", header_style="bold cyan")
+        table.add_column("Actuel", justify="right", style="cyan", header_style="bold cyan")
+        table.add_column("Reçus", justify="right", style="cyan", header_style="bold cyan")
+        table.add_column("Après", justify="right", style="cyan", header_style="bold cyan")
+
+        for share in plan:
+            style = "green" if share.added else None
+            table.add_row(share.username, str(share.load), str(share.added), str(share.load + share.added),
+                          style=style)
+
+        console.print(table)
+        console.print(f"{sum(share.added for share in plan)} {label} à réaffecter", style="bold")